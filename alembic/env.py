@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 import os
 
 # Import absoluto para evitar problemas con rutas relativas
-from app.core.database import Base, engine
+from app.core.database import Base, get_engine
 from app.models.arrendatario_model import ArrendatarioModel
 from app.models.pago_model import PagoModel
 
@@ -41,7 +41,7 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """Ejecutar migraciones en modo 'online'."""
-    connectable = engine
+    connectable = get_engine()
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
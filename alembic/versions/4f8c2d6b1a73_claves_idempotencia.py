@@ -0,0 +1,36 @@
+"""Claves de idempotencia para los registros de pagos y arrendatarios
+
+Revision ID: 4f8c2d6b1a73
+Revises: e91b4d2a7c05
+Create Date: 2026-10-17 23:02:41.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8c2d6b1a73'
+down_revision: Union[str, None] = 'e91b4d2a7c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('claves_idempotencia',
+    sa.Column('ruta', sa.String(length=20), nullable=False),
+    sa.Column('clave', sa.String(length=255), nullable=False),
+    sa.Column('huella', sa.String(length=64), nullable=False),
+    sa.Column('respuesta', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('expira_en', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('ruta', 'clave')
+    )
+    op.create_index('ix_claves_idempotencia_expira_en', 'claves_idempotencia', ['expira_en'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_claves_idempotencia_expira_en', table_name='claves_idempotencia')
+    op.drop_table('claves_idempotencia')
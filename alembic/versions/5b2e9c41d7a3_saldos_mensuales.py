@@ -0,0 +1,44 @@
+"""Saldos mensuales por inmueble
+
+Revision ID: 5b2e9c41d7a3
+Revises: 34fdb4ea0495
+Create Date: 2026-10-17 10:12:03.418275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e9c41d7a3'
+down_revision: Union[str, None] = '34fdb4ea0495'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('saldos_mensuales',
+    sa.Column('codigo_inmueble', sa.String(), nullable=False),
+    sa.Column('anio', sa.Integer(), nullable=False),
+    sa.Column('mes', sa.Integer(), nullable=False),
+    sa.Column('total_pagado', sa.Numeric(), nullable=False),
+    sa.Column('cantidad_pagos', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('codigo_inmueble', 'anio', 'mes')
+    )
+    # Cargar los acumulados de los pagos existentes
+    op.execute("""
+        INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+        SELECT codigo_inmueble,
+               EXTRACT(YEAR FROM fecha_pago)::int,
+               EXTRACT(MONTH FROM fecha_pago)::int,
+               SUM(valor_pagado),
+               COUNT(*)
+        FROM pagos
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('saldos_mensuales')
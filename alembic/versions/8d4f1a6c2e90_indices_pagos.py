@@ -0,0 +1,45 @@
+"""Indices de pagos para las consultas del repositorio
+
+Revision ID: 8d4f1a6c2e90
+Revises: 5b2e9c41d7a3
+Create Date: 2026-10-17 11:40:52.906113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4f1a6c2e90'
+down_revision: Union[str, None] = '5b2e9c41d7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY no bloquea las escrituras en pagos, pero no puede correr
+    # dentro de la transacción de la migración
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_pagos_codigo_inmueble_fecha_pago', 'pagos',
+            ['codigo_inmueble', 'fecha_pago'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_pagos_documento_arrendatario_id', 'pagos',
+            ['documento_identificacion_arrendatario', 'id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_pagos_documento_arrendatario_id', table_name='pagos',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_pagos_codigo_inmueble_fecha_pago', table_name='pagos',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,135 @@
+"""Tabla de pagos particionada por mes (paso 1: crear y replicar)
+
+Revision ID: a7d3e8f25c61
+Revises: 4f8c2d6b1a73
+Create Date: 2026-10-17 23:20:12.604118
+
+Crea `pagos_particionada`, particionada por rango mensual de `fecha_pago`, con las
+particiones del mes actual y los siguientes, y un trigger en `pagos` que replica en
+ella cada escritura. No copia filas ni bloquea `pagos` más que al crear el trigger:
+las filas existentes se copian por lotes con `python -m app.cli.particionar_pagos`, y
+la revisión siguiente intercambia las tablas.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e8f25c61'
+down_revision: Union[str, None] = '4f8c2d6b1a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTICIONES_FUTURAS = 3
+
+
+def upgrade() -> None:
+    # Crea las particiones mensuales que falten desde el mes de `desde`, sobre la tabla
+    # particionada vigente (`pagos_particionada` durante la migración, `pagos` después).
+    # Cada partición se crea aparte y se adjunta, lo que bloquea la tabla padre solo en
+    # modo SHARE UPDATE EXCLUSIVE; las filas del mes que hayan caído en la partición por
+    # defecto se mueven antes a la nueva partición.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION crear_particiones_pagos(desde date, meses int)
+        RETURNS int AS $$
+        DECLARE
+            tabla text;
+            inicio date := date_trunc('month', desde)::date;
+            fin date;
+            particion text;
+            creadas int := 0;
+        BEGIN
+            SELECT c.relname INTO tabla
+            FROM pg_class c
+            WHERE c.relname IN ('pagos_particionada', 'pagos') AND c.relkind = 'p'
+              AND c.relnamespace = 'public'::regnamespace;
+            IF tabla IS NULL THEN
+                RETURN 0;
+            END IF;
+            -- Sin este bloqueo un pago concurrente del mes podría quedar en la partición
+            -- por defecto entre mover sus filas y el ATTACH, que entonces fallaría
+            LOCK TABLE pagos_pdefault IN SHARE ROW EXCLUSIVE MODE;
+            FOR i IN 1 .. meses LOOP
+                fin := (inicio + interval '1 month')::date;
+                particion := 'pagos_p' || to_char(inicio, 'YYYYMM');
+                IF to_regclass(particion) IS NULL THEN
+                    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', particion, tabla);
+                    EXECUTE format(
+                        'WITH movidas AS (DELETE FROM pagos_pdefault WHERE fecha_pago >= %L AND fecha_pago < %L RETURNING *) '
+                        'INSERT INTO %I SELECT * FROM movidas', inicio, fin, particion
+                    );
+                    EXECUTE format(
+                        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        tabla, particion, inicio, fin
+                    );
+                    creadas := creadas + 1;
+                END IF;
+                inicio := fin;
+            END LOOP;
+            RETURN creadas;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # La clave primaria debe incluir la columna de partición; los índices definidos en
+    # la tabla padre se crean en cada partición
+    op.execute("""
+        CREATE TABLE pagos_particionada (
+            id integer NOT NULL DEFAULT nextval('pagos_id_seq'),
+            documento_identificacion_arrendatario varchar NOT NULL,
+            codigo_inmueble varchar NOT NULL,
+            valor_pagado numeric NOT NULL,
+            fecha_pago date NOT NULL,
+            CONSTRAINT pagos_particionada_pkey PRIMARY KEY (id, fecha_pago),
+            CONSTRAINT pagos_documento_identificacion_arrendatario_fkey
+                FOREIGN KEY (documento_identificacion_arrendatario)
+                REFERENCES arrendatarios (documento_identificacion_arrendatario)
+        ) PARTITION BY RANGE (fecha_pago)
+    """)
+    op.execute("""
+        CREATE INDEX ix_pagos_particionada_codigo_inmueble_fecha_pago
+        ON pagos_particionada (codigo_inmueble, fecha_pago)
+    """)
+    op.execute("""
+        CREATE INDEX ix_pagos_particionada_documento_arrendatario_id
+        ON pagos_particionada (documento_identificacion_arrendatario, id)
+    """)
+    # Recibe las fechas sin partición; se vacía al crear la partición de su mes
+    op.execute("CREATE TABLE pagos_pdefault PARTITION OF pagos_particionada DEFAULT")
+    op.execute(f"SELECT crear_particiones_pagos(current_date, {PARTICIONES_FUTURAS + 1})")
+
+    # Último ID copiado por `app.cli.particionar_pagos`
+    op.execute("CREATE TABLE pagos_particionada_avance (hasta_id integer NOT NULL)")
+    op.execute("INSERT INTO pagos_particionada_avance VALUES (0)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION replicar_pago_particionada() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM pagos_particionada WHERE id = OLD.id AND fecha_pago = OLD.fecha_pago;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO pagos_particionada (
+                    id, documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago
+                ) VALUES (
+                    NEW.id, NEW.documento_identificacion_arrendatario, NEW.codigo_inmueble,
+                    NEW.valor_pagado, NEW.fecha_pago
+                ) ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER pagos_replicar_particionada
+        AFTER INSERT OR UPDATE OR DELETE ON pagos
+        FOR EACH ROW EXECUTE FUNCTION replicar_pago_particionada()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS pagos_replicar_particionada ON pagos")
+    op.execute("DROP FUNCTION IF EXISTS replicar_pago_particionada()")
+    op.execute("DROP TABLE IF EXISTS pagos_particionada_avance")
+    op.execute("DROP TABLE IF EXISTS pagos_particionada CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS crear_particiones_pagos(date, int)")
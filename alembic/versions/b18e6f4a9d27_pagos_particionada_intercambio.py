@@ -0,0 +1,120 @@
+"""Tabla de pagos particionada por mes (paso 2: intercambiar)
+
+Revision ID: b18e6f4a9d27
+Revises: a7d3e8f25c61
+Create Date: 2026-10-17 23:41:55.082937
+
+Copia las filas que falten desde el último ID registrado por
+`python -m app.cli.particionar_pagos` (todas, si el comando no se ejecutó) y reemplaza
+`pagos` por la tabla particionada en una sola transacción. Con la copia previa hecha,
+el bloqueo dura lo que tarda copiar las filas insertadas desde entonces. La tabla
+anterior queda como `pagos_sin_particionar` para eliminarla una vez verificada.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b18e6f4a9d27'
+down_revision: Union[str, None] = 'a7d3e8f25c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNAS = "id, documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago"
+INDICES = ("ix_pagos_codigo_inmueble_fecha_pago", "ix_pagos_documento_arrendatario_id")
+
+
+def _renombrar_indices(origen: str, destino: str) -> None:
+    op.execute(f"ALTER INDEX {origen}_pkey RENAME TO {destino}_pkey")
+    for indice in INDICES:
+        op.execute(f"ALTER INDEX {indice.replace('pagos', origen, 1)} "
+                   f"RENAME TO {indice.replace('pagos', destino, 1)}")
+
+
+def upgrade() -> None:
+    op.execute("LOCK TABLE pagos IN EXCLUSIVE MODE")
+    # Las particiones de los meses con pagos antiguos evitan dejarlos en la partición por defecto
+    op.execute("""
+        SELECT crear_particiones_pagos(
+            desde,
+            (EXTRACT(YEAR FROM age(current_date, desde)) * 12 + EXTRACT(MONTH FROM age(current_date, desde)))::int + 1
+        )
+        FROM (
+            SELECT date_trunc('month', min(fecha_pago))::date AS desde
+            FROM pagos
+            WHERE id > (SELECT hasta_id FROM pagos_particionada_avance)
+        ) pendientes
+        WHERE desde < current_date
+    """)
+    op.execute(f"""
+        INSERT INTO pagos_particionada ({COLUMNAS})
+        SELECT {COLUMNAS} FROM pagos
+        WHERE id > (SELECT hasta_id FROM pagos_particionada_avance)
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DROP TRIGGER pagos_replicar_particionada ON pagos")
+    op.execute("DROP FUNCTION replicar_pago_particionada()")
+    op.execute("DROP TABLE pagos_particionada_avance")
+    op.execute("DROP TRIGGER IF EXISTS pagos_notificar_cambio ON pagos")
+
+    op.execute("ALTER TABLE pagos RENAME TO pagos_sin_particionar")
+    _renombrar_indices("pagos", "pagos_sin_particionar")
+    op.execute("ALTER TABLE pagos_particionada RENAME TO pagos")
+    _renombrar_indices("pagos_particionada", "pagos")
+    op.execute("ALTER TABLE pagos_sin_particionar ALTER COLUMN id DROP DEFAULT")
+    op.execute("ALTER SEQUENCE pagos_id_seq OWNED BY pagos.id")
+    op.execute("""
+        CREATE TRIGGER pagos_notificar_cambio
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pagos
+        FOR EACH STATEMENT EXECUTE FUNCTION notificar_cambio_tabla()
+    """)
+
+
+def downgrade() -> None:
+    # Vuelve a la tabla sin particionar con los pagos registrados después del intercambio
+    op.execute("LOCK TABLE pagos IN EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER IF EXISTS pagos_notificar_cambio ON pagos")
+    op.execute("ALTER SEQUENCE pagos_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE pagos RENAME TO pagos_particionada")
+    _renombrar_indices("pagos", "pagos_particionada")
+    op.execute("ALTER TABLE pagos_sin_particionar RENAME TO pagos")
+    _renombrar_indices("pagos_sin_particionar", "pagos")
+    op.execute("ALTER TABLE pagos ALTER COLUMN id SET DEFAULT nextval('pagos_id_seq')")
+    op.execute("ALTER SEQUENCE pagos_id_seq OWNED BY pagos.id")
+    op.execute(f"""
+        INSERT INTO pagos ({COLUMNAS})
+        SELECT {COLUMNAS} FROM pagos_particionada p
+        WHERE p.id > (SELECT COALESCE(max(id), 0) FROM pagos)
+    """)
+    op.execute("""
+        CREATE TRIGGER pagos_notificar_cambio
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pagos
+        FOR EACH STATEMENT EXECUTE FUNCTION notificar_cambio_tabla()
+    """)
+    # Estado del paso 1: la tabla particionada completa y replicando las escrituras
+    op.execute("CREATE TABLE pagos_particionada_avance (hasta_id integer NOT NULL)")
+    op.execute("INSERT INTO pagos_particionada_avance SELECT COALESCE(max(id), 0) FROM pagos")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION replicar_pago_particionada() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM pagos_particionada WHERE id = OLD.id AND fecha_pago = OLD.fecha_pago;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO pagos_particionada (
+                    id, documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago
+                ) VALUES (
+                    NEW.id, NEW.documento_identificacion_arrendatario, NEW.codigo_inmueble,
+                    NEW.valor_pagado, NEW.fecha_pago
+                ) ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER pagos_replicar_particionada
+        AFTER INSERT OR UPDATE OR DELETE ON pagos
+        FOR EACH ROW EXECUTE FUNCTION replicar_pago_particionada()
+    """)
@@ -0,0 +1,35 @@
+"""Versiones de tabla para ETag de los listados
+
+Revision ID: c3a7e5f19b42
+Revises: 8d4f1a6c2e90
+Create Date: 2026-10-17 22:04:51.206114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7e5f19b42'
+down_revision: Union[str, None] = '8d4f1a6c2e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('versiones_tabla',
+    sa.Column('tabla', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('tabla')
+    )
+    # Una fila por cada tabla listada; los repositorios solo la incrementan
+    op.execute("""
+        INSERT INTO versiones_tabla (tabla, version)
+        VALUES ('pagos', 1), ('arrendatarios', 1)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('versiones_tabla')
@@ -0,0 +1,48 @@
+"""Versiones de tabla como secuencias
+
+Revision ID: d6e2f7a4c918
+Revises: c3a7e5f19b42
+Create Date: 2026-10-17 23:58:12.417305
+
+Reemplaza la tabla `versiones_tabla` por una secuencia por tabla. Incrementar la fila
+de la versión la bloqueaba hasta el commit y serializaba todas las escrituras; `nextval`
+no bloquea filas. Cada secuencia continúa desde la versión registrada para que los
+ETag ya emitidos no vuelvan a coincidir.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e2f7a4c918'
+down_revision: Union[str, None] = 'c3a7e5f19b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLAS = ("pagos", "arrendatarios")
+
+
+def upgrade() -> None:
+    for tabla in TABLAS:
+        op.execute(f"CREATE SEQUENCE versiones_{tabla}_seq")
+        op.execute(f"""
+            SELECT setval('versiones_{tabla}_seq', coalesce(
+                (SELECT version FROM versiones_tabla WHERE tabla = '{tabla}'), 0) + 1)
+        """)
+    op.drop_table('versiones_tabla')
+
+
+def downgrade() -> None:
+    op.create_table('versiones_tabla',
+    sa.Column('tabla', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('tabla')
+    )
+    for tabla in TABLAS:
+        op.execute(f"""
+            INSERT INTO versiones_tabla (tabla, version)
+            SELECT '{tabla}', last_value + 1 FROM versiones_{tabla}_seq
+        """)
+        op.execute(f"DROP SEQUENCE versiones_{tabla}_seq")
@@ -0,0 +1,44 @@
+"""Notificar cambios en pagos y arrendatarios
+
+Revision ID: e91b4d2a7c05
+Revises: d6e2f7a4c918
+Create Date: 2026-10-17 22:31:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91b4d2a7c05'
+down_revision: Union[str, None] = 'd6e2f7a4c918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLAS = ('pagos', 'arrendatarios')
+
+
+def upgrade() -> None:
+    # NOTIFY se entrega al confirmar la transacción y Postgres agrupa las
+    # notificaciones repetidas, así que basta un trigger por sentencia
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notificar_cambio_tabla() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('cambios_tabla', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for tabla in TABLAS:
+        op.execute(f"""
+            CREATE TRIGGER {tabla}_notificar_cambio
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {tabla}
+            FOR EACH STATEMENT EXECUTE FUNCTION notificar_cambio_tabla()
+        """)
+
+
+def downgrade() -> None:
+    for tabla in TABLAS:
+        op.execute(f"DROP TRIGGER IF EXISTS {tabla}_notificar_cambio ON {tabla}")
+    op.execute("DROP FUNCTION IF EXISTS notificar_cambio_tabla()")
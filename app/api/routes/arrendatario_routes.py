@@ -1,47 +1,122 @@
 """
 Este módulo define los endpoints para la gestión de arrendatarios utilizando FastAPI.
 
-Proporciona endpoints para listar todos los arrendatarios y registrar un nuevo arrendatario.
+Proporciona endpoints para listar todos los arrendatarios, consultar uno con sus pagos,
+registrar un nuevo arrendatario e importarlos de forma masiva desde un CSV.
 También incluye manejo de excepciones personalizadas y utiliza servicios para realizar
 las operaciones necesarias en la base de datos.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import (
+    APIRouter, Depends, File, Header, HTTPException, Query, Response, UploadFile
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.constants import (
+    AFTER_DESCRIPTION,
+    DEFAULT_PAGE_LIMIT,
     ERROR_GET_ALL_ARRENDATARIO,
+    ERROR_GET_ALL_PAGO,
+    ERROR_GET_ARRENDATARIO,
     ERROR_CREATE_ARRENDATARIO,
-    ERROR_INTERNAL_SERVER
+    ERROR_INTERNAL_SERVER,
+    HEADER_IDEMPOTENCY_KEY,
+    IDEMPOTENCY_KEY_DESCRIPTION,
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IF_NONE_MATCH_DESCRIPTION,
+    IMPORT_FILE_DESCRIPTION,
+    INCLUIR_PAGOS_DESCRIPTION,
+    LIMIT_DESCRIPTION,
+    MAX_PAGE_LIMIT,
+    STATUS_SUCCESS,
+    TABLA_ARRENDATARIOS
+)
+from app.core.database import es_sesion_replica, get_async_db, get_async_read_db, get_db
+from app.core.cache import EntradaRespuesta, response_cache
+from app.core.etag import (
+    build_etag, etag_coincide, respuesta_cacheada, respuesta_no_modificada
 )
-from app.core.database import get_db
 from app.core.logger import log_error
+from app.core.responses import ORJSONResponse
 from app.schemas.arrendatario_schema import ArrendatarioSchema
 from app.schemas.response_general import ResponseGeneral
-from app.services.consulta_arrendatario_service import ConsultaArrendatarioService
-from app.services.create_arrendatario_service import CreateArrendatarioService
+from app.schemas.response_paginada import ResponsePaginada
+from app.services.consulta_arrendatario_service import AsyncConsultaArrendatarioService
+from app.services.consulta_pago_service import AsyncConsultaPagoService
+from app.services.create_arrendatario_service import AsyncCreateArrendatarioService
+from app.services.idempotencia_service import AsyncIdempotenciaService
+from app.services.import_arrendatario_service import ImportArrendatarioService
 
 router = APIRouter(
     tags=["arrendatarios"]
 )
 
-@router.get("", response_model=ResponseGeneral)
-def list_all_arrendatarios(db: Session = Depends(get_db)):
+@router.get("", response_model=ResponsePaginada)
+async def list_all_arrendatarios(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    incluir_pagos: bool = Query(False, description=INCLUIR_PAGOS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """
-    Endpoint para listar todos los arrendatarios registrados.
+    Endpoint para listar los arrendatarios registrados, paginados por cursor sobre
+    el documento de identificación.
 
     Args:
-        db (Session): Sesión de la base de datos proporcionada por la dependencia `get_db`.
+        limit (int): Cantidad máxima de arrendatarios de la página.
+        after (Optional[str]): Documento del último arrendatario recibido
+            (valor de `next_cursor`).
+        incluir_pagos (bool): Incluir los pagos de cada arrendatario, cargados con
+            `selectinload` en una consulta adicional por cada 500 arrendatarios.
+        if_none_match (Optional[str]): ETag de la última respuesta recibida.
+        db (AsyncSession): Sesión de lectura proporcionada por la dependencia
+            `get_async_read_db` (réplica si está disponible).
 
     Returns:
-        ResponseGeneral: Respuesta con la lista de todos los arrendatarios.
+        ResponsePaginada: Respuesta con la página de arrendatarios y el cursor de la siguiente,
+        o `304 Not Modified` si la tabla no cambió desde el ETag recibido. Las respuestas
+        leídas del primario se guardan en la caché del proceso hasta que llega una
+        notificación de cambio. Con `incluir_pagos` la respuesta depende también de la
+        tabla de pagos, por lo que no lleva ETag ni se guarda en la caché.
 
     Raises:
         HTTPException: Si ocurre un error durante la consulta, se lanza una excepción HTTP
         con código 500.
     """
-    service = ConsultaArrendatarioService(db)
+    if incluir_pagos:
+        try:
+            arrendatarios = await AsyncConsultaArrendatarioService(db).get_arrendatarios_page(
+                limit, after, incluir_pagos=True
+            )
+            return ORJSONResponse(dict(arrendatarios))
+        except Exception as e:
+            log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_INTERNAL_SERVER
+            ) from e
+
+    cache_key = (limit, after)
+    cacheada = response_cache.get(TABLA_ARRENDATARIOS, cache_key)
+    if cacheada is not None:
+        return respuesta_cacheada(cacheada, if_none_match)
+    generacion = response_cache.generacion(TABLA_ARRENDATARIOS)
+
+    service = AsyncConsultaArrendatarioService(db)
     try:
-        arrendatarios = service.get_all_arrendatarios()
-        return arrendatarios
+        # Versión antes que filas, igual que en el listado de pagos
+        etag = build_etag(TABLA_ARRENDATARIOS, await service.get_version())
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        arrendatarios = await service.get_arrendatarios_page(limit, after)
+        response = ORJSONResponse(dict(arrendatarios), headers={"ETag": etag})
+        # La notificación de cambio puede llegar antes de que la réplica aplique el cambio
+        if not es_sesion_replica(db):
+            response_cache.set(
+                TABLA_ARRENDATARIOS, cache_key, generacion, EntradaRespuesta(response.body, etag)
+            )
+        return response
     except Exception as e:
         log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
         raise HTTPException(
@@ -49,25 +124,119 @@ def list_all_arrendatarios(db: Session = Depends(get_db)):
             detail=ERROR_INTERNAL_SERVER
         ) from e
 
+@router.get("/{documento}", response_model=ResponseGeneral)
+async def get_arrendatario(
+    documento: str,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Endpoint para consultar un arrendatario con sus pagos.
+
+    Args:
+        documento (str): Documento de identificación del arrendatario.
+        db (AsyncSession): Sesión de lectura proporcionada por la dependencia
+            `get_async_read_db` (réplica si está disponible).
+
+    Returns:
+        ResponseGeneral: Respuesta con los datos del arrendatario y sus pagos ordenados
+        por ID, leídos en dos consultas.
+
+    Raises:
+        HTTPException: Si el arrendatario no existe (404) o si ocurre un error durante la
+        consulta (500).
+    """
+    try:
+        arrendatario = await AsyncConsultaArrendatarioService(db).get_arrendatario(documento)
+    except Exception as e:
+        log_error(ERROR_GET_ARRENDATARIO.format(e))
+        raise HTTPException(
+            status_code=500,
+            detail=ERROR_INTERNAL_SERVER
+        ) from e
+    if arrendatario.status != STATUS_SUCCESS:
+        raise HTTPException(
+            status_code=arrendatario.status,
+            detail=arrendatario.mensaje
+        )
+    return ORJSONResponse(dict(arrendatario))
+
+@router.get("/{documento}/pagos", response_model=ResponsePaginada)
+async def list_pagos_arrendatario(
+    documento: str,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[int] = Query(None, description=AFTER_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Endpoint para listar los pagos de un arrendatario, paginados por cursor sobre el ID.
+
+    Args:
+        documento (str): Documento de identificación del arrendatario.
+        limit (int): Cantidad máxima de pagos de la página.
+        after (Optional[int]): ID del último pago recibido (valor de `next_cursor`).
+        db (AsyncSession): Sesión de lectura proporcionada por la dependencia
+            `get_async_read_db` (réplica si está disponible).
+
+    Returns:
+        ResponsePaginada: Respuesta con la página de pagos y el cursor de la siguiente.
+
+    Raises:
+        HTTPException: Si el arrendatario no existe (404) o si ocurre un error durante la
+        consulta (500).
+    """
+    try:
+        pagos = await AsyncConsultaPagoService(db).get_pagos_arrendatario_page(
+            documento, limit, after
+        )
+    except Exception as e:
+        log_error(ERROR_GET_ALL_PAGO.format(e))
+        raise HTTPException(
+            status_code=500,
+            detail=ERROR_INTERNAL_SERVER
+        ) from e
+    if pagos.status != STATUS_SUCCESS:
+        raise HTTPException(
+            status_code=pagos.status,
+            detail=pagos.mensaje
+        )
+    return ORJSONResponse(dict(pagos))
+
 @router.post("", response_model=ResponseGeneral)
-def registrar_arrendatario(arrendatario_schema: ArrendatarioSchema, db: Session = Depends(get_db)):
+async def registrar_arrendatario(
+    arrendatario_schema: ArrendatarioSchema,
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        None, alias=HEADER_IDEMPOTENCY_KEY, min_length=1, max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+        description=IDEMPOTENCY_KEY_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Endpoint para registrar un nuevo arrendatario.
 
     Args:
         arrendatario_schema (ArrendatarioSchema): Esquema de datos del arrendatario a registrar.
-        db (Session): Sesión de la base de datos proporcionada por la dependencia `get_db`.
+        response (Response): Respuesta HTTP, para agregar `Idempotent-Replayed`.
+        idempotency_key (Optional[str]): Clave para reintentar sin registrar dos veces.
+        db (AsyncSession): Sesión asíncrona proporcionada por la dependencia `get_async_db`.
 
     Returns:
-        ResponseGeneral: Respuesta con los detalles del arrendatario registrado.
+        ResponseGeneral: Respuesta con los detalles del arrendatario registrado, o la
+        respuesta guardada si la clave de idempotencia ya se usó.
 
     Raises:
         HTTPException: Si ocurre un error durante la creación, se lanza una excepción HTTP
         con código 500.
     """
-    service = CreateArrendatarioService(db)
+    service = AsyncIdempotenciaService(TABLA_ARRENDATARIOS, idempotency_key, db)
     try:
-        created_arrendatario = service.create_arrendatario(arrendatario_schema)
+        created_arrendatario, headers = await service.ejecutar(
+            arrendatario_schema,
+            lambda sesion: AsyncCreateArrendatarioService(sesion).create_arrendatario(
+                arrendatario_schema
+            )
+        )
+        response.headers.update(headers)
         return created_arrendatario
     except Exception as e:
         log_error(ERROR_CREATE_ARRENDATARIO.format(e))
@@ -75,3 +244,33 @@ def registrar_arrendatario(arrendatario_schema: ArrendatarioSchema, db: Session
             status_code=500,
             detail=ERROR_INTERNAL_SERVER
         ) from e
+
+@router.post("/import", response_model=ResponseGeneral)
+def importar_arrendatarios(
+    archivo: UploadFile = File(..., description=IMPORT_FILE_DESCRIPTION),
+    db: Session = Depends(get_db)
+):
+    """
+    Endpoint para importar arrendatarios de forma masiva desde un archivo CSV.
+
+    Usa la sesión síncrona porque la carga se hace con COPY a través del driver psycopg2.
+
+    Args:
+        archivo (UploadFile): Archivo CSV con los arrendatarios.
+        db (Session): Sesión de la base de datos proporcionada por la dependencia `get_db`.
+
+    Returns:
+        ResponseGeneral: Reporte con los insertados, actualizados y las filas rechazadas.
+
+    Raises:
+        HTTPException: Si el archivo no se pudo importar, se lanza una excepción HTTP
+        con el código de estado correspondiente.
+    """
+    service = ImportArrendatarioService(db)
+    resultado = service.import_csv(archivo.file)
+    if resultado.status == 200:
+        return resultado
+    raise HTTPException(
+        status_code=resultado.status,
+        detail=resultado.mensaje
+    )
@@ -0,0 +1,82 @@
+"""
+Este módulo define los endpoints de monitoreo de la aplicación utilizando FastAPI.
+
+Expone las estadísticas en vivo del pool de conexiones junto con el uso del
+threadpool, para dimensionar el pool según la concurrencia real del servidor, y
+los aciertos y fallos de las cachés en memoria del proceso. `metrics_router` expone
+las métricas en formato Prometheus, fuera del prefijo de la API.
+"""
+from anyio import to_thread
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.cache import cache_stats
+from app.core.constants import (
+    MESSAGE_CACHE_STATS, MESSAGE_POOL_STATS, METRICS_PATH, STATUS_SUCCESS
+)
+from app.core.database import estado_replica, get_async_engine, get_async_replica_engine, get_engine
+from app.core.metrics import CONTENT_TYPE_METRICS, render_metrics
+from app.core.pool import pool_stats
+from app.schemas.response_general import ResponseGeneral
+
+router = APIRouter(
+    tags=["monitor"]
+)
+metrics_router = APIRouter(
+    tags=["monitor"]
+)
+
+@router.get("/pool", response_model=ResponseGeneral)
+async def get_pool_stats():
+    """
+    Endpoint para consultar las estadísticas del pool de conexiones.
+
+    Returns:
+        ResponseGeneral: Estadísticas del pool síncrono, del asíncrono, de la réplica de
+        lectura (si está configurada, con su disponibilidad y retraso) y del threadpool
+        (conexiones en uso, overflow y tiempos de espera por conexión).
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    data = {
+        "sync": pool_stats(get_engine()),
+        "async": pool_stats(get_async_engine().sync_engine),
+        "threadpool": {
+            "total_tokens": limiter.total_tokens,
+            "borrowed_tokens": limiter.borrowed_tokens
+        }
+    }
+    replica_engine = get_async_replica_engine()
+    if replica_engine is not None:
+        data["replica"] = {**pool_stats(replica_engine.sync_engine), **estado_replica.as_dict()}
+    return ResponseGeneral(
+        mensaje=MESSAGE_POOL_STATS,
+        status=STATUS_SUCCESS,
+        data=data
+    )
+
+
+@router.get("/cache", response_model=ResponseGeneral)
+async def get_cache_stats():
+    """
+    Endpoint para consultar las estadísticas de las cachés en memoria.
+
+    Returns:
+        ResponseGeneral: Aciertos, fallos y entradas vigentes de cada caché del proceso.
+    """
+    return ResponseGeneral(
+        mensaje=MESSAGE_CACHE_STATS,
+        status=STATUS_SUCCESS,
+        data=cache_stats()
+    )
+
+
+@metrics_router.get(METRICS_PATH, include_in_schema=False)
+async def get_metrics():
+    """
+    Endpoint para Prometheus con las métricas del proceso.
+
+    Returns:
+        Response: Histogramas de solicitudes y consultas, y estado de pools y cachés,
+        en formato de texto de Prometheus.
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_METRICS)
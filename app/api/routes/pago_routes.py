@@ -1,44 +1,104 @@
 """
 Este módulo define los endpoints para la gestión de pagos utilizando FastAPI.
 
-Proporciona endpoints para listar todos los pagos y registrar un nuevo pago.
+Proporciona endpoints para listar todos los pagos, exportarlos y registrar pagos
+de forma individual o por lotes.
 Incluye manejo de excepciones personalizadas y utiliza servicios para realizar
 las operaciones necesarias en la base de datos.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Iterator, List, Optional
 
-from app.core.constants import ERROR_GET_ALL_PAGO, ERROR_INTERNAL_SERVER
-from app.core.database import get_db
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import (
+    AFTER_DESCRIPTION,
+    DEFAULT_PAGE_LIMIT,
+    ERROR_EXPORT_PAGO,
+    ERROR_GET_ALL_PAGO,
+    ERROR_INTERNAL_SERVER,
+    IF_NONE_MATCH_DESCRIPTION,
+    EXPORT_FORMAT_DESCRIPTION,
+    HEADER_IDEMPOTENCY_KEY,
+    IDEMPOTENCY_KEY_DESCRIPTION,
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    LIMIT_DESCRIPTION,
+    MAX_PAGE_LIMIT,
+    MAX_PAGO_BATCH_SIZE,
+    PAGO_BATCH_DESCRIPTION,
+    TABLA_PAGOS
+)
+from app.core.database import SessionLocal, es_sesion_replica, get_async_db, get_async_read_db
+from app.core.cache import EntradaRespuesta, response_cache
+from app.core.etag import (
+    build_etag, etag_coincide, respuesta_cacheada, respuesta_no_modificada
+)
 from app.core.logger import log_error
+from app.core.responses import ORJSONResponse
+from app.schemas.export_schema import FormatoExport
 from app.schemas.pago_input_schema import PagoInputSchema
 from app.schemas.response_general import ResponseGeneral
-from app.services.consulta_pago_service import ConsultaPagoService
-from app.services.create_pago_service import CreatePagoService
+from app.schemas.response_paginada import ResponsePaginada
+from app.services.consulta_pago_service import AsyncConsultaPagoService
+from app.services.create_pago_batch_service import AsyncCreatePagoBatchService
+from app.services.create_pago_service import AsyncCreatePagoService
+from app.services.export_pago_service import ExportPagoService
+from app.services.idempotencia_service import AsyncIdempotenciaService
 
 router = APIRouter(
     tags=["pagos"]
 )
 
-@router.get("", response_model=ResponseGeneral)
-def list_all_pagos(db: Session = Depends(get_db)):
+@router.get("", response_model=ResponsePaginada)
+async def list_all_pagos(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[int] = Query(None, description=AFTER_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """
-    Endpoint para listar todos los pagos registrados.
+    Endpoint para listar los pagos registrados, paginados por cursor sobre el ID.
 
     Args:
-        db (Session): Sesión de la base de datos proporcionada por la dependencia `get_db`.
+        limit (int): Cantidad máxima de pagos de la página.
+        after (Optional[int]): ID del último pago recibido (valor de `next_cursor`).
+        if_none_match (Optional[str]): ETag de la última respuesta recibida.
+        db (AsyncSession): Sesión de lectura proporcionada por la dependencia
+            `get_async_read_db` (réplica si está disponible).
 
     Returns:
-        ResponseGeneral: Respuesta con la lista de todos los pagos.
+        ResponsePaginada: Respuesta con la página de pagos y el cursor de la siguiente,
+        o `304 Not Modified` si la tabla no cambió desde el ETag recibido. Las respuestas
+        leídas del primario se guardan en la caché del proceso hasta que llega una
+        notificación de cambio.
 
     Raises:
         HTTPException: Si ocurre un error durante la consulta, se lanza una excepción HTTP
         con código 500.
     """
-    service = ConsultaPagoService(db)
+    cache_key = (limit, after)
+    cacheada = response_cache.get(TABLA_PAGOS, cache_key)
+    if cacheada is not None:
+        return respuesta_cacheada(cacheada, if_none_match)
+    generacion = response_cache.generacion(TABLA_PAGOS)
+
+    service = AsyncConsultaPagoService(db)
     try:
-        pagos = service.get_all_pagos()
-        return pagos
+        # La versión se lee antes que las filas: si cambia entre ambas lecturas, el
+        # ETag queda atrasado y el cliente solo vuelve a consultar en el siguiente sondeo
+        etag = build_etag(TABLA_PAGOS, await service.get_version())
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        pagos = await service.get_pagos_page(limit, after)
+        # Se serializa directamente, sin pasar de nuevo por la validación de `response_model`
+        response = ORJSONResponse(dict(pagos), headers={"ETag": etag})
+        # La notificación de cambio puede llegar antes de que la réplica aplique el cambio
+        if not es_sesion_replica(db):
+            response_cache.set(
+                TABLA_PAGOS, cache_key, generacion, EntradaRespuesta(response.body, etag)
+            )
+        return response
     except Exception as e:
         log_error(ERROR_GET_ALL_PAGO.format(e))
         raise HTTPException(
@@ -46,28 +106,119 @@ def list_all_pagos(db: Session = Depends(get_db)):
             detail=ERROR_INTERNAL_SERVER
         ) from e
 
+@router.get("/export", response_class=StreamingResponse)
+def export_pagos(
+    formato: FormatoExport = Query(FormatoExport.NDJSON, description=EXPORT_FORMAT_DESCRIPTION)
+):
+    """
+    Endpoint para exportar todos los pagos en formato NDJSON o CSV.
+
+    La respuesta se transmite por partes a medida que se leen los lotes del cursor
+    del servidor, por lo que la memoria es constante y el primer byte se envía
+    sin esperar a leer toda la tabla.
+
+    Args:
+        formato (FormatoExport): Formato de salida de la exportación.
+
+    Returns:
+        StreamingResponse: Respuesta transmitida con todos los pagos.
+    """
+    return StreamingResponse(
+        _stream_export_pagos(formato),
+        media_type=formato.media_type,
+        headers={"Content-Disposition": f'attachment; filename="pagos.{formato.value}"'}
+    )
+
+def _stream_export_pagos(formato: FormatoExport) -> Iterator[bytes]:
+    """
+    Genera la exportación usando una sesión propia.
+
+    La sesión no puede venir de `get_db` porque la dependencia se cierra antes de
+    que termine la transmisión de la respuesta.
+
+    Args:
+        formato (FormatoExport): Formato de salida de la exportación.
+
+    Yields:
+        bytes: Fragmentos de la exportación.
+    """
+    db = SessionLocal()
+    try:
+        yield from ExportPagoService(db).export_pagos(formato)
+    except Exception as e:
+        log_error(ERROR_EXPORT_PAGO.format(e))
+        raise
+    finally:
+        db.close()
+
 @router.post("", response_model=ResponseGeneral)
-def registrar_pago(pago: PagoInputSchema, db: Session = Depends(get_db)):
+async def registrar_pago(
+    pago: PagoInputSchema,
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        None, alias=HEADER_IDEMPOTENCY_KEY, min_length=1, max_length=IDEMPOTENCY_KEY_MAX_LENGTH,
+        description=IDEMPOTENCY_KEY_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     Endpoint para registrar un nuevo pago.
 
     Args:
         pago (PagoInputSchema): Esquema de datos del pago a registrar.
-        db (Session): Sesión de la base de datos proporcionada por la dependencia `get_db`.
+        response (Response): Respuesta HTTP, para agregar `Idempotent-Replayed`.
+        idempotency_key (Optional[str]): Clave para reintentar sin registrar el pago dos veces.
+        db (AsyncSession): Sesión asíncrona proporcionada por la dependencia `get_async_db`.
 
     Returns:
-        ResponseGeneral: Respuesta con los detalles del pago registrado.
+        ResponseGeneral: Respuesta con los detalles del pago registrado, o la respuesta
+        guardada si la clave de idempotencia ya se usó.
 
     Raises:
         HTTPException: Si ocurre un error durante la creación, se lanza una excepción HTTP
         con el código de estado correspondiente.
     """
-    service = CreatePagoService(db)
-    created_pago = service.create_pago(pago)
+    service = AsyncIdempotenciaService(TABLA_PAGOS, idempotency_key, db)
+    created_pago, headers = await service.ejecutar(
+        pago, lambda sesion: AsyncCreatePagoService(sesion).create_pago(pago)
+    )
     # Personaliza el código de estado en función de la respuesta
     if created_pago.status == 200:
+        response.headers.update(headers)
         return created_pago
     raise HTTPException(
         status_code=created_pago.status,
-        detail=created_pago.mensaje
+        detail=created_pago.mensaje,
+        headers=headers or None
+    )
+
+@router.post("/batch", response_model=ResponseGeneral)
+async def registrar_pagos_batch(
+    pagos: List[PagoInputSchema] = Body(
+        ..., min_length=1, max_length=MAX_PAGO_BATCH_SIZE, description=PAGO_BATCH_DESCRIPTION
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Endpoint para registrar un lote de pagos.
+
+    Args:
+        pagos (List[PagoInputSchema]): Pagos a registrar.
+        db (AsyncSession): Sesión asíncrona proporcionada por la dependencia `get_async_db`.
+
+    Returns:
+        ResponseGeneral: Resumen del lote con el resultado de cada pago en `data`
+        (índice en el lote, estado y mensaje).
+
+    Raises:
+        HTTPException: Si el lote completo no se pudo procesar, se lanza una excepción HTTP
+        con el código de estado correspondiente.
+    """
+    service = AsyncCreatePagoBatchService(db)
+    resultado = await service.create_pagos(pagos)
+    if resultado.status == 200:
+        return resultado
+    raise HTTPException(
+        status_code=resultado.status,
+        detail=resultado.mensaje
     )
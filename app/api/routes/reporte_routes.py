@@ -0,0 +1,100 @@
+"""
+Este módulo define los endpoints de los reportes de recaudo utilizando FastAPI.
+
+Los totales, la cantidad de pagos y el saldo pendiente se calculan con `GROUP BY` en
+la base de datos, y cada respuesta se guarda por unos segundos en la caché de reportes
+del proceso, de modo que las consultas repetidas no vuelven a la base de datos.
+"""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import EntradaRespuesta, reporte_cache
+from app.core.constants import (
+    AGRUPACION_DESCRIPTION,
+    ERROR_INTERNAL_SERVER,
+    ERROR_REPORTE_PAGOS,
+    IF_NONE_MATCH_DESCRIPTION,
+    REPORTE_DESDE_DESCRIPTION,
+    REPORTE_HASTA_DESCRIPTION,
+    STATUS_SUCCESS,
+    TABLA_REPORTES
+)
+from app.core.database import get_async_read_db
+from app.core.etag import (
+    build_etag_contenido,
+    etag_coincide,
+    respuesta_cacheada,
+    respuesta_no_modificada
+)
+from app.core.logger import log_error
+from app.core.responses import ORJSONResponse
+from app.schemas.reporte_schema import AgrupacionReporte
+from app.schemas.response_general import ResponseGeneral
+from app.services.reporte_pago_service import AsyncReportePagoService
+
+router = APIRouter(
+    tags=["reportes"]
+)
+
+@router.get("/pagos", response_model=ResponseGeneral)
+async def reporte_pagos(
+    desde: date = Query(..., description=REPORTE_DESDE_DESCRIPTION),
+    hasta: date = Query(..., description=REPORTE_HASTA_DESCRIPTION),
+    agrupacion: AgrupacionReporte = Query(
+        AgrupacionReporte.INMUEBLE, description=AGRUPACION_DESCRIPTION
+    ),
+    if_none_match: Optional[str] = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Endpoint para obtener el recaudo por inmueble, por arrendatario o por mes.
+
+    Args:
+        desde (date): Fecha del primer mes del reporte.
+        hasta (date): Fecha del último mes del reporte.
+        agrupacion (AgrupacionReporte): Agrupación de las filas, siempre desglosadas por mes.
+        if_none_match (Optional[str]): ETag de la última respuesta recibida.
+        db (AsyncSession): Sesión de lectura proporcionada por la dependencia
+            `get_async_read_db` (réplica si está disponible).
+
+    Returns:
+        ResponseGeneral: Respuesta con una fila por grupo y mes (total pagado, cantidad de
+        pagos y saldo pendiente contra el valor del arriendo), o `304 Not Modified` si
+        coincide con el ETag recibido. Las respuestas se guardan en la caché de reportes
+        durante `REPORTE_CACHE_TTL` segundos, por lo que pueden omitir los pagos más
+        recientes por ese tiempo.
+
+    Raises:
+        HTTPException: Si el rango de fechas no es válido (400) o si ocurre un error
+        durante la consulta (500).
+    """
+    cache_key = (agrupacion, desde.replace(day=1), hasta.replace(day=1))
+    cacheada = reporte_cache.get(TABLA_REPORTES, cache_key)
+    if cacheada is not None:
+        return respuesta_cacheada(cacheada, if_none_match)
+    generacion = reporte_cache.generacion(TABLA_REPORTES)
+
+    service = AsyncReportePagoService(db)
+    try:
+        reporte = await service.get_reporte(agrupacion, desde, hasta)
+    except Exception as e:
+        log_error(ERROR_REPORTE_PAGOS.format(e))
+        raise HTTPException(
+            status_code=500,
+            detail=ERROR_INTERNAL_SERVER
+        ) from e
+    if reporte.status != STATUS_SUCCESS:
+        raise HTTPException(
+            status_code=reporte.status,
+            detail=reporte.mensaje
+        )
+    response = ORJSONResponse(dict(reporte))
+    etag = build_etag_contenido(response.body)
+    if etag_coincide(if_none_match, etag):
+        return respuesta_no_modificada(etag)
+    response.headers["ETag"] = etag
+    reporte_cache.set(TABLA_REPORTES, cache_key, generacion, EntradaRespuesta(response.body, etag))
+    return response
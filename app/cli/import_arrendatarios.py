@@ -0,0 +1,39 @@
+"""
+Comando para importar arrendatarios de forma masiva desde un archivo CSV.
+
+El archivo debe tener encabezado y las columnas documento_identificacion_arrendatario,
+nombre_completo, email y telefono, en ese orden. Imprime el reporte en formato JSON.
+
+Uso:
+    python -m app.cli.import_arrendatarios ruta/al/archivo.csv
+"""
+import argparse
+import json
+import sys
+
+from app.core.database import SessionLocal
+from app.services.import_arrendatario_service import ImportArrendatarioService
+
+
+def main():
+    """
+    Punto de entrada del comando de importación.
+    """
+    parser = argparse.ArgumentParser(description="Importa arrendatarios desde un CSV.")
+    parser.add_argument("archivo", help="Ruta del archivo CSV a importar.")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        with open(args.archivo, "rb") as archivo:
+            resultado = ImportArrendatarioService(db).import_csv(archivo)
+    finally:
+        db.close()
+
+    print(json.dumps(resultado.model_dump(), ensure_ascii=False, indent=2))
+    if resultado.status != 200:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Comando para copiar los pagos existentes a la tabla particionada por mes.
+
+Se ejecuta entre los dos pasos de la migración (`alembic upgrade a7d3e8f25c61` y
+`alembic upgrade head`). Crea las particiones de los meses con pagos y copia las filas
+por lotes de IDs, cada lote en su propia transacción, sin bloquear las escrituras; las
+filas nuevas ya llegan a la tabla particionada por el trigger del primer paso. Se puede
+interrumpir y volver a ejecutar: continúa desde el último lote copiado.
+
+Con `--solo-particiones` solo crea las particiones de los próximos meses (lo mismo que
+hace la aplicación al iniciar), para programarlo periódicamente.
+
+Uso:
+    python -m app.cli.particionar_pagos [--lote 10000] [--pausa 0.1]
+    python -m app.cli.particionar_pagos --solo-particiones [--meses 3]
+"""
+import argparse
+import time
+from datetime import date
+
+from app.core.config import config
+from app.core.constants import (
+    INFO_PARTICIONADO_COMPLETO,
+    INFO_PARTICIONADO_LOTE,
+    INFO_PARTICIONADO_NO_PENDIENTE,
+    INFO_PARTICIONES_CREADAS
+)
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.db.particion_pago_repository import ParticionPagoRepository, meses_entre
+
+
+def copiar(repository: ParticionPagoRepository, lote: int, pausa: float):
+    """
+    Crea las particiones de los meses pendientes y copia los pagos por lotes.
+
+    Args:
+        repository (ParticionPagoRepository): Repositorio de particiones.
+        lote (int): Filas copiadas por transacción.
+        pausa (float): Segundos de espera entre lotes.
+    """
+    if not repository.copia_pendiente():
+        log_info(INFO_PARTICIONADO_NO_PENDIENTE)
+        return
+    primera, ultima = repository.rango_fechas_pendientes()
+    if primera is not None:
+        creadas = repository.crear_particiones(primera, meses_entre(primera, ultima))
+        log_info(INFO_PARTICIONES_CREADAS.format(creadas))
+
+    desde, hasta = repository.avance()
+    while desde < hasta:
+        fin_lote = repository.fin_lote(desde, lote, hasta)
+        copiadas = repository.copiar_lote(desde, fin_lote)
+        log_info(INFO_PARTICIONADO_LOTE.format(fin_lote, hasta, copiadas))
+        desde = fin_lote
+        if pausa:
+            time.sleep(pausa)
+    log_info(INFO_PARTICIONADO_COMPLETO.format(hasta))
+
+
+def main():
+    """
+    Punto de entrada del comando de particionado.
+    """
+    parser = argparse.ArgumentParser(description="Copia los pagos a la tabla particionada por mes.")
+    parser.add_argument("--lote", type=int, default=10000, help="Filas copiadas por transacción.")
+    parser.add_argument("--pausa", type=float, default=0.0, help="Segundos de espera entre lotes.")
+    parser.add_argument(
+        "--solo-particiones", action="store_true",
+        help="Solo crear las particiones del mes actual y de los siguientes."
+    )
+    parser.add_argument("--meses", type=int, default=config.PAGOS_PARTICIONES_FUTURAS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        repository = ParticionPagoRepository(db)
+        if args.solo_particiones:
+            creadas = repository.crear_particiones(date.today(), args.meses + 1)
+            log_info(INFO_PARTICIONES_CREADAS.format(creadas))
+        else:
+            copiar(repository, args.lote, args.pausa)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
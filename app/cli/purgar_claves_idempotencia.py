@@ -0,0 +1,35 @@
+"""
+Comando para eliminar las claves de idempotencia expiradas.
+
+Las claves expiradas ya se reutilizan al recibir la misma clave, pero las que no se
+repiten quedan en la tabla hasta ejecutar este comando (por ejemplo, una vez al día).
+
+Uso:
+    python -m app.cli.purgar_claves_idempotencia
+"""
+import argparse
+
+from app.core.constants import INFO_PURGE_IDEMPOTENCIA
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.db.clave_idempotencia_repository import ClaveIdempotenciaRepository
+
+
+def main():
+    """
+    Punto de entrada del comando de purga.
+    """
+    argparse.ArgumentParser(
+        description="Elimina las claves de idempotencia expiradas."
+    ).parse_args()
+
+    db = SessionLocal()
+    try:
+        eliminadas = ClaveIdempotenciaRepository(db).purgar_expiradas()
+        log_info(INFO_PURGE_IDEMPOTENCIA.format(eliminadas))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
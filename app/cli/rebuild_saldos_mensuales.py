@@ -0,0 +1,39 @@
+"""
+Comando para reconstruir los saldos mensuales por inmueble a partir de los pagos.
+
+Sirve para cargar los acumulados de datos existentes o para corregirlos si alguna
+vez se desalinean de la tabla de pagos.
+
+Uso:
+    python -m app.cli.rebuild_saldos_mensuales [--codigo-inmueble CODIGO]
+"""
+import argparse
+
+from app.core.constants import INFO_REBUILD_SALDO_MENSUAL
+from app.core.database import SessionLocal
+from app.core.logger import log_info
+from app.db.saldo_mensual_repository import SaldoMensualRepository
+
+
+def main():
+    """
+    Punto de entrada del comando de reconstrucción.
+    """
+    parser = argparse.ArgumentParser(description="Reconstruye los saldos mensuales por inmueble.")
+    parser.add_argument(
+        "--codigo-inmueble",
+        default=None,
+        help="Reconstruir solo este inmueble (por defecto, todos)."
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        filas = SaldoMensualRepository(db).rebuild(args.codigo_inmueble)
+        log_info(INFO_REBUILD_SALDO_MENSUAL.format(filas))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
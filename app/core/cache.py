@@ -0,0 +1,306 @@
+"""
+Este módulo define las cachés en memoria del proceso.
+
+Proporciona una caché acotada (LRU con expiración) para las verificaciones de
+existencia que se repiten en cada pago y registro, como la existencia de un
+arrendatario por documento o por email. Los resultados negativos se guardan con una
+expiración más corta para que una ráfaga de documentos inválidos no llegue a la base
+de datos, sin ocultar por mucho tiempo un arrendatario recién creado en otro proceso.
+
+También define la caché de respuestas de los listados, acotada por bytes, que se
+invalida por tabla cuando llega una notificación de cambio (ver `app.core.notificaciones`),
+y la de los reportes, que solo expira por tiempo.
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, NamedTuple, Optional
+
+from cachetools import TTLCache
+
+from app.core.config import config
+
+
+class ExistenciaCache:
+    """
+    Caché de verificaciones de existencia con TTL distinto para positivos y negativos.
+
+    Ambas partes descartan primero la entrada usada hace más tiempo cuando se llenan.
+    Es segura para usarse desde el threadpool y desde el event loop.
+    """
+    def __init__(self, nombre: str, maxsize: int, ttl: float, ttl_negativo: float):
+        """
+        Inicializa la caché.
+
+        Args:
+            nombre (str): Nombre de la caché, usado en las estadísticas.
+            maxsize (int): Cantidad máxima de entradas de cada tipo (positivas y negativas).
+            ttl (float): Segundos que se conserva un resultado positivo.
+            ttl_negativo (float): Segundos que se conserva un resultado negativo.
+        """
+        self.nombre = nombre
+        self._lock = threading.Lock()
+        self._positivos = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._negativos = TTLCache(maxsize=maxsize, ttl=ttl_negativo)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, clave: Hashable) -> Optional[bool]:
+        """
+        Consulta si la existencia de la clave está en caché.
+
+        Args:
+            clave (Hashable): Valor verificado (documento, email, etc.).
+
+        Returns:
+            Optional[bool]: True o False si hay un resultado vigente, None si no lo hay.
+        """
+        with self._lock:
+            # `get` (a diferencia de `in`) marca la entrada como usada recientemente
+            existe = self._positivos.get(clave)
+            if existe is None:
+                existe = self._negativos.get(clave)
+            if existe is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return existe
+
+    def set(self, clave: Hashable, existe: bool):
+        """
+        Guarda el resultado de una verificación de existencia.
+
+        Args:
+            clave (Hashable): Valor verificado.
+            existe (bool): Resultado de la verificación en la base de datos.
+        """
+        with self._lock:
+            if existe:
+                self._negativos.pop(clave, None)
+                self._positivos[clave] = True
+            else:
+                self._positivos.pop(clave, None)
+                self._negativos[clave] = False
+
+    def invalidate(self, clave: Optional[Hashable] = None):
+        """
+        Elimina una clave de la caché, o todas si no se indica ninguna.
+
+        Args:
+            clave (Optional[Hashable]): Valor a eliminar.
+        """
+        with self._lock:
+            if clave is None:
+                self._positivos.clear()
+                self._negativos.clear()
+            else:
+                self._positivos.pop(clave, None)
+                self._negativos.pop(clave, None)
+
+    def invalidate_negativos(self):
+        """
+        Elimina todos los resultados negativos, conservando los positivos.
+        """
+        with self._lock:
+            self._negativos.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna las estadísticas de uso de la caché.
+
+        Returns:
+            Dict[str, float]: Aciertos, fallos, tasa de aciertos y entradas vigentes.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "positivos": len(self._positivos),
+                "negativos": len(self._negativos),
+                "maxsize": self._positivos.maxsize
+            }
+
+
+class EntradaRespuesta(NamedTuple):
+    """
+    Respuesta de un listado ya serializada, junto con su ETag.
+    """
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """
+    Caché de respuestas serializadas de los listados, agrupadas por tabla.
+
+    El tamaño máximo se mide en bytes de las respuestas y cada entrada expira tras
+    el TTL. Cada tabla tiene un contador de generación que aumenta al invalidarla:
+    una respuesta calculada antes de una invalidación no se guarda, aunque termine
+    de calcularse después. La caché solo opera mientras está activa, es decir,
+    mientras el proceso recibe las notificaciones de cambios.
+    """
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Inicializa la caché, inactiva hasta que se llame a `activar`.
+
+        Args:
+            max_bytes (int): Tamaño máximo total de las respuestas guardadas.
+            ttl (float): Segundos que se conserva cada respuesta.
+        """
+        self._lock = threading.Lock()
+        self._entradas = TTLCache(
+            maxsize=max_bytes, ttl=ttl, getsizeof=lambda entrada: len(entrada.body)
+        )
+        self._generaciones = defaultdict(int)
+        self.activa = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidaciones = 0
+
+    def get(self, tabla: str, clave: Hashable) -> Optional[EntradaRespuesta]:
+        """
+        Consulta la respuesta guardada de un listado.
+
+        Args:
+            tabla (str): Tabla listada.
+            clave (Hashable): Parámetros del listado.
+
+        Returns:
+            Optional[EntradaRespuesta]: La respuesta guardada, o None si no hay una vigente.
+        """
+        with self._lock:
+            if not self.activa:
+                return None
+            entrada = self._entradas.get((tabla, clave))
+            if entrada is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entrada
+
+    def generacion(self, tabla: str) -> int:
+        """
+        Retorna la generación actual de una tabla; se lee antes de calcular la respuesta.
+
+        Args:
+            tabla (str): Tabla listada.
+
+        Returns:
+            int: Generación de la tabla.
+        """
+        with self._lock:
+            return self._generaciones[tabla]
+
+    def set(self, tabla: str, clave: Hashable, generacion: int, entrada: EntradaRespuesta):
+        """
+        Guarda una respuesta si la tabla no fue invalidada mientras se calculaba.
+
+        Args:
+            tabla (str): Tabla listada.
+            clave (Hashable): Parámetros del listado.
+            generacion (int): Generación leída antes de calcular la respuesta.
+            entrada (EntradaRespuesta): Respuesta serializada y su ETag.
+        """
+        with self._lock:
+            if not self.activa or self._generaciones[tabla] != generacion:
+                return
+            if len(entrada.body) > self._entradas.maxsize:
+                return
+            self._entradas[(tabla, clave)] = entrada
+
+    def invalidate(self, tabla: Optional[str] = None):
+        """
+        Elimina las respuestas de una tabla, o de todas si no se indica ninguna.
+
+        Args:
+            tabla (Optional[str]): Tabla modificada.
+        """
+        with self._lock:
+            self.invalidaciones += 1
+            if tabla is None:
+                for nombre in self._generaciones:
+                    self._generaciones[nombre] += 1
+                self._entradas.clear()
+                return
+            self._generaciones[tabla] += 1
+            for clave in [clave for clave in self._entradas.keys() if clave[0] == tabla]:
+                self._entradas.pop(clave, None)
+
+    def activar(self):
+        """
+        Activa la caché, vacía, al empezar a recibir las notificaciones de cambios.
+        """
+        self.invalidate()
+        with self._lock:
+            self.activa = True
+
+    def desactivar(self):
+        """
+        Desactiva y vacía la caché, por ejemplo al perder la conexión de notificaciones.
+        """
+        with self._lock:
+            self.activa = False
+        self.invalidate()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retorna las estadísticas de uso de la caché.
+
+        Returns:
+            Dict[str, float]: Estado, aciertos, fallos, invalidaciones y bytes usados.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "activa": self.activa,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "invalidaciones": self.invalidaciones,
+                "entradas": len(self._entradas),
+                "bytes": self._entradas.currsize,
+                "max_bytes": self._entradas.maxsize
+            }
+
+
+arrendatario_documento_cache = ExistenciaCache(
+    "arrendatario_documento",
+    maxsize=config.CACHE_ARRENDATARIOS_MAXSIZE,
+    ttl=config.CACHE_ARRENDATARIOS_TTL,
+    ttl_negativo=config.CACHE_ARRENDATARIOS_NEGATIVE_TTL
+)
+arrendatario_email_cache = ExistenciaCache(
+    "arrendatario_email",
+    maxsize=config.CACHE_ARRENDATARIOS_MAXSIZE,
+    ttl=config.CACHE_ARRENDATARIOS_TTL,
+    ttl_negativo=config.CACHE_ARRENDATARIOS_NEGATIVE_TTL
+)
+
+EXISTENCIA_CACHES = (arrendatario_documento_cache, arrendatario_email_cache)
+
+response_cache = ResponseCache(
+    max_bytes=config.RESPONSE_CACHE_MAX_BYTES,
+    ttl=config.RESPONSE_CACHE_TTL
+)
+
+# Los reportes no se invalidan con las notificaciones de cambios: cada pago cambiaría
+# los totales y vaciaría la caché. Expiran por tiempo, con un TTL corto.
+reporte_cache = ResponseCache(
+    max_bytes=config.REPORTE_CACHE_MAX_BYTES,
+    ttl=config.REPORTE_CACHE_TTL
+)
+reporte_cache.activar()
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Retorna las estadísticas de todas las cachés del proceso.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Estadísticas por nombre de caché.
+    """
+    stats = {cache.nombre: cache.stats() for cache in EXISTENCIA_CACHES}
+    stats["respuestas"] = response_cache.stats()
+    stats["reportes"] = reporte_cache.stats()
+    return stats
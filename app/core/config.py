@@ -4,29 +4,105 @@ Este módulo define la configuración de la aplicación utilizando Pydantic y va
 Maneja la carga de variables de entorno y su validación para proporcionar
 una configuración centralizada a la aplicación.
 """
-from pydantic_settings import BaseSettings
-from pydantic import Field, PostgresDsn, field_validator
-from dotenv import load_dotenv
-
-# Cargar las variables de entorno del archivo .env
-load_dotenv()
+from typing import Dict, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field, PostgresDsn, field_validator
 
 
 class Config(BaseSettings):
     """
     Clase de configuración utilizando Pydantic para manejar variables de entorno.
     """
-    env_file = ".env"  # Define el archivo de entorno a usar
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")  # Archivo de entorno a usar
+
+    APP_NAME: str = Field("My FastAPI App")
+    DEBUG: bool = Field(False)
+
+    # Configuración de base de datos. El archivo .env lo lee BaseSettings; la URL es
+    # opcional al importar y se valida al crear el primer motor (`get_database_url`).
+    SQLALCHEMY_DATABASE_URL: Optional[PostgresDsn] = Field(
+        None, validation_alias=AliasChoices("DATABASE_URL", "SQLALCHEMY_DATABASE_URL")
+    )
+    # Pool de conexiones: MIN es el tamaño fijo del pool (se abre al iniciar) y
+    # MAX el total permitido contando el overflow. Aplica a cada motor (sync y async).
+    MAX_CONNECTIONS_COUNT: int = Field(10)
+    MIN_CONNECTIONS_COUNT: int = Field(10)
+    DB_POOL_TIMEOUT: float = Field(30.0)
+    DB_POOL_RECYCLE: int = Field(1800)
+    DB_POOL_PRE_PING: bool = Field(True)
+
+    # Réplica de lectura opcional para los listados (GET). Se usa mientras responda y su
+    # retraso no supere REPLICA_MAX_LAG segundos; si no, las lecturas vuelven al primario.
+    # El estado se revisa como máximo cada REPLICA_CHECK_INTERVAL segundos por proceso.
+    SQLALCHEMY_REPLICA_URL: Optional[PostgresDsn] = Field(
+        None,
+        validation_alias=AliasChoices("DATABASE_REPLICA_URL", "SQLALCHEMY_REPLICA_URL")
+    )
+    REPLICA_MAX_LAG: float = Field(5.0)
+    REPLICA_CHECK_INTERVAL: float = Field(2.0)
+    REPLICA_CHECK_TIMEOUT: float = Field(1.0)
+
+    # Particiones mensuales de pagos que se crean por adelantado al iniciar (además de la
+    # del mes actual); los pagos de meses sin partición caen en la partición por defecto
+    PAGOS_PARTICIONES_FUTURAS: int = Field(3)
+
+    # Caché en memoria de la existencia de arrendatarios (por documento y por email).
+    # Los negativos expiran antes para no ocultar arrendatarios creados en otro proceso.
+    CACHE_ARRENDATARIOS_MAXSIZE: int = Field(10000)
+    CACHE_ARRENDATARIOS_TTL: float = Field(300.0)
+    CACHE_ARRENDATARIOS_NEGATIVE_TTL: float = Field(5.0)
+
+    # Caché de respuestas de los listados, invalidada con LISTEN/NOTIFY entre workers
+    RESPONSE_CACHE_ENABLED: bool = Field(True)
+    RESPONSE_CACHE_MAX_BYTES: int = Field(32 * 1024 * 1024)
+    RESPONSE_CACHE_TTL: float = Field(60.0)
+
+    # Caché de los reportes de recaudo: solo expira por tiempo, sin invalidación por cambios
+    REPORTE_CACHE_MAX_BYTES: int = Field(8 * 1024 * 1024)
+    REPORTE_CACHE_TTL: float = Field(10.0)
+
+    # Claves de idempotencia (`Idempotency-Key`) de los registros: tiempo que se guarda la
+    # respuesta y tiempo máximo que un duplicado espera a que termine la primera solicitud
+    IDEMPOTENCY_TTL: int = Field(24 * 60 * 60)
+    IDEMPOTENCY_WAIT_TIMEOUT: float = Field(10.0)
+
+    # Métricas en formato Prometheus en /metrics (solicitudes, consultas, pools y cachés)
+    METRICS_ENABLED: bool = Field(True)
+
+    # Consultas por solicitud: se registran las que superan QUERY_SLOW_MS con sus
+    # parámetros, y se advierte (o falla, con QUERY_REPEAT_STRICT en pruebas) cuando una
+    # solicitud repite la misma sentencia más de QUERY_REPEAT_THRESHOLD veces (N+1).
+    QUERY_SLOW_MS: float = Field(200.0)
+    QUERY_REPEAT_THRESHOLD: int = Field(10)
+    QUERY_REPEAT_STRICT: bool = Field(False)
+    QUERY_STATS_HEADERS: bool = Field(True)
 
-    APP_NAME: str = Field("My FastAPI App", env="APP_NAME")
-    DEBUG: bool = Field(False, env="DEBUG")
+    # Logs: nivel general, niveles por logger (JSON, p. ej. {"sqlalchemy.engine": "WARNING"}),
+    # salida en JSON o en texto, y fracción de los logs informativos del camino crítico
+    # que se registran (ver `log_info_muestreado`)
+    LOG_LEVEL: str = Field("INFO")
+    LOG_LEVELS: Dict[str, str] = Field(default_factory=dict)
+    LOG_JSON: bool = Field(True)
+    LOG_SAMPLE_RATE: float = Field(0.01)
 
-    # Configuración de base de datos
-    SQLALCHEMY_DATABASE_URL: PostgresDsn = Field(..., env="DATABASE_URL")
-    MAX_CONNECTIONS_COUNT: int = Field(10, env="MAX_CONNECTIONS_COUNT")
-    MIN_CONNECTIONS_COUNT: int = Field(10, env="MIN_CONNECTIONS_COUNT")
+    RUTA_BASE: str = Field("/api")
 
-    RUTA_BASE: str = Field("/api", env="RUTA_BASE")
+    # Servidor de producción (`python -m app.server`). Sin SERVER_WORKERS se usa un
+    # worker por núcleo; cada worker abre sus propios pools de conexiones.
+    SERVER_HOST: str = Field("0.0.0.0")
+    SERVER_PORT: int = Field(8084)
+    SERVER_WORKERS: Optional[int] = Field(None)
+    SERVER_LOOP: str = Field("uvloop")
+    SERVER_HTTP: str = Field("httptools")
+    SERVER_KEEPALIVE_TIMEOUT: int = Field(5)
+    SERVER_BACKLOG: int = Field(2048)
+    SERVER_ACCESS_LOG: bool = Field(False)
+    SERVER_LOG_LEVEL: str = Field("info")
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = Field(30)
+    # Reinicia cada worker tras N solicitudes (None: nunca) y limita las conexiones abiertas
+    SERVER_LIMIT_MAX_REQUESTS: Optional[int] = Field(None)
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = Field(None)
+    SERVER_FORWARDED_ALLOW_IPS: str = Field("127.0.0.1")
 
     # Validación para convertir el valor de DEBUG correctamente
     @field_validator("DEBUG", mode="before")
@@ -4,7 +4,8 @@ Este módulo define las constantes utilizadas en la aplicación.
 Incluye mensajes de error, configuraciones para validaciones y ejemplos de datos,
 para facilitar la reutilización de estos valores en toda la aplicación.
 """
-from fastapi import status
+# starlette.status tiene los mismos códigos que fastapi.status sin importar todo FastAPI
+from starlette import status
 
 # Mensajes de error generales
 ERROR_INTERNAL_SERVER = "Internal Server Error"
@@ -12,6 +13,7 @@ ERROR_INTERNAL_SERVER = "Internal Server Error"
 # Mensajes de error específicos para base de datos
 ERROR_INVALID_DATABASE_URL = "Invalid DATABASE_URL: {}"
 ERROR_DATABASE_URL_VALIDATION_FAILED = "DATABASE_URL validation failed"
+ERROR_DATABASE_URL_MISSING = "DATABASE_URL is not set; define it in the environment or in .env"
 ERROR_SQLALCHEMY = "SQLAlchemy error: {}"
 ERROR_UNEXPECTED_DB_SESSION = "Unexpected error while handling the database session: {}"
 
@@ -31,8 +33,18 @@ ERROR_CREATE_PAGO = "Error al crear el pago: {}"
 ERROR_PAGO_PRICE_NEGATIVE = "El precio del producto no puede ser negativo"
 ERROR_GET_PAGO = "Error al obtener el pago: {}"
 
+MAX_PAGO_BATCH_SIZE = 5000
+PAGO_BATCH_DESCRIPTION = f"Lista de pagos a registrar (máximo {MAX_PAGO_BATCH_SIZE} por lote)"
+MESSAGE_PAGO_BATCH_RESULT = "Lote procesado: {} pagos registrados, {} rechazados"
+ERROR_CREATE_PAGO_BATCH = "Error al registrar el lote de pagos: {}"
+ERROR_GET_SALDO_MENSUAL = "Error al obtener el saldo mensual del inmueble: {}"
+ERROR_REBUILD_SALDO_MENSUAL = "Error al reconstruir los saldos mensuales: {}"
+INFO_REBUILD_SALDO_MENSUAL = "Saldos mensuales reconstruidos: {} acumulados generados"
+
 # Mensajes de error para arrendatarios
 ERROR_GET_ALL_ARRENDATARIO = "Error al obtener todos los arrendatarios: {}"
+ERROR_GET_ARRENDATARIO = "Error al obtener el arrendatario: {}"
+ERROR_ARRENDATARIO_NOT_FOUND = "El arrendatario no existe"
 ERROR_CREATE_ARRENDATARIO = "Error al crear el arrendatario: {}"
 ERROR_EXIST_ARRENDATARIO_BY_NAME = "Error al verificar la existencia del arrendatario: {}"
 
@@ -46,10 +58,12 @@ PHONE_COMMENT = "Número de teléfono del proveedor"
 PHONE_MAX_LENGTH = 12
 PHONE_REGEX = r'^\+?\d{1,12}$'
 PHONE_LENGTH_ERROR = "El número de teléfono no debe exceder los 12 caracteres"
-PHONE_FORMAT_ERROR = (
-    "El formato del número de teléfono es inválido"
-)
+PHONE_FORMAT_ERROR = "El teléfono debe contener solo números y tener un formato válido."
 NAME_MIN_LENGTH = 3
+NAME_MAX_LENGTH = 100
+NAME_REGEX = r'^[A-Za-z\s]+$'
+DOCUMENT_MAX_LENGTH = 20
+EMAIL_MAX_LENGTH = 50
 EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 NAME_LENGTH_ERROR = "El {key} debe tener al menos {min_length} caracteres"
 NAME_FORMAT_ERROR = "El {key} solo debe contener letras y espacios"
@@ -59,6 +73,10 @@ EMAIL_FORMAT_ERROR = (
 )
 DATE_FORMAT_ERROR = "El formato de la fecha es incorrecto. Debe ser dd/mm/yyyy."
 CODE_FORMAT_ERROR = "El código del inmueble debe ser alfanumérico."
+CODE_REGEX = r'^[a-zA-Z0-9]+$'
+DOCUMENT_FORMAT_ERROR = (
+    "El documento de identificación debe contener solo números y tener entre 1 y 20 caracteres."
+)
 
 # Validaciones de precio
 PRICE_GT = 0
@@ -83,11 +101,11 @@ DOCUMENT_REGEX = r'^\d+$'
 # Estados HTTP
 STATUS_SUCCESS = status.HTTP_200_OK
 STATUS_BAD_REQUEST = status.HTTP_400_BAD_REQUEST
+STATUS_NOT_FOUND = status.HTTP_404_NOT_FOUND
+STATUS_CONFLICT = status.HTTP_409_CONFLICT
+STATUS_UNPROCESSABLE_ENTITY = status.HTTP_422_UNPROCESSABLE_ENTITY
 STATUS_INTERNAL_SERVER_ERROR = status.HTTP_500_INTERNAL_SERVER_ERROR
 
-# Mensajes de error de validación
-DOCUMENT_FORMAT_ERROR = "El documento de identificación debe contener solo números."
-
 # Ejemplos de datos
 EXAMPLE_DATA_PAGO = {
     "documento_identificacion_arrendatario": "1036946622",
@@ -109,5 +127,133 @@ MESSAGE_PAGO_CREATED_ERROR = "El pago no se pudo registrar"
 MESSAGE_ARRENDATARIO_CREATED_SUCCESS = "Arrendatario registrado correctamente"
 MESSAGE_ARRENDATARIO_CREATED_ERROR = "El arrendatario no se pudo registrar {}"
 
+MESSAGE_PAGOS_LISTED = "Pagos consultados correctamente"
+MESSAGE_ARRENDATARIOS_LISTED = "Arrendatarios consultados correctamente"
+MESSAGE_ARRENDATARIO_FOUND = "Arrendatario consultado correctamente"
+INCLUIR_PAGOS_DESCRIPTION = "Incluir los pagos de cada arrendatario en la respuesta"
+
+# Paginación por cursor (keyset)
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+LIMIT_DESCRIPTION = "Cantidad máxima de registros a retornar en la página"
+AFTER_DESCRIPTION = "Cursor de la última fila recibida; se retornan las filas posteriores"
+NEXT_CURSOR_DESCRIPTION = "Cursor para solicitar la siguiente página, null si no hay más datos"
+
+# Exportación de pagos
+EXPORT_BATCH_SIZE = 2000
+EXPORT_PAGO_COLUMNS = (
+    "id",
+    "documento_identificacion_arrendatario",
+    "codigo_inmueble",
+    "valor_pagado",
+    "fecha_pago"
+)
+EXPORT_FORMAT_DESCRIPTION = "Formato de la exportación: ndjson o csv"
+ERROR_EXPORT_PAGO = "Error al exportar los pagos: {}"
+
+# Pool de conexiones
+MESSAGE_POOL_STATS = "Estadísticas del pool de conexiones"
+MESSAGE_CACHE_STATS = "Estadísticas de las cachés en memoria"
+INFO_POOL_WARMED_UP = "Pool de conexiones precalentado con {} conexiones"
+ERROR_POOL_WARM_UP = "No se pudo precalentar el pool de conexiones: {}"
+
+# Réplica de lectura
+WARNING_REPLICA_UNAVAILABLE = "Réplica de lectura no disponible, las lecturas usan el primario: {}"
+WARNING_REPLICA_LAG = (
+    "Réplica de lectura con {:.1f} s de retraso (máximo {} s), las lecturas usan el primario"
+)
+INFO_REPLICA_AVAILABLE = "Réplica de lectura disponible ({:.1f} s de retraso)"
+
+# Importación masiva de arrendatarios (CSV con columnas
+# documento_identificacion_arrendatario, nombre_completo, email, telefono)
+MAX_IMPORT_REJECTED_REPORT = 1000
+IMPORT_FILE_DESCRIPTION = (
+    "Archivo CSV con encabezado y columnas documento_identificacion_arrendatario, "
+    "nombre_completo, email, telefono"
+)
+MESSAGE_IMPORT_ARRENDATARIOS = (
+    "Importación finalizada: {} insertados, {} actualizados, {} rechazados"
+)
+ERROR_IMPORT_ARRENDATARIOS = "Error al importar los arrendatarios: {}"
+IMPORT_DUPLICATE_DOCUMENT_ERROR = "El documento está repetido en el archivo"
+IMPORT_DUPLICATE_EMAIL_ERROR = "El email está repetido en el archivo"
+IMPORT_EMAIL_EXISTS_ERROR = "El email ya pertenece a otro arrendatario"
+
+# Versiones de tabla (ETag de los listados)
+TABLA_PAGOS = "pagos"
+TABLA_ARRENDATARIOS = "arrendatarios"
+IF_NONE_MATCH_DESCRIPTION = (
+    "ETag de la última respuesta recibida; si no hubo cambios se responde 304"
+)
+ERROR_GET_VERSION_TABLA = "Error al obtener la versión de la tabla: {}"
+ERROR_BUMP_VERSION_TABLA = "Error al incrementar la versión de la tabla: {}"
+
+# Notificaciones de cambios entre workers (LISTEN/NOTIFY)
+CANAL_CAMBIOS_TABLA = "cambios_tabla"
+INFO_LISTENER_CAMBIOS = "Escuchando cambios de tablas en el canal {}"
+ERROR_LISTENER_CAMBIOS = "Se perdió la conexión del receptor de cambios: {}"
+
+# Mensajes informativos del registro de pagos
+INFO_PAGO_SOBRANTE = "Pago registrado con sobrante de ${}"
+
+# Claves de idempotencia (la ruta de cada clave es el nombre de la tabla que se escribe)
+HEADER_IDEMPOTENCY_KEY = "Idempotency-Key"
+HEADER_IDEMPOTENT_REPLAYED = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+IDEMPOTENCY_KEY_DESCRIPTION = (
+    "Clave única elegida por el cliente; al reintentar con la misma clave se responde "
+    "la respuesta guardada sin registrar de nuevo"
+)
+ERROR_IDEMPOTENCY_KEY_REUSED = "La clave de idempotencia ya se usó con otra solicitud"
+ERROR_IDEMPOTENCY_IN_PROGRESS = "Otra solicitud con la misma clave de idempotencia sigue en curso"
+ERROR_IDEMPOTENCY = "Error al procesar la clave de idempotencia: {}"
+INFO_PURGE_IDEMPOTENCIA = "Claves de idempotencia expiradas eliminadas: {}"
+
+# Particiones mensuales de pagos
+# Mes consultado por defecto en los pagos de un inmueble
+ANIO_CONSULTA_PAGOS = 2024
+MES_CONSULTA_PAGOS = 10
+INFO_PARTICIONES_CREADAS = "Particiones mensuales de pagos creadas: {}"
+INFO_PARTICIONADO_LOTE = (
+    "Pagos copiados a la tabla particionada hasta el ID {} de {} ({} filas en el lote)"
+)
+INFO_PARTICIONADO_COMPLETO = (
+    "Copia completa hasta el ID {}; ejecute `alembic upgrade head` para intercambiar las tablas"
+)
+INFO_PARTICIONADO_NO_PENDIENTE = "No hay una tabla de pagos particionada pendiente de copiar"
+ERROR_PARTICIONES_PAGOS = "Error al crear las particiones mensuales de pagos: {}"
+ERROR_PARTICIONADO_PAGOS = "Error al copiar los pagos a la tabla particionada: {}"
+
+# Reportes de recaudo
+VALOR_ARRIENDO = 1000000
+TABLA_REPORTES = "reportes"
+MAX_REPORTE_MESES = 24
+MESSAGE_REPORTE_PAGOS = "Reporte de pagos generado correctamente"
+ERROR_REPORTE_PAGOS = "Error al generar el reporte de pagos: {}"
+ERROR_REPORTE_RANGO = (
+    "La fecha inicial debe ser anterior o igual a la final y el rango no puede superar "
+    f"{MAX_REPORTE_MESES} meses"
+)
+AGRUPACION_DESCRIPTION = "Agrupación del reporte: inmueble, arrendatario o mes"
+REPORTE_DESDE_DESCRIPTION = "Fecha del primer mes del reporte (se toma el mes completo)"
+REPORTE_HASTA_DESCRIPTION = "Fecha del último mes del reporte (se toma el mes completo)"
+
+# Métricas
+METRICS_PATH = "/metrics"
+
+# Estadísticas de consultas por solicitud
+HEADER_DB_QUERIES = "X-DB-Queries"
+HEADER_DB_TIME = "X-DB-Time"
+WARNING_SLOW_QUERY = "Consulta lenta ({:.1f} ms): {} | parámetros: {}"
+WARNING_REPEATED_QUERY = "Posible N+1 en {}: la sentencia se ejecutó {} veces: {}"
+ERROR_REPEATED_QUERY = "La sentencia se ejecutó más de {} veces en la misma solicitud: {}"
+MAX_LOGGED_PARAMETERS_LENGTH = 1000
+
+# Servidor de producción
+INFO_SERVER_START = (
+    "Iniciando servidor en {}:{} con {} workers (loop={}, http={}); "
+    "hasta {} conexiones a la base de datos en total"
+)
+
 # Mensajes adicionales
 MESSAGE_PHONE_EXISTS = "El teléfono del proveedor ya existe, debes escoger otro"
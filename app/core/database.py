@@ -2,20 +2,42 @@
 Este módulo define la configuración de la base de datos y la conexión usando SQLAlchemy.
 
 Proporciona un motor de base de datos, una fábrica de sesiones, y un gestor para
-obtener una sesión de base de datos de manera segura.
+obtener una sesión de base de datos de manera segura. También expone un motor y
+sesiones asíncronas (asyncpg) para los endpoints `async def`.
+
+Los motores se crean en el primer uso (`get_engine`, `get_async_engine`), no al
+importar el módulo, para que el arranque de los workers y de los comandos sea rápido.
+
+Si se configura una réplica de lectura (`SQLALCHEMY_REPLICA_URL`), los listados usan
+`get_async_read_db`, que entrega una sesión de la réplica mientras esta responda y su
+retraso no supere `REPLICA_MAX_LAG`, y del primario en caso contrario. Las escrituras
+y las lecturas que deben ver lo recién escrito siguen usando `get_async_db`.
 """
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Dict, Optional
 from pydantic import BaseModel, PostgresDsn, ValidationError
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.core.config import config
-from app.core.logger import log_error
+from app.core.logger import log_error, log_info, log_warning
+from app.core.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 from app.core.constants import (
     ERROR_INVALID_DATABASE_URL,
     ERROR_DATABASE_URL_VALIDATION_FAILED,
+    ERROR_DATABASE_URL_MISSING,
     ERROR_SQLALCHEMY,
-    ERROR_UNEXPECTED_DB_SESSION
+    ERROR_UNEXPECTED_DB_SESSION,
+    INFO_REPLICA_AVAILABLE,
+    WARNING_REPLICA_LAG,
+    WARNING_REPLICA_UNAVAILABLE
 )
 
 # Modelo Pydantic para validar la URL de la base de datos
@@ -23,21 +45,287 @@ class Settings(BaseModel):
     """Clase para validar la configuración de la base de datos"""
     database_url: PostgresDsn
 
-DATABASE_URL = config.SQLALCHEMY_DATABASE_URL
+# Los motores y las fábricas de sesiones se crean la primera vez que se usan, de modo
+# que importar este módulo (rutas, modelos, alembic, pruebas, comandos) no valida el
+# DSN ni carga los drivers.
+_lock = threading.Lock()
+_database_url: Optional[str] = None
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_replica_engine: Optional[AsyncEngine] = None
+_replica_session_factory: Optional[async_sessionmaker] = None
+
+# Segundos de retraso de la réplica; 0 si ya aplicó todo lo recibido del primario (sin
+# esto, un primario sin escrituras haría crecer el retraso aparente indefinidamente)
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+def get_database_url() -> str:
+    """
+    Valida y retorna la URL de la base de datos configurada.
+
+    Returns:
+        str: URL de la base de datos.
+
+    Raises:
+        ValueError: Si la URL no está definida o no es válida.
+    """
+    global _database_url  # pylint: disable=global-statement
+    if _database_url is None:
+        if config.SQLALCHEMY_DATABASE_URL is None:
+            log_error(ERROR_DATABASE_URL_MISSING)
+            raise ValueError(ERROR_DATABASE_URL_MISSING)
+        try:
+            settings = Settings(database_url=config.SQLALCHEMY_DATABASE_URL)
+        except ValidationError as e:
+            log_error(ERROR_INVALID_DATABASE_URL.format(e))
+            raise ValueError(ERROR_DATABASE_URL_VALIDATION_FAILED) from e
+        _database_url = str(settings.database_url)  # Convertir a cadena
+    return _database_url
+
+
+def pool_options() -> dict:
+    """
+    Parámetros del pool compartidos por el motor síncrono y el asíncrono.
+    """
+    return {
+        "pool_size": config.MIN_CONNECTIONS_COUNT,
+        "max_overflow": max(config.MAX_CONNECTIONS_COUNT - config.MIN_CONNECTIONS_COUNT, 0),
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING
+    }
+
+
+def get_engine() -> Engine:
+    """
+    Retorna el motor síncrono (psycopg2), creándolo en el primer uso.
+
+    Returns:
+        Engine: Motor de la base de datos.
+    """
+    global _engine, _session_factory  # pylint: disable=global-statement
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                # Cambia echo a True solo para depuración
+                engine = create_engine(
+                    get_database_url(), echo=False, poolclass=InstrumentedQueuePool,
+                    **pool_options()
+                )
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
+
+
+def get_sessionmaker() -> sessionmaker:
+    """
+    Retorna la fábrica de sesiones síncronas, creando el motor si hace falta.
+
+    Returns:
+        sessionmaker: Fábrica de sesiones ligada al motor síncrono.
+    """
+    get_engine()
+    return _session_factory
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Retorna el motor asíncrono (asyncpg) sobre el mismo DSN, creándolo en el primer uso.
+
+    Returns:
+        AsyncEngine: Motor asíncrono de la base de datos.
+    """
+    global _async_engine, _async_session_factory  # pylint: disable=global-statement
+    if _async_engine is None:
+        with _lock:
+            if _async_engine is None:
+                async_url = make_url(get_database_url()).set(drivername="postgresql+asyncpg")
+                engine = create_async_engine(
+                    async_url, echo=False, poolclass=InstrumentedAsyncAdaptedQueuePool,
+                    **pool_options()
+                )
+                _async_session_factory = async_sessionmaker(
+                    bind=engine, autoflush=False, expire_on_commit=False
+                )
+                _async_engine = engine
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Retorna la fábrica de sesiones asíncronas, creando el motor si hace falta.
+
+    Returns:
+        async_sessionmaker: Fábrica de sesiones ligada al motor asíncrono.
+    """
+    get_async_engine()
+    return _async_session_factory
+
+
+def SessionLocal() -> Session:  # pylint: disable=invalid-name
+    """
+    Crea una sesión síncrona; conserva el nombre de la antigua fábrica de sesiones.
+    """
+    return get_sessionmaker()()
+
+
+def AsyncSessionLocal() -> AsyncSession:  # pylint: disable=invalid-name
+    """
+    Crea una sesión asíncrona; conserva el nombre de la antigua fábrica de sesiones.
+    """
+    return get_async_sessionmaker()()
+
+
+def get_async_replica_engine() -> Optional[AsyncEngine]:
+    """
+    Retorna el motor asíncrono de la réplica de lectura, creándolo en el primer uso.
+
+    Returns:
+        Optional[AsyncEngine]: Motor de la réplica, o None si no hay réplica configurada.
+    """
+    global _replica_engine, _replica_session_factory  # pylint: disable=global-statement
+    if _replica_engine is None and config.SQLALCHEMY_REPLICA_URL is not None:
+        with _lock:
+            if _replica_engine is None:
+                replica_url = make_url(str(config.SQLALCHEMY_REPLICA_URL)).set(
+                    drivername="postgresql+asyncpg"
+                )
+                engine = create_async_engine(
+                    replica_url, echo=False, poolclass=InstrumentedAsyncAdaptedQueuePool,
+                    connect_args={"timeout": config.REPLICA_CHECK_TIMEOUT}, **pool_options()
+                )
+                _replica_session_factory = async_sessionmaker(
+                    bind=engine, autoflush=False, expire_on_commit=False, info={"replica": True}
+                )
+                _replica_engine = engine
+    return _replica_engine
+
+
+class EstadoReplica:
+    """
+    Resultado de la última revisión de la réplica, compartido por las solicitudes del
+    proceso para no consultar el retraso en cada lectura.
+    """
+    def __init__(self):
+        self.disponible = False
+        self.retraso: Optional[float] = None
+        self.revisada = float("-inf")
+        self.revisando = False
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """
+        Retorna el estado para el endpoint de monitoreo y las métricas.
+        """
+        return {"disponible": self.disponible, "retraso": self.retraso}
+
+
+estado_replica = EstadoReplica()
+
 
-try:
-    settings = Settings(database_url=DATABASE_URL)
-    DATABASE_URL_STR = str(settings.database_url)  # Convertir a cadena
-except ValidationError as e:
-    log_error(ERROR_INVALID_DATABASE_URL.format(e))
-    raise ValueError(ERROR_DATABASE_URL_VALIDATION_FAILED) from e
+async def _medir_retraso_replica(engine: AsyncEngine) -> float:
+    async with engine.connect() as connection:
+        return float((await connection.execute(REPLICA_LAG_SQL)).scalar())
 
-# Crear el motor de la base de datos con la URL proporcionada
-# Cambia echo a True solo para depuración
-engine = create_engine(DATABASE_URL_STR, echo=False)
 
-# Crear una fábrica de sesiones para manejar la conexión con la base de datos
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async def revisar_replica(engine: AsyncEngine):
+    """
+    Consulta el retraso de la réplica y actualiza `estado_replica`. Registra una
+    advertencia solo cuando la réplica deja de estar disponible.
+
+    Args:
+        engine (AsyncEngine): Motor de la réplica.
+    """
+    try:
+        retraso = await asyncio.wait_for(
+            _medir_retraso_replica(engine), timeout=config.REPLICA_CHECK_TIMEOUT
+        )
+    except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+        disponible, retraso = False, None
+        motivo = WARNING_REPLICA_UNAVAILABLE.format(repr(e))
+    else:
+        disponible = retraso <= config.REPLICA_MAX_LAG
+        motivo = WARNING_REPLICA_LAG.format(retraso, config.REPLICA_MAX_LAG)
+    if disponible and not estado_replica.disponible:
+        log_info(INFO_REPLICA_AVAILABLE.format(retraso))
+    elif not disponible and (estado_replica.disponible or estado_replica.revisada == float("-inf")):
+        log_warning(motivo)
+    estado_replica.disponible, estado_replica.retraso = disponible, retraso
+
+
+async def replica_disponible() -> bool:
+    """
+    Indica si las lecturas pueden ir a la réplica, revisándola si el último resultado
+    tiene más de `REPLICA_CHECK_INTERVAL` segundos. Mientras una solicitud la revisa,
+    las demás usan el resultado anterior.
+
+    Returns:
+        bool: True si hay réplica configurada, responde y su retraso es aceptable.
+    """
+    engine = get_async_replica_engine()
+    if engine is None:
+        return False
+    if (not estado_replica.revisando
+            and time.monotonic() - estado_replica.revisada >= config.REPLICA_CHECK_INTERVAL):
+        estado_replica.revisando = True
+        try:
+            await revisar_replica(engine)
+        finally:
+            estado_replica.revisada = time.monotonic()
+            estado_replica.revisando = False
+    return estado_replica.disponible
+
+
+def es_sesion_replica(db: AsyncSession) -> bool:
+    """
+    Indica si la sesión lee de la réplica.
+
+    Args:
+        db (AsyncSession): Sesión entregada por `get_async_read_db`.
+
+    Returns:
+        bool: True si la sesión está ligada a la réplica de lectura.
+    """
+    return db.info.get("replica", False)
+
+
+def engines_creados() -> Dict[str, Engine]:
+    """
+    Retorna los motores ya creados, sin crear los que faltan.
+
+    Returns:
+        Dict[str, Engine]: Motor síncrono ("sync"), `sync_engine` del asíncrono ("async")
+        y de la réplica ("replica").
+    """
+    engines = {}
+    if _engine is not None:
+        engines["sync"] = _engine
+    if _async_engine is not None:
+        engines["async"] = _async_engine.sync_engine
+    if _replica_engine is not None:
+        engines["replica"] = _replica_engine.sync_engine
+    return engines
+
+
+async def dispose_engines():
+    """
+    Cierra las conexiones de los motores que se hayan creado.
+    """
+    if _replica_engine is not None:
+        await _replica_engine.dispose()
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+
 
 # Crear la base declarativa para definir los modelos de la base de datos
 Base = declarative_base()
@@ -60,3 +348,47 @@ def get_db() -> Session:
         raise
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Proporciona una sesión asíncrona de base de datos para endpoints `async def`.
+
+    Yields:
+        AsyncSession: Una sesión asíncrona de base de datos SQLAlchemy.
+    """
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    except SQLAlchemyError as e:
+        log_error(ERROR_SQLALCHEMY.format(e))
+        raise
+    except Exception as e:
+        log_error(ERROR_UNEXPECTED_DB_SESSION.format(e))
+        raise
+    finally:
+        await db.close()
+
+
+async def get_async_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Proporciona una sesión asíncrona para los listados: de la réplica de lectura si está
+    disponible, o del primario si no hay réplica, no responde o está atrasada.
+
+    Yields:
+        AsyncSession: Una sesión asíncrona de base de datos SQLAlchemy.
+    """
+    if await replica_disponible():
+        db = _replica_session_factory()
+    else:
+        db = AsyncSessionLocal()
+    try:
+        yield db
+    except SQLAlchemyError as e:
+        log_error(ERROR_SQLALCHEMY.format(e))
+        raise
+    except Exception as e:
+        log_error(ERROR_UNEXPECTED_DB_SESSION.format(e))
+        raise
+    finally:
+        await db.close()
@@ -0,0 +1,92 @@
+"""
+Este módulo define las utilidades de ETag de los listados.
+
+El ETag de un listado se deriva de la versión de la tabla consultada, de modo que
+se puede comparar con `If-None-Match` sin leer las filas. Las respuestas sin versión,
+como los reportes, usan un ETag derivado de su contenido.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+from app.core.cache import EntradaRespuesta
+
+
+def build_etag(tabla: str, version: int) -> str:
+    """
+    Construye el ETag débil correspondiente a la versión de una tabla.
+
+    Args:
+        tabla (str): Nombre de la tabla listada.
+        version (int): Versión actual de la tabla.
+
+    Returns:
+        str: ETag con el formato `W/"<tabla>-<version>"`.
+    """
+    return f'W/"{tabla}-{version}"'
+
+
+def build_etag_contenido(body: bytes) -> str:
+    """
+    Construye el ETag débil de una respuesta a partir de su contenido.
+
+    Args:
+        body (bytes): Cuerpo serializado de la respuesta.
+
+    Returns:
+        str: ETag con el formato `W/"<hash>"`.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica si el encabezado `If-None-Match` coincide con el ETag actual.
+
+    Usa la comparación débil, que es la que aplica a `If-None-Match`.
+
+    Args:
+        if_none_match (Optional[str]): Valor del encabezado enviado por el cliente.
+        etag (str): ETag actual del recurso.
+
+    Returns:
+        bool: True si el cliente ya tiene la versión actual.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etiquetas = {etiqueta.strip().removeprefix("W/") for etiqueta in if_none_match.split(",")}
+    return etag.removeprefix("W/") in etiquetas
+
+
+def respuesta_no_modificada(etag: str) -> Response:
+    """
+    Construye la respuesta `304 Not Modified` de un listado.
+
+    Args:
+        etag (str): ETag actual del listado.
+
+    Returns:
+        Response: Respuesta sin cuerpo con el ETag.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def respuesta_cacheada(entrada: EntradaRespuesta, if_none_match: Optional[str]) -> Response:
+    """
+    Construye la respuesta de un listado a partir de la caché de respuestas.
+
+    Args:
+        entrada (EntradaRespuesta): Respuesta guardada y su ETag.
+        if_none_match (Optional[str]): Valor del encabezado enviado por el cliente.
+
+    Returns:
+        Response: `304 Not Modified` si el cliente ya la tiene, o el cuerpo guardado.
+    """
+    if etag_coincide(if_none_match, entrada.etag):
+        return respuesta_no_modificada(entrada.etag)
+    return Response(
+        content=entrada.body, media_type="application/json", headers={"ETag": entrada.etag}
+    )
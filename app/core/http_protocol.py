@@ -0,0 +1,62 @@
+"""
+Este módulo define los protocolos HTTP de uvicorn usados por el servidor de producción.
+
+Con varios workers uvicorn crea el socket de escucha con `socket.socket(family)`, cuyo
+`proto` es 0, y asyncio solo activa TCP_NODELAY en las conexiones aceptadas cuando es
+IPPROTO_TCP. Sin TCP_NODELAY, el cuerpo de cada respuesta (que se escribe después de los
+encabezados) espera el ACK retardado del cliente y las conexiones keep-alive suman unos
+40 ms por solicitud. Estos protocolos activan TCP_NODELAY en cada conexión.
+"""
+import asyncio
+import socket
+from typing import Type, Union
+
+from uvicorn.protocols.http.h11_impl import H11Protocol
+
+
+class _NoDelayMixin:
+    """
+    Activa TCP_NODELAY en el socket de la conexión antes de atenderla.
+    """
+    def connection_made(self, transport):  # pylint: disable=missing-function-docstring
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().connection_made(transport)
+
+
+class NoDelayH11Protocol(_NoDelayMixin, H11Protocol):
+    """
+    `H11Protocol` con TCP_NODELAY.
+    """
+
+
+try:
+    from uvicorn.protocols.http.httptools_impl import HttpToolsProtocol
+except ImportError:
+    HttpToolsProtocol = None
+else:
+    class NoDelayHttpToolsProtocol(_NoDelayMixin, HttpToolsProtocol):
+        """
+        `HttpToolsProtocol` con TCP_NODELAY.
+        """
+
+
+def protocolo_http(nombre: str) -> Union[str, Type[asyncio.Protocol]]:
+    """
+    Traduce el valor de `SERVER_HTTP` al protocolo con TCP_NODELAY equivalente.
+
+    Args:
+        nombre (str): "auto", "h11" o "httptools"; otro valor se pasa sin cambios a uvicorn.
+
+    Returns:
+        Union[str, Type[asyncio.Protocol]]: Clase del protocolo para `uvicorn.run(http=...)`,
+        o el nombre original si no hay un equivalente (uvicorn informará el error).
+    """
+    if nombre == "auto":
+        nombre = "h11" if HttpToolsProtocol is None else "httptools"
+    if nombre == "h11":
+        return NoDelayH11Protocol
+    if nombre == "httptools" and HttpToolsProtocol is not None:
+        return NoDelayHttpToolsProtocol
+    return nombre
@@ -1,16 +1,99 @@
 """
 Este módulo proporciona funciones para registrar mensajes de log.
 
-Incluye funciones para registrar mensajes informativos y mensajes de error
+Incluye funciones para registrar mensajes informativos, advertencias y mensajes de error
 usando la biblioteca estándar `logging` de Python.
-"""
 
+Los mensajes no se escriben desde el hilo de la solicitud: un `QueueHandler` los
+encola y un `QueueListener` en un hilo propio los formatea como JSON (una línea por
+mensaje) y los escribe en stderr. El nivel general y el de cada logger se toman de
+`Config` (`LOG_LEVEL` y `LOG_LEVELS`), y los mensajes informativos del camino crítico
+se registran con muestreo (`log_info_muestreado`).
+"""
+import atexit
 import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+import orjson
+
+from app.core.config import config
+
+# Atributos propios de LogRecord; los demás llegan por `extra` y se agregan al JSON
+ATRIBUTOS_LOG_RECORD = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "taskName"
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada registro como un objeto JSON en una sola línea.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entrada = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process
+        }
+        if record.exc_info:
+            entrada["exc_info"] = self.formatException(record.exc_info)
+        for clave, valor in vars(record).items():
+            if clave not in ATRIBUTOS_LOG_RECORD:
+                entrada[clave] = valor
+        return orjson.dumps(entrada, default=str).decode()
+
+
+class ColaHandler(QueueHandler):
+    """
+    Encola los registros sin formatearlos; el formato se aplica en el hilo del receptor.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Solo se resuelven los argumentos, que podrían cambiar antes de escribirse
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configurar_logging() -> QueueListener:
+    """
+    Reemplaza los handlers del logger raíz por la cola y arranca el hilo que escribe.
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+    Returns:
+        QueueListener: Receptor de la cola; se detiene al salir del proceso.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    if config.LOG_JSON:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+
+    cola = queue.SimpleQueue()
+    raiz = logging.getLogger()
+    for anterior in list(raiz.handlers):
+        raiz.removeHandler(anterior)
+    raiz.addHandler(ColaHandler(cola))
+    raiz.setLevel(config.LOG_LEVEL.upper())
+    for nombre, nivel in config.LOG_LEVELS.items():
+        logging.getLogger(nombre).setLevel(nivel.upper())
+
+    receptor = QueueListener(cola, handler, respect_handler_level=True)
+    receptor.start()
+    # Escribe lo que quede en la cola antes de terminar el proceso
+    atexit.register(receptor.stop)
+    return receptor
+
+
+listener = configurar_logging()
 logger = logging.getLogger(__name__)
 
 def log_info(message: str):
@@ -22,6 +105,29 @@ def log_info(message: str):
     """
     logger.info(message)
 
+def log_info_muestreado(message: str, tasa: Optional[float] = None):
+    """
+    Función para registrar un mensaje informativo de un camino crítico, solo en una
+    fracción de las llamadas. El registro incluye la tasa para poder escalar los conteos.
+
+    Args:
+        message (str): El mensaje informativo a registrar.
+        tasa (Optional[float]): Fracción de llamadas que se registran (por defecto
+            `LOG_SAMPLE_RATE`).
+    """
+    tasa = config.LOG_SAMPLE_RATE if tasa is None else tasa
+    if logger.isEnabledFor(logging.INFO) and random.random() < tasa:
+        logger.info(message, extra={"muestreo": tasa})
+
+def log_warning(message: str):
+    """
+    Función para registrar un mensaje de advertencia.
+
+    Args:
+        message (str): El mensaje de advertencia a registrar.
+    """
+    logger.warning(message)
+
 def log_error(message: str):
     """
     Función para registrar un mensaje de error.
@@ -0,0 +1,309 @@
+"""
+Este módulo define las métricas de la aplicación en formato de texto de Prometheus.
+
+Registra en memoria del proceso, sin colector externo:
+    - la duración de cada solicitud HTTP por método, ruta y código de estado
+      (middleware ASGI `MetricsMiddleware`);
+    - la duración de cada consulta a la base de datos por operación y tabla
+      (la miden los eventos de SQLAlchemy de `app.core.query_stats`);
+    - el estado de los pools de conexiones y de las cachés, leído al exponer las métricas.
+
+Con varios workers cada proceso tiene sus propias métricas y cada lectura de
+`/metrics` la responde uno de ellos; `process_pid` indica cuál.
+"""
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from app.core.cache import EXISTENCIA_CACHES, reporte_cache, response_cache
+from app.core.database import engines_creados, estado_replica
+from app.core.pool import pool_stats
+
+CONTENT_TYPE_METRICS = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites superiores de los buckets, en segundos
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Solicitudes que no coinciden con ninguna ruta; no se usa la URL para no crear
+# una serie por cada ruta inexistente
+RUTA_DESCONOCIDA = "<sin_ruta>"
+
+PATRON_TABLA = re.compile(r'\b(?:FROM|INTO|UPDATE|JOIN)\s+"?([A-Za-z_][\w.]*)', re.IGNORECASE)
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatear_etiquetas(nombres: Sequence[str], valores: Sequence[str]) -> str:
+    if not nombres:
+        return ""
+    pares = ",".join(
+        f'{nombre}="{_escapar(str(valor))}"' for nombre, valor in zip(nombres, valores)
+    )
+    return "{" + pares + "}"
+
+
+def _formatear_numero(valor: float) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class Gauge:
+    """
+    Valor que sube y baja, equivalente al tipo `gauge` de Prometheus sin etiquetas.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def add(self, delta: float):
+        """
+        Suma `delta` (negativo para restar) al valor actual.
+
+        Args:
+            delta (float): Cantidad a sumar.
+        """
+        with self._lock:
+            self.value += delta
+
+
+class Histogram:
+    """
+    Histograma con etiquetas, equivalente al tipo `histogram` de Prometheus.
+    """
+    def __init__(self, nombre: str, descripcion: str, etiquetas: Sequence[str],
+                 buckets: Sequence[float]):
+        """
+        Inicializa el histograma sin observaciones.
+
+        Args:
+            nombre (str): Nombre de la métrica.
+            descripcion (str): Texto de ayuda (`# HELP`).
+            etiquetas (Sequence[str]): Nombres de las etiquetas de cada serie.
+            buckets (Sequence[float]): Límites superiores de los buckets, ordenados.
+        """
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.etiquetas = tuple(etiquetas)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # Por serie: conteos por bucket (no acumulados, el último es +Inf), suma y total
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, valor: float, etiquetas: Tuple[str, ...]):
+        """
+        Registra una observación.
+
+        Args:
+            valor (float): Valor observado (por ejemplo, segundos).
+            etiquetas (Tuple[str, ...]): Valores de las etiquetas, en el orden declarado.
+        """
+        indice = bisect_left(self.buckets, valor)
+        with self._lock:
+            serie = self._series.get(etiquetas)
+            if serie is None:
+                serie = self._series[etiquetas] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            serie[0][indice] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def render(self) -> List[str]:
+        """
+        Retorna las líneas del histograma en formato de texto de Prometheus.
+
+        Returns:
+            List[str]: Líneas `# HELP`, `# TYPE` y las muestras de cada serie.
+        """
+        with self._lock:
+            series = [(clave, list(conteos), suma, total)
+                      for clave, (conteos, suma, total) in self._series.items()]
+        lineas = [f"# HELP {self.nombre} {self.descripcion}", f"# TYPE {self.nombre} histogram"]
+        nombres_bucket = self.etiquetas + ("le",)
+        for clave, conteos, suma, total in sorted(series):
+            acumulado = 0
+            for limite, conteo in zip(self.buckets + (float("inf"),), conteos):
+                acumulado += conteo
+                etiquetas = _formatear_etiquetas(
+                    nombres_bucket, clave + (_formatear_numero(limite),)
+                )
+                lineas.append(f"{self.nombre}_bucket{etiquetas} {acumulado}")
+            etiquetas = _formatear_etiquetas(self.etiquetas, clave)
+            lineas.append(f"{self.nombre}_sum{etiquetas} {_formatear_numero(suma)}")
+            lineas.append(f"{self.nombre}_count{etiquetas} {total}")
+        return lineas
+
+
+def render_muestras(nombre: str, descripcion: str, tipo: str,
+                    muestras: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """
+    Retorna las líneas de una métrica calculada al momento de exponerla.
+
+    Args:
+        nombre (str): Nombre de la métrica.
+        descripcion (str): Texto de ayuda (`# HELP`).
+        tipo (str): Tipo de Prometheus (`gauge` o `counter`).
+        muestras (Iterable[Tuple[Dict[str, str], float]]): Etiquetas y valor de cada serie.
+
+    Returns:
+        List[str]: Líneas de la métrica en formato de texto de Prometheus.
+    """
+    lineas = [f"# HELP {nombre} {descripcion}", f"# TYPE {nombre} {tipo}"]
+    for etiquetas, valor in muestras:
+        texto = _formatear_etiquetas(tuple(etiquetas), tuple(etiquetas.values()))
+        lineas.append(f"{nombre}{texto} {_formatear_numero(valor)}")
+    return lineas
+
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Duración de las solicitudes HTTP por método, ruta y código de estado.",
+    ("method", "route", "status"),
+    HTTP_BUCKETS
+)
+db_query_duration = Histogram(
+    "db_query_duration_seconds",
+    "Duración de las consultas a la base de datos por operación y tabla.",
+    ("operacion", "tabla"),
+    DB_BUCKETS
+)
+
+http_requests_in_progress = Gauge()
+
+
+@lru_cache(maxsize=1024)
+def etiquetar_consulta(statement: str) -> Tuple[str, str]:
+    """
+    Obtiene la operación y la tabla principal de una sentencia SQL.
+
+    Las sentencias de los repositorios son constantes, de modo que el resultado se
+    guarda por texto de la sentencia y el análisis ocurre una vez por consulta distinta.
+
+    Args:
+        statement (str): Sentencia SQL enviada al driver.
+
+    Returns:
+        Tuple[str, str]: Operación (SELECT, INSERT, WITH, ...) y tabla, o "" si no se halla.
+    """
+    partes = statement.split(None, 1)
+    operacion = partes[0].upper() if partes else ""
+    tabla = PATRON_TABLA.search(statement)
+    return operacion, tabla.group(1).lower() if tabla else ""
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide la duración de cada solicitud HTTP.
+
+    La ruta se etiqueta con su plantilla (`/api/pagos/{id}`), no con la URL recibida.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        async def send_con_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.add(1)
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_con_status)
+        finally:
+            duracion = time.perf_counter() - inicio
+            http_requests_in_progress.add(-1)
+            route = scope.get("route")
+            http_request_duration.observe(duracion, (
+                scope["method"], getattr(route, "path", RUTA_DESCONOCIDA), str(status)
+            ))
+
+
+def _metricas_pools() -> List[str]:
+    stats = {nombre: pool_stats(engine) for nombre, engine in engines_creados().items()}
+    definiciones = (
+        ("db_pool_size", "Tamaño fijo del pool de conexiones.", "gauge", "size"),
+        ("db_pool_checked_out", "Conexiones del pool en uso.", "gauge", "checked_out"),
+        ("db_pool_overflow", "Conexiones abiertas por encima del tamaño del pool.", "gauge",
+         "overflow"),
+        ("db_pool_checkouts_total", "Conexiones entregadas por el pool.", "counter", "checkouts"),
+        ("db_pool_timeouts_total", "Solicitudes de conexión que agotaron el timeout.", "counter",
+         "timeouts"),
+    )
+    lineas = []
+    for nombre, descripcion, tipo, clave in definiciones:
+        lineas += render_muestras(nombre, descripcion, tipo, [
+            ({"engine": engine}, valores.get(clave, 0)) for engine, valores in stats.items()
+        ])
+    lineas += render_muestras(
+        "db_pool_wait_seconds_total", "Tiempo total esperando una conexión del pool.", "counter",
+        [({"engine": engine}, valores.get("wait_total_ms", 0) / 1000)
+         for engine, valores in stats.items()]
+    )
+    if "replica" in stats:
+        lineas += render_muestras(
+            "db_replica_available",
+            "1 si las lecturas usan la réplica (responde y su retraso es aceptable).",
+            "gauge", [({}, int(estado_replica.disponible))]
+        )
+        if estado_replica.retraso is not None:
+            lineas += render_muestras(
+                "db_replica_lag_seconds", "Retraso medido de la réplica de lectura.",
+                "gauge", [({}, estado_replica.retraso)]
+            )
+    return lineas
+
+
+def _metricas_caches() -> List[str]:
+    existencias = [(cache.nombre, cache.stats()) for cache in EXISTENCIA_CACHES]
+    respuestas = response_cache.stats()
+    reportes = reporte_cache.stats()
+    todas = existencias + [("respuestas", respuestas), ("reportes", reportes)]
+    lineas = []
+    lineas += render_muestras("cache_hits_total", "Aciertos de la caché.", "counter",
+                              [({"cache": nombre}, stats["hits"]) for nombre, stats in todas])
+    lineas += render_muestras("cache_misses_total", "Fallos de la caché.", "counter",
+                              [({"cache": nombre}, stats["misses"]) for nombre, stats in todas])
+    lineas += render_muestras(
+        "cache_entries", "Entradas vigentes de la caché.", "gauge",
+        [({"cache": nombre}, stats["positivos"] + stats["negativos"])
+         for nombre, stats in existencias]
+        + [({"cache": "respuestas"}, respuestas["entradas"]),
+           ({"cache": "reportes"}, reportes["entradas"])]
+    )
+    lineas += render_muestras("response_cache_bytes", "Bytes usados por la caché de respuestas.",
+                              "gauge", [({}, respuestas["bytes"])])
+    lineas += render_muestras("response_cache_active",
+                              "1 si la caché de respuestas está activa (receptor conectado).",
+                              "gauge", [({}, int(respuestas["activa"]))])
+    return lineas
+
+
+def render_metrics() -> str:
+    """
+    Retorna todas las métricas del proceso en formato de texto de Prometheus.
+
+    Returns:
+        str: Cuerpo de la respuesta de `/metrics`.
+    """
+    lineas = render_muestras("process_pid", "Identificador del proceso (worker) que responde.",
+                             "gauge", [({"pid": str(os.getpid())}, 1)])
+    lineas += render_muestras("http_requests_in_progress", "Solicitudes HTTP en curso.",
+                              "gauge", [({}, http_requests_in_progress.value)])
+    lineas += http_request_duration.render()
+    lineas += db_query_duration.render()
+    lineas += _metricas_pools()
+    lineas += _metricas_caches()
+    return "\n".join(lineas) + "\n"
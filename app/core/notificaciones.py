@@ -0,0 +1,144 @@
+"""
+Este módulo define el receptor de notificaciones de cambios de la base de datos.
+
+Los triggers de `pagos` y `arrendatarios` publican el nombre de la tabla en el canal
+`cambios_tabla` al confirmar cada transacción que la modifica. Cada worker mantiene
+una conexión dedicada con `LISTEN` en un hilo propio e invalida sus cachés al recibir
+una notificación, de modo que los listados se pueden cachear en varios procesos sin
+infraestructura adicional.
+
+Mientras la conexión no está establecida la caché de respuestas queda desactivada,
+ya que las notificaciones de ese lapso se pierden; al reconectar se vacía y se activa.
+"""
+import select
+import socket
+import threading
+from typing import Optional
+
+import psycopg2
+from sqlalchemy.engine import make_url
+
+from app.core.cache import EXISTENCIA_CACHES, response_cache
+from app.core.constants import (
+    CANAL_CAMBIOS_TABLA,
+    ERROR_LISTENER_CAMBIOS,
+    INFO_LISTENER_CAMBIOS,
+    TABLA_ARRENDATARIOS
+)
+from app.core.logger import log_error, log_info
+
+# Segundos entre verificaciones de la conexión y de la señal de detención
+POLL_TIMEOUT = 5.0
+# Espera máxima entre reintentos de conexión
+MAX_BACKOFF = 30.0
+
+
+def procesar_cambio(tabla: str):
+    """
+    Invalida las cachés afectadas por un cambio en una tabla.
+
+    Args:
+        tabla (str): Nombre de la tabla modificada, recibido como payload.
+    """
+    response_cache.invalidate(tabla)
+    if tabla == TABLA_ARRENDATARIOS:
+        # Un registro en otro worker vuelve obsoletos los negativos. Los positivos se
+        # conservan: solo la importación cambia emails, y esas entradas expiran por TTL
+        for cache in EXISTENCIA_CACHES:
+            cache.invalidate_negativos()
+
+
+class CambiosTablaListener:
+    """
+    Hilo que escucha el canal de cambios y reconecta con espera exponencial.
+    """
+    def __init__(self, database_url: str):
+        """
+        Inicializa el receptor sin conectarlo.
+
+        Args:
+            database_url (str): URL de la base de datos (se usa el driver psycopg2).
+        """
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self._detener = threading.Event()
+        # Despierta al hilo bloqueado en select() al detener el receptor
+        self._despertar_r, self._despertar_w = socket.socketpair()
+        self._thread: Optional[threading.Thread] = None
+        self._conexion = None
+
+    def start(self):
+        """
+        Inicia el hilo del receptor.
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="cambios-tabla-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = POLL_TIMEOUT):
+        """
+        Detiene el receptor y desactiva la caché de respuestas.
+
+        Args:
+            timeout (float): Segundos máximos de espera a que termine el hilo.
+        """
+        self._detener.set()
+        self._despertar_w.send(b"\0")
+        if self._thread is not None:
+            self._thread.join(timeout)
+        response_cache.desactivar()
+
+    def _run(self):
+        backoff = 1.0
+        while not self._detener.is_set():
+            try:
+                self._escuchar()
+                backoff = 1.0
+            except Exception as e:  # pylint: disable=broad-except
+                # El hilo no debe morir: sin receptor la caché quedaría desactivada
+                log_error(ERROR_LISTENER_CAMBIOS.format(e))
+            finally:
+                response_cache.desactivar()
+                self._cerrar()
+            if self._detener.wait(backoff):
+                break
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+    def _escuchar(self):
+        self._conexion = psycopg2.connect(
+            self.dsn, keepalives=1, keepalives_idle=30, keepalives_interval=10,
+            keepalives_count=3
+        )
+        self._conexion.autocommit = True
+        with self._conexion.cursor() as cursor:
+            cursor.execute(f"LISTEN {CANAL_CAMBIOS_TABLA}")
+        # Lo que cambió antes del LISTEN no se notificó: se parte de una caché vacía
+        response_cache.activar()
+        for cache in EXISTENCIA_CACHES:
+            cache.invalidate()
+        log_info(INFO_LISTENER_CAMBIOS.format(CANAL_CAMBIOS_TABLA))
+
+        while not self._detener.is_set():
+            listos, _, _ = select.select(
+                [self._conexion, self._despertar_r], [], [], POLL_TIMEOUT
+            )
+            if not listos:
+                # Sin actividad: una consulta vacía detecta si la conexión se perdió
+                with self._conexion.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                continue
+            if self._despertar_r in listos:
+                break
+            self._conexion.poll()
+            while self._conexion.notifies:
+                procesar_cambio(self._conexion.notifies.pop(0).payload)
+
+    def _cerrar(self):
+        if self._conexion is not None:
+            try:
+                self._conexion.close()
+            except psycopg2.Error:
+                pass
+            self._conexion = None
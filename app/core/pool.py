@@ -0,0 +1,172 @@
+"""
+Este módulo define el pool de conexiones instrumentado de la aplicación.
+
+Extiende los pools de SQLAlchemy para medir cuánto esperan las solicitudes por una
+conexión, y proporciona funciones para precalentar el pool al iniciar y para
+consultar sus estadísticas en vivo.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Indica si la tarea o el hilo actual ya está dentro de `_do_get`. Es por contexto y no
+# por hilo: en asyncio todas las solicitudes que esperan una conexión comparten el hilo
+_EN_DO_GET: ContextVar[bool] = ContextVar("en_do_get", default=False)
+
+
+class PoolWaitStats:
+    """
+    Acumula las estadísticas de espera al obtener conexiones del pool.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        """
+        Registra la espera de una solicitud de conexión.
+
+        Args:
+            wait (float): Segundos que tardó en obtenerse la conexión.
+            timed_out (bool): True si la solicitud terminó por timeout del pool.
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Retorna las estadísticas acumuladas en milisegundos.
+
+        Returns:
+            Dict[str, float]: Conteo de checkouts, timeouts y tiempos de espera.
+        """
+        with self._lock:
+            total = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(self.wait_total * 1000 / total, 3) if total else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3)
+            }
+
+
+class _WaitInstrumentedMixin:
+    """
+    Mide el tiempo que tarda `_do_get` en entregar una conexión del pool.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        """
+        Crea un pool nuevo con la misma configuración, conservando las estadísticas.
+
+        Returns:
+            Pool: El pool recreado, que comparte `wait_stats` con este.
+        """
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+    def _do_get(self):
+        # _do_get puede llamarse a sí mismo; solo se mide la llamada externa
+        if _EN_DO_GET.get():
+            return super()._do_get()
+        token = _EN_DO_GET.set(True)
+        inicio = time.perf_counter()
+        try:
+            conexion = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - inicio, timed_out=True)
+            raise
+        finally:
+            _EN_DO_GET.reset(token)
+        self.wait_stats.record(time.perf_counter() - inicio)
+        return conexion
+
+
+class InstrumentedQueuePool(_WaitInstrumentedMixin, QueuePool):
+    """
+    `QueuePool` que registra el tiempo de espera por conexión.
+    """
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitInstrumentedMixin, AsyncAdaptedQueuePool):
+    """
+    `AsyncAdaptedQueuePool` que registra el tiempo de espera por conexión.
+    """
+
+
+def pool_stats(engine: Engine) -> Dict[str, float]:
+    """
+    Obtiene las estadísticas en vivo del pool de un motor.
+
+    Args:
+        engine (Engine): Motor síncrono (o `sync_engine` de un motor asíncrono).
+
+    Returns:
+        Dict[str, float]: Tamaño, conexiones en uso, overflow y tiempos de espera.
+    """
+    pool = engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,  # pylint: disable=protected-access
+        "timeout_s": pool.timeout()
+    }
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        stats.update(wait_stats.as_dict())
+    return stats
+
+
+def warm_up_pool(engine: Engine, connections: int):
+    """
+    Abre `connections` conexiones a la vez y las devuelve al pool.
+
+    Args:
+        engine (Engine): Motor cuyo pool se precalienta.
+        connections (int): Cantidad de conexiones a abrir.
+    """
+    abiertas = []
+    try:
+        for _ in range(connections):
+            abiertas.append(engine.connect())
+    finally:
+        for conexion in abiertas:
+            conexion.close()
+
+
+async def warm_up_async_pool(engine: AsyncEngine, connections: int):
+    """
+    Abre `connections` conexiones asíncronas a la vez y las devuelve al pool.
+
+    Args:
+        engine (AsyncEngine): Motor asíncrono cuyo pool se precalienta.
+        connections (int): Cantidad de conexiones a abrir.
+    """
+    abiertas = []
+    try:
+        for _ in range(connections):
+            abiertas.append(await engine.connect())
+    finally:
+        for conexion in abiertas:
+            await conexion.close()
@@ -0,0 +1,203 @@
+"""
+Este módulo mide las consultas a la base de datos de cada solicitud.
+
+Los eventos `before_cursor_execute`/`after_cursor_execute` de SQLAlchemy miden cada
+sentencia de todos los motores (también el `sync_engine` del asíncrono) y:
+    - alimentan el histograma `db_query_duration_seconds` de `app.core.metrics`;
+    - registran con sus parámetros las sentencias que superan `QUERY_SLOW_MS`;
+    - cuentan las consultas, el tiempo y las sentencias repetidas de la solicitud en curso.
+
+`QueryStatsMiddleware` abre el conteo por solicitud, agrega los encabezados
+`X-DB-Queries` y `X-DB-Time`, y advierte cuando una misma sentencia se repite más de
+`QUERY_REPEAT_THRESHOLD` veces, el síntoma de un N+1 (por ejemplo, recorrer
+`ArrendatarioModel.pagos` en un listado). Con `QUERY_REPEAT_STRICT` la sentencia que
+supera el umbral falla con `ConsultasRepetidasError`, pensado para las pruebas.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import config
+from app.core.constants import (
+    ERROR_REPEATED_QUERY,
+    HEADER_DB_QUERIES,
+    HEADER_DB_TIME,
+    MAX_LOGGED_PARAMETERS_LENGTH,
+    WARNING_REPEATED_QUERY,
+    WARNING_SLOW_QUERY
+)
+from app.core.logger import log_warning
+from app.core.metrics import RUTA_DESCONOCIDA, db_query_duration, etiquetar_consulta
+
+# Listas de parámetros consecutivos (IN expandidos, VALUES de varias filas) en el
+# estilo de psycopg2 (%(nombre)s) o de asyncpg ($1)
+PATRON_LISTA_PARAMETROS = re.compile(
+    r"(?:%\(\w+\)s|\$\d+)(?:\s*,\s*(?:%\(\w+\)s|\$\d+))+"
+)
+PATRON_ESPACIOS = re.compile(r"\s+")
+
+
+class ConsultasRepetidasError(RuntimeError):
+    """
+    Una solicitud ejecutó la misma sentencia más veces que `QUERY_REPEAT_THRESHOLD`.
+    """
+
+
+class EstadisticasConsultas:
+    """
+    Consultas ejecutadas durante una solicitud (o un bloque `contar_consultas`).
+    """
+    def __init__(self):
+        self.consultas = 0
+        self.tiempo = 0.0
+        self.formas: Counter = Counter()
+
+    def registrar(self, forma: str, duracion: float):
+        """
+        Registra una consulta ejecutada.
+
+        Args:
+            forma (str): Sentencia normalizada (ver `forma_consulta`).
+            duracion (float): Segundos que tardó la consulta.
+        """
+        self.consultas += 1
+        self.tiempo += duracion
+        self.formas[forma] += 1
+
+    def repetidas(self, umbral: int) -> List[Tuple[str, int]]:
+        """
+        Retorna las sentencias ejecutadas más veces que el umbral.
+
+        Args:
+            umbral (int): Cantidad máxima de ejecuciones de una misma sentencia.
+
+        Returns:
+            List[Tuple[str, int]]: Sentencia normalizada y cantidad de ejecuciones.
+        """
+        return [(forma, veces) for forma, veces in self.formas.items() if veces > umbral]
+
+
+_estadisticas: ContextVar[Optional[EstadisticasConsultas]] = ContextVar(
+    "estadisticas_consultas", default=None
+)
+
+
+@contextmanager
+def contar_consultas() -> Iterator[EstadisticasConsultas]:
+    """
+    Cuenta las consultas ejecutadas dentro del bloque, incluidas las que corren en el
+    threadpool o en el motor asíncrono, que heredan el contexto.
+
+    Yields:
+        EstadisticasConsultas: Estadísticas acumuladas del bloque.
+    """
+    estadisticas = EstadisticasConsultas()
+    token = _estadisticas.set(estadisticas)
+    try:
+        yield estadisticas
+    finally:
+        _estadisticas.reset(token)
+
+
+@lru_cache(maxsize=1024)
+def forma_consulta(statement: str) -> str:
+    """
+    Normaliza una sentencia para comparar su forma, sin importar los espacios ni la
+    cantidad de parámetros de las listas.
+
+    Args:
+        statement (str): Sentencia SQL enviada al driver.
+
+    Returns:
+        str: Sentencia normalizada.
+    """
+    return PATRON_LISTA_PARAMETROS.sub("...", PATRON_ESPACIOS.sub(" ", statement).strip())
+
+
+def _antes_de_ejecutar(conn, _cursor, statement, *_):
+    # Firma de before_cursor_execute; se ignoran parameters, context y executemany
+    estadisticas = _estadisticas.get()
+    # Se falla antes de medir: un error aquí no llega a handle_error
+    if config.QUERY_REPEAT_STRICT and estadisticas is not None:
+        forma = forma_consulta(statement)
+        if estadisticas.formas[forma] >= config.QUERY_REPEAT_THRESHOLD:
+            raise ConsultasRepetidasError(ERROR_REPEATED_QUERY.format(
+                config.QUERY_REPEAT_THRESHOLD, forma
+            ))
+    conn.info.setdefault("consultas_inicio", []).append(time.perf_counter())
+
+
+def _despues_de_ejecutar(conn, _cursor, statement, parameters, *_):
+    # Firma de after_cursor_execute; se ignoran context y executemany
+    inicios = conn.info.get("consultas_inicio")
+    if not inicios:
+        return
+    duracion = time.perf_counter() - inicios.pop()
+    db_query_duration.observe(duracion, etiquetar_consulta(statement))
+    estadisticas = _estadisticas.get()
+    if estadisticas is not None:
+        estadisticas.registrar(forma_consulta(statement), duracion)
+    if duracion * 1000 >= config.QUERY_SLOW_MS:
+        log_warning(WARNING_SLOW_QUERY.format(
+            duracion * 1000, forma_consulta(statement),
+            repr(parameters)[:MAX_LOGGED_PARAMETERS_LENGTH]
+        ))
+
+
+def _error_al_ejecutar(contexto):
+    # Una consulta fallida no llega a after_cursor_execute: se descarta su inicio
+    inicios = contexto.connection.info.get("consultas_inicio") if contexto.connection else None
+    if inicios:
+        inicios.pop()
+
+
+def instrumentar_consultas():
+    """
+    Registra los eventos que miden las consultas de todos los motores. Llamarla más de
+    una vez no duplica las mediciones.
+    """
+    if event.contains(Engine, "before_cursor_execute", _antes_de_ejecutar):
+        return
+    event.listen(Engine, "before_cursor_execute", _antes_de_ejecutar)
+    event.listen(Engine, "after_cursor_execute", _despues_de_ejecutar)
+    event.listen(Engine, "handle_error", _error_al_ejecutar)
+
+
+class QueryStatsMiddleware:
+    """
+    Middleware ASGI que cuenta las consultas de cada solicitud HTTP.
+
+    Los encabezados reflejan las consultas hechas hasta que empieza la respuesta; las de
+    una respuesta en streaming se cuentan igual para la detección de sentencias repetidas.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with contar_consultas() as estadisticas:
+            async def send_con_encabezados(message):
+                if message["type"] == "http.response.start" and config.QUERY_STATS_HEADERS:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(HEADER_DB_QUERIES, str(estadisticas.consultas))
+                    headers.append(HEADER_DB_TIME, f"{estadisticas.tiempo * 1000:.2f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_con_encabezados)
+            finally:
+                route = getattr(scope.get("route"), "path", RUTA_DESCONOCIDA)
+                for forma, veces in estadisticas.repetidas(config.QUERY_REPEAT_THRESHOLD):
+                    log_warning(WARNING_REPEATED_QUERY.format(
+                        f"{scope['method']} {route}", veces, forma
+                    ))
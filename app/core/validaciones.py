@@ -0,0 +1,148 @@
+"""
+Este módulo define las validaciones de datos compartidas por esquemas y modelos.
+
+Los patrones se compilan una vez al importar el módulo. Los esquemas de entrada
+(`PagoInputSchema`, `ArrendatarioSchema`) validan cada solicitud con estas funciones;
+lo que se construye después a partir de un esquema ya validado usa la ruta confiable
+(`model_construct` en Pydantic y `construccion_confiable` en los modelos SQLAlchemy),
+de modo que cada campo se valida una sola vez por solicitud. Los validadores de los
+modelos se conservan para los objetos creados fuera de esa ruta.
+"""
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.core.constants import (
+    CODE_FORMAT_ERROR, CODE_REGEX, DOCUMENT_FORMAT_ERROR, DOCUMENT_REGEX,
+    EMAIL_FORMAT_ERROR, EMAIL_REGEX, NAME_FORMAT_ERROR, NAME_LENGTH_ERROR,
+    NAME_MIN_LENGTH, NAME_REGEX, PHONE_FORMAT_ERROR, PHONE_LENGTH_ERROR, PHONE_MAX_LENGTH,
+    PHONE_REGEX
+)
+
+DOCUMENT_PATTERN = re.compile(DOCUMENT_REGEX)
+PHONE_PATTERN = re.compile(PHONE_REGEX)
+NAME_PATTERN = re.compile(NAME_REGEX)
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+CODE_PATTERN = re.compile(CODE_REGEX)
+
+_confiable: ContextVar[bool] = ContextVar("construccion_confiable", default=False)
+
+
+@contextmanager
+def construccion_confiable() -> Iterator[None]:
+    """
+    Omite los validadores de los modelos SQLAlchemy dentro del bloque, para construir
+    objetos con datos que ya validó un esquema.
+    """
+    token = _confiable.set(True)
+    try:
+        yield
+    finally:
+        _confiable.reset(token)
+
+
+def es_confiable() -> bool:
+    """
+    Indica si se está dentro de un bloque `construccion_confiable`.
+
+    Returns:
+        bool: True si los datos ya fueron validados.
+    """
+    return _confiable.get()
+
+
+def validar_documento(documento: str) -> str:
+    """
+    Valida que el documento de identificación contenga solo números.
+
+    Args:
+        documento (str): El documento a validar.
+
+    Returns:
+        str: El documento validado.
+
+    Raises:
+        ValueError: Si el documento no cumple con el formato.
+    """
+    if not DOCUMENT_PATTERN.fullmatch(documento):
+        raise ValueError(DOCUMENT_FORMAT_ERROR)
+    return documento
+
+
+def validar_telefono(telefono: str) -> str:
+    """
+    Valida la longitud y el formato del teléfono.
+
+    Args:
+        telefono (str): El teléfono a validar.
+
+    Returns:
+        str: El teléfono validado.
+
+    Raises:
+        ValueError: Si el teléfono es demasiado largo o no cumple con el formato.
+    """
+    if len(telefono) > PHONE_MAX_LENGTH:
+        raise ValueError(PHONE_LENGTH_ERROR)
+    if not PHONE_PATTERN.fullmatch(telefono):
+        raise ValueError(PHONE_FORMAT_ERROR)
+    return telefono
+
+
+def validar_nombre(nombre: str) -> str:
+    """
+    Valida que el nombre tenga la longitud mínima y solo letras y espacios.
+
+    Args:
+        nombre (str): El nombre a validar.
+
+    Returns:
+        str: El nombre validado.
+
+    Raises:
+        ValueError: Si el nombre es demasiado corto o tiene caracteres no permitidos.
+    """
+    if not nombre or len(nombre) < NAME_MIN_LENGTH:
+        raise ValueError(
+            NAME_LENGTH_ERROR.format(key="nombre completo", min_length=NAME_MIN_LENGTH)
+        )
+    if not NAME_PATTERN.fullmatch(nombre):
+        raise ValueError(NAME_FORMAT_ERROR.format(key="nombre completo"))
+    return nombre
+
+
+def validar_email(email: str) -> str:
+    """
+    Valida el formato del email.
+
+    Args:
+        email (str): El email a validar.
+
+    Returns:
+        str: El email validado.
+
+    Raises:
+        ValueError: Si el email no cumple con el formato.
+    """
+    if not EMAIL_PATTERN.fullmatch(email):
+        raise ValueError(EMAIL_FORMAT_ERROR)
+    return email
+
+
+def validar_codigo_inmueble(codigo: str) -> str:
+    """
+    Valida que el código del inmueble sea alfanumérico.
+
+    Args:
+        codigo (str): El código a validar.
+
+    Returns:
+        str: El código validado.
+
+    Raises:
+        ValueError: Si el código no es alfanumérico.
+    """
+    if not CODE_PATTERN.fullmatch(codigo):
+        raise ValueError(CODE_FORMAT_ERROR)
+    return codigo
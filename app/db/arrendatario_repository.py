@@ -2,19 +2,217 @@
 Este módulo define el repositorio de arrendatarios para interactuar con la base de datos.
 
 Proporciona métodos para obtener todos los arrendatarios, verificar la existencia de un
-arrendatario por correo electrónico y crear un nuevo arrendatario.
+arrendatario por correo electrónico y crear un nuevo arrendatario. Incluye una
+versión asíncrona del repositorio que comparte las mismas consultas.
 """
-from typing import List
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from typing import BinaryIO, Dict, List, Optional
+from psycopg2 import Error as Psycopg2Error
+from sqlalchemy import Row, Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
+from app.core.cache import arrendatario_documento_cache, arrendatario_email_cache
 from app.core.constants import (
+    DOCUMENT_FORMAT_ERROR,
+    DOCUMENT_MAX_LENGTH,
+    DOCUMENT_REGEX,
+    EMAIL_FORMAT_ERROR,
+    EMAIL_MAX_LENGTH,
+    EMAIL_REGEX,
     ERROR_CREATE_ARRENDATARIO,
-    ERROR_EXIST_ARRENDATARIO_BY_NAME
+    ERROR_EXIST_ARRENDATARIO_BY_NAME,
+    ERROR_GET_ALL_ARRENDATARIO,
+    ERROR_GET_ARRENDATARIO,
+    ERROR_IMPORT_ARRENDATARIOS,
+    IMPORT_DUPLICATE_DOCUMENT_ERROR,
+    IMPORT_DUPLICATE_EMAIL_ERROR,
+    IMPORT_EMAIL_EXISTS_ERROR,
+    MAX_IMPORT_REJECTED_REPORT,
+    NAME_FORMAT_ERROR,
+    NAME_LENGTH_ERROR,
+    NAME_MAX_LENGTH,
+    NAME_MIN_LENGTH,
+    NAME_REGEX,
+    PHONE_FORMAT_ERROR,
+    PHONE_MAX_LENGTH,
+    PHONE_REGEX,
+    TABLA_ARRENDATARIOS
 )
 from app.core.logger import log_error
+from app.db.version_tabla_repository import AsyncVersionTablaRepository, VersionTablaRepository
 from app.models.arrendatario_model import ArrendatarioModel
 
+EXIST_ARRENDATARIO_BY_EMAIL_QUERY = text("""
+    SELECT 1 FROM arrendatarios WHERE email = :emailArrendatario
+""")
+
+
+CREATE_IMPORT_STAGING_QUERY = text("""
+    CREATE TEMP TABLE arrendatarios_staging (
+        linea bigserial,
+        documento_identificacion_arrendatario text,
+        nombre_completo text,
+        email text,
+        telefono text
+    ) ON COMMIT DROP
+""")
+
+COPY_IMPORT_STAGING_SQL = """
+    COPY arrendatarios_staging
+        (documento_identificacion_arrendatario, nombre_completo, email, telefono)
+    FROM STDIN WITH (FORMAT csv, HEADER true)
+"""
+
+# Aplica en SQL las mismas reglas de los validadores del modelo (las expresiones
+# regulares de las constantes son compatibles con las de PostgreSQL)
+CREATE_IMPORT_RECHAZADOS_QUERY = text("""
+    CREATE TEMP TABLE arrendatarios_rechazados ON COMMIT DROP AS
+    WITH formato AS (
+        SELECT s.linea, s.documento_identificacion_arrendatario, s.email, CASE
+            WHEN s.documento_identificacion_arrendatario IS NULL
+                OR s.documento_identificacion_arrendatario !~ :documentoRegex
+                OR length(s.documento_identificacion_arrendatario) > :documentoMax
+                THEN :documentoError
+            WHEN s.nombre_completo IS NULL
+                OR length(s.nombre_completo) < :nombreMin
+                OR length(s.nombre_completo) > :nombreMax
+                THEN :nombreLengthError
+            WHEN s.nombre_completo !~ :nombreRegex THEN :nombreFormatError
+            WHEN s.email IS NULL OR s.email !~ :emailRegex OR length(s.email) > :emailMax
+                THEN :emailError
+            WHEN s.telefono IS NULL OR s.telefono !~ :telefonoRegex
+                OR length(s.telefono) > :telefonoMax
+                THEN :telefonoError
+            WHEN EXISTS (
+                SELECT 1 FROM arrendatarios a
+                WHERE a.email = s.email
+                AND a.documento_identificacion_arrendatario <> s.documento_identificacion_arrendatario
+            ) THEN :emailExistenteError
+        END AS motivo
+        FROM arrendatarios_staging s
+    ), duplicados AS (
+        -- Entre las filas válidas, solo la primera aparición de cada documento y email
+        SELECT linea, documento_identificacion_arrendatario, email, CASE
+            WHEN row_number() OVER (
+                PARTITION BY documento_identificacion_arrendatario ORDER BY linea
+            ) > 1 THEN :documentoDuplicadoError
+            WHEN row_number() OVER (PARTITION BY email ORDER BY linea) > 1
+                THEN :emailDuplicadoError
+        END AS motivo
+        FROM formato
+        WHERE motivo IS NULL
+    )
+    SELECT * FROM formato WHERE motivo IS NOT NULL
+    UNION ALL
+    SELECT * FROM duplicados WHERE motivo IS NOT NULL
+""")
+
+UPSERT_IMPORT_ARRENDATARIOS_QUERY = text("""
+    INSERT INTO arrendatarios
+        (documento_identificacion_arrendatario, nombre_completo, email, telefono)
+    SELECT s.documento_identificacion_arrendatario, s.nombre_completo, s.email, s.telefono
+    FROM arrendatarios_staging s
+    WHERE NOT EXISTS (SELECT 1 FROM arrendatarios_rechazados r WHERE r.linea = s.linea)
+    ON CONFLICT (documento_identificacion_arrendatario) DO UPDATE
+    SET nombre_completo = EXCLUDED.nombre_completo,
+        email = EXCLUDED.email,
+        telefono = EXCLUDED.telefono
+    RETURNING (xmax = 0) AS insertado
+""")
+
+IMPORT_RECHAZADOS_QUERY = text("""
+    SELECT linea, documento_identificacion_arrendatario, email, motivo,
+           COUNT(*) OVER () AS total
+    FROM arrendatarios_rechazados
+    ORDER BY linea
+    LIMIT :limite
+""")
+
+IMPORT_VALIDATION_PARAMS = {
+    "documentoRegex": DOCUMENT_REGEX,
+    "documentoMax": DOCUMENT_MAX_LENGTH,
+    "documentoError": DOCUMENT_FORMAT_ERROR,
+    "nombreMin": NAME_MIN_LENGTH,
+    "nombreMax": NAME_MAX_LENGTH,
+    "nombreLengthError": NAME_LENGTH_ERROR.format(
+        key="nombre completo", min_length=NAME_MIN_LENGTH
+    ),
+    "nombreRegex": NAME_REGEX,
+    "nombreFormatError": NAME_FORMAT_ERROR.format(key="nombre completo"),
+    "emailRegex": EMAIL_REGEX,
+    "emailMax": EMAIL_MAX_LENGTH,
+    "emailError": EMAIL_FORMAT_ERROR,
+    "telefonoRegex": PHONE_REGEX,
+    "telefonoMax": PHONE_MAX_LENGTH,
+    "telefonoError": PHONE_FORMAT_ERROR,
+    "documentoDuplicadoError": IMPORT_DUPLICATE_DOCUMENT_ERROR,
+    "emailDuplicadoError": IMPORT_DUPLICATE_EMAIL_ERROR,
+    "emailExistenteError": IMPORT_EMAIL_EXISTS_ERROR
+}
+
+
+ARRENDATARIO_COLUMNS = (
+    ArrendatarioModel.documento_identificacion_arrendatario,
+    ArrendatarioModel.nombre_completo,
+    ArrendatarioModel.email,
+    ArrendatarioModel.telefono
+)
+
+
+def arrendatarios_page_query(limit: int, after: Optional[str] = None) -> Select:
+    """
+    Construye la consulta de una página de arrendatarios ordenada por documento (keyset).
+
+    Selecciona solo las columnas, sin instanciar modelos ORM.
+
+    Args:
+        limit (int): Cantidad máxima de arrendatarios a retornar.
+        after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+    Returns:
+        Select: Consulta de los arrendatarios con documento mayor a `after`.
+    """
+    documento = ArrendatarioModel.documento_identificacion_arrendatario
+    query = select(*ARRENDATARIO_COLUMNS)
+    if after is not None:
+        query = query.where(documento > after)
+    return query.order_by(documento).limit(limit)
+
+
+def arrendatarios_con_pagos_query(limit: int, after: Optional[str] = None) -> Select:
+    """
+    Construye la consulta de una página de arrendatarios con sus pagos.
+
+    Los pagos se cargan con `selectinload`: una consulta adicional por cada bloque de
+    hasta 500 arrendatarios, en lugar de una por arrendatario.
+
+    Args:
+        limit (int): Cantidad máxima de arrendatarios a retornar.
+        after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+    Returns:
+        Select: Consulta de los modelos de arrendatarios con documento mayor a `after`.
+    """
+    documento = ArrendatarioModel.documento_identificacion_arrendatario
+    query = select(ArrendatarioModel).options(selectinload(ArrendatarioModel.pagos))
+    if after is not None:
+        query = query.where(documento > after)
+    return query.order_by(documento).limit(limit)
+
+
+def arrendatario_con_pagos_query(documento: str) -> Select:
+    """
+    Construye la consulta de un arrendatario con sus pagos, en dos consultas en total.
+
+    Args:
+        documento (str): Documento de identificación del arrendatario.
+
+    Returns:
+        Select: Consulta del modelo del arrendatario.
+    """
+    return select(ArrendatarioModel).options(selectinload(ArrendatarioModel.pagos)).where(
+        ArrendatarioModel.documento_identificacion_arrendatario == documento
+    )
 
 class ArrendatarioRepository:
     """
@@ -42,6 +240,68 @@ class ArrendatarioRepository:
             log_error(f"Error al obtener todos los arrendatarios: {e}")
             return []
 
+    def get_arrendatarios_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Obtiene una página de arrendatarios ordenada por documento usando paginación
+        por cursor (keyset).
+
+        Args:
+            limit (int): Cantidad máxima de arrendatarios a retornar.
+            after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+        Returns:
+            List[Row]: Filas de los arrendatarios con documento mayor a `after`,
+            ordenadas de forma ascendente.
+        """
+        try:
+            return self.db.execute(arrendatarios_page_query(limit, after)).all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
+            return []
+
+    def get_arrendatarios_con_pagos_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> List[ArrendatarioModel]:
+        """
+        Obtiene una página de arrendatarios con sus pagos, con una cantidad de consultas
+        que no depende del tamaño de la página.
+
+        Args:
+            limit (int): Cantidad máxima de arrendatarios a retornar.
+            after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+        Returns:
+            List[ArrendatarioModel]: Arrendatarios con documento mayor a `after`, ordenados
+            de forma ascendente y con `pagos` ya cargados.
+        """
+        try:
+            return self.db.execute(arrendatarios_con_pagos_query(limit, after)).scalars().all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
+            return []
+
+    def get_arrendatario_con_pagos(self, documento: str) -> Optional[ArrendatarioModel]:
+        """
+        Obtiene un arrendatario con sus pagos.
+
+        Args:
+            documento (str): Documento de identificación del arrendatario.
+
+        Returns:
+            Optional[ArrendatarioModel]: El arrendatario con `pagos` ya cargados, o None
+            si no existe.
+
+        Raises:
+            SQLAlchemyError: Si ocurre un error en la consulta.
+        """
+        try:
+            return self.db.execute(arrendatario_con_pagos_query(documento)).scalar_one_or_none()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ARRENDATARIO.format(e))
+            raise
+
     def exist_arrendatario_by_email(self, email: str) -> bool:
         """
         Verifica la existencia de un arrendatario por su email.
@@ -52,15 +312,19 @@ class ArrendatarioRepository:
         Returns:
             bool: True si el arrendatario existe, False en caso contrario.
         """
+        existe = arrendatario_email_cache.get(email)
+        if existe is not None:
+            return existe
         try:
-            query = text("""
-                SELECT * FROM arrendatarios WHERE email = :emailArrendatario
-            """)
-            result = self.db.execute(query, {"emailArrendatario": email}).fetchone()
-            return result is not None
+            result = self.db.execute(
+                EXIST_ARRENDATARIO_BY_EMAIL_QUERY, {"emailArrendatario": email}
+            ).fetchone()
         except SQLAlchemyError as e:
             log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
             return False
+        existe = result is not None
+        arrendatario_email_cache.set(email, existe)
+        return existe
 
     def create_pago(self, arrendatario: ArrendatarioModel) -> ArrendatarioModel:
         """
@@ -76,8 +340,195 @@ class ArrendatarioRepository:
             self.db.add(arrendatario)
             self.db.commit()
             self.db.refresh(arrendatario)
+            VersionTablaRepository(self.db).bump(TABLA_ARRENDATARIOS)
+            arrendatario_documento_cache.set(
+                arrendatario.documento_identificacion_arrendatario, True)
+            arrendatario_email_cache.set(arrendatario.email, True)
             return arrendatario
         except SQLAlchemyError as e:
             self.db.rollback()
             log_error(ERROR_CREATE_ARRENDATARIO.format(e))
             raise
+
+    def import_csv(self, archivo: BinaryIO) -> Dict:
+        """
+        Importa arrendatarios desde un CSV usando COPY hacia una tabla temporal.
+
+        El archivo se transmite por partes a la base de datos, las filas se validan
+        en SQL con las mismas reglas del modelo y las válidas se insertan o
+        actualizan (por documento) en una sola sentencia. Todo ocurre en una
+        transacción.
+
+        Args:
+            archivo (BinaryIO): Archivo CSV con encabezado.
+
+        Returns:
+            Dict: Cantidad de insertados, actualizados y rechazados, y el detalle de
+            las filas rechazadas (hasta `MAX_IMPORT_REJECTED_REPORT`).
+        """
+        try:
+            self.db.execute(CREATE_IMPORT_STAGING_QUERY)
+            cursor = self.db.connection().connection.cursor()
+            try:
+                cursor.copy_expert(COPY_IMPORT_STAGING_SQL, archivo)
+            finally:
+                cursor.close()
+            self.db.execute(CREATE_IMPORT_RECHAZADOS_QUERY, IMPORT_VALIDATION_PARAMS)
+            insertados = self.db.execute(UPSERT_IMPORT_ARRENDATARIOS_QUERY).scalars().all()
+            rechazados = self.db.execute(
+                IMPORT_RECHAZADOS_QUERY, {"limite": MAX_IMPORT_REJECTED_REPORT}
+            ).all()
+            self.db.commit()
+            if insertados:
+                VersionTablaRepository(self.db).bump(TABLA_ARRENDATARIOS)
+            # Las actualizaciones pueden cambiar emails; se descarta lo cacheado
+            arrendatario_documento_cache.invalidate()
+            arrendatario_email_cache.invalidate()
+        except (SQLAlchemyError, Psycopg2Error) as e:
+            # COPY usa el cursor del driver, cuyos errores no pasan por SQLAlchemy
+            self.db.rollback()
+            log_error(ERROR_IMPORT_ARRENDATARIOS.format(e))
+            raise
+        return {
+            "insertados": sum(1 for insertado in insertados if insertado),
+            "actualizados": sum(1 for insertado in insertados if not insertado),
+            "total_rechazados": rechazados[0].total if rechazados else 0,
+            "rechazados": [
+                {
+                    "fila": row.linea,
+                    "documento_identificacion_arrendatario": (
+                        row.documento_identificacion_arrendatario
+                    ),
+                    "email": row.email,
+                    "motivo": row.motivo
+                }
+                for row in rechazados
+            ]
+        }
+
+
+class AsyncArrendatarioRepository:
+    """
+    Versión asíncrona del repositorio de arrendatarios, para usar con `AsyncSession`.
+    """
+    def __init__(self, db: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión asíncrona de la base de datos.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    async def get_arrendatarios_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Obtiene una página de arrendatarios ordenada por documento usando paginación
+        por cursor (keyset).
+
+        Args:
+            limit (int): Cantidad máxima de arrendatarios a retornar.
+            after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+        Returns:
+            List[Row]: Filas de los arrendatarios con documento mayor a `after`,
+            ordenadas de forma ascendente.
+        """
+        try:
+            result = await self.db.execute(arrendatarios_page_query(limit, after))
+            return result.all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
+            return []
+
+    async def get_arrendatarios_con_pagos_page(
+        self, limit: int, after: Optional[str] = None
+    ) -> List[ArrendatarioModel]:
+        """
+        Obtiene una página de arrendatarios con sus pagos, con una cantidad de consultas
+        que no depende del tamaño de la página.
+
+        Args:
+            limit (int): Cantidad máxima de arrendatarios a retornar.
+            after (Optional[str]): Documento del último arrendatario de la página anterior.
+
+        Returns:
+            List[ArrendatarioModel]: Arrendatarios con documento mayor a `after`, ordenados
+            de forma ascendente y con `pagos` ya cargados.
+        """
+        try:
+            result = await self.db.execute(arrendatarios_con_pagos_query(limit, after))
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_ARRENDATARIO.format(e))
+            return []
+
+    async def get_arrendatario_con_pagos(self, documento: str) -> Optional[ArrendatarioModel]:
+        """
+        Obtiene un arrendatario con sus pagos.
+
+        Args:
+            documento (str): Documento de identificación del arrendatario.
+
+        Returns:
+            Optional[ArrendatarioModel]: El arrendatario con `pagos` ya cargados, o None
+            si no existe.
+
+        Raises:
+            SQLAlchemyError: Si ocurre un error en la consulta.
+        """
+        try:
+            result = await self.db.execute(arrendatario_con_pagos_query(documento))
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ARRENDATARIO.format(e))
+            raise
+
+    async def exist_arrendatario_by_email(self, email: str) -> bool:
+        """
+        Verifica la existencia de un arrendatario por su email.
+
+        Args:
+            email (str): El correo electrónico del arrendatario.
+
+        Returns:
+            bool: True si el arrendatario existe, False en caso contrario.
+        """
+        existe = arrendatario_email_cache.get(email)
+        if existe is not None:
+            return existe
+        try:
+            result = await self.db.execute(
+                EXIST_ARRENDATARIO_BY_EMAIL_QUERY, {"emailArrendatario": email}
+            )
+            existe = result.fetchone() is not None
+        except SQLAlchemyError as e:
+            log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
+            return False
+        arrendatario_email_cache.set(email, existe)
+        return existe
+
+    async def create_arrendatario(self, arrendatario: ArrendatarioModel) -> ArrendatarioModel:
+        """
+        Crea un nuevo arrendatario.
+
+        Args:
+            arrendatario (ArrendatarioModel): El arrendatario a registrar.
+
+        Returns:
+            ArrendatarioModel: El arrendatario registrado con sus datos actualizados.
+        """
+        try:
+            self.db.add(arrendatario)
+            await self.db.commit()
+            await self.db.refresh(arrendatario)
+            await AsyncVersionTablaRepository(self.db).bump(TABLA_ARRENDATARIOS)
+            arrendatario_documento_cache.set(
+                arrendatario.documento_identificacion_arrendatario, True)
+            arrendatario_email_cache.set(arrendatario.email, True)
+            return arrendatario
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            log_error(ERROR_CREATE_ARRENDATARIO.format(e))
+            raise
@@ -0,0 +1,148 @@
+"""
+Este módulo define el repositorio de claves de idempotencia.
+
+La clave se reserva con un INSERT sobre la clave primaria (ruta, clave) dentro de la
+transacción de la solicitud. Si otra solicitud con la misma clave está en curso, el
+INSERT espera en el índice único a que esa transacción termine: si confirmó, se lee la
+respuesta guardada; si se revirtió, la clave queda libre y se reserva normalmente. Las
+claves expiradas se reutilizan en el mismo INSERT y se eliminan con `purgar_expiradas`.
+"""
+from typing import Optional
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import ERROR_IDEMPOTENCY
+from app.core.logger import log_error
+
+# Código de Postgres para una espera de bloqueo que superó `lock_timeout`
+SQLSTATE_LOCK_NOT_AVAILABLE = "55P03"
+
+LIMITAR_ESPERA_QUERY = text("""
+    SELECT set_config('lock_timeout', :lock_timeout, true)
+""")
+
+RESTAURAR_ESPERA_QUERY = text("""
+    SET LOCAL lock_timeout TO DEFAULT
+""")
+
+# Retorna una fila solo si la clave quedó reservada por esta transacción (nueva o expirada)
+RESERVAR_CLAVE_QUERY = text("""
+    INSERT INTO claves_idempotencia (ruta, clave, huella, expira_en)
+    VALUES (:ruta, :clave, :huella, now() + make_interval(secs => :ttl))
+    ON CONFLICT (ruta, clave) DO UPDATE
+    SET huella = EXCLUDED.huella, respuesta = NULL, expira_en = EXCLUDED.expira_en
+    WHERE claves_idempotencia.expira_en <= now()
+    RETURNING 1
+""")
+
+GET_CLAVE_QUERY = text("""
+    SELECT huella, respuesta FROM claves_idempotencia WHERE ruta = :ruta AND clave = :clave
+""")
+
+GUARDAR_RESPUESTA_QUERY = text("""
+    UPDATE claves_idempotencia SET respuesta = CAST(:respuesta AS jsonb)
+    WHERE ruta = :ruta AND clave = :clave
+""")
+
+PURGAR_EXPIRADAS_QUERY = text("""
+    DELETE FROM claves_idempotencia WHERE expira_en <= now()
+""")
+
+
+class ClaveIdempotenciaRepository:
+    """
+    Repositorio para el mantenimiento de la tabla de claves de idempotencia.
+    """
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de la base de datos.
+
+        Args:
+            db (Session): Sesión de base de datos proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    def purgar_expiradas(self) -> int:
+        """
+        Elimina las claves expiradas.
+
+        Returns:
+            int: Cantidad de claves eliminadas.
+        """
+        try:
+            eliminadas = self.db.execute(PURGAR_EXPIRADAS_QUERY).rowcount
+            self.db.commit()
+            return eliminadas
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            log_error(ERROR_IDEMPOTENCY.format(e))
+            raise
+
+
+class AsyncClaveIdempotenciaRepository:
+    """
+    Repositorio asíncrono para reservar claves y guardar sus respuestas. Trabaja sobre la
+    conexión de la transacción de la solicitud, que se confirma fuera del repositorio.
+    """
+    def __init__(self, connection: AsyncConnection):
+        """
+        Inicializa el repositorio con la conexión de la transacción en curso.
+
+        Args:
+            connection (AsyncConnection): Conexión asíncrona con una transacción iniciada.
+        """
+        self.connection = connection
+
+    async def reservar(  # pylint: disable=too-many-arguments
+        self, ruta: str, clave: str, huella: str, *, ttl: int, espera: float
+    ) -> Optional[Row]:
+        """
+        Reserva la clave para esta transacción o, si ya tiene una respuesta vigente,
+        la retorna.
+
+        Args:
+            ruta (str): Ruta a la que pertenece la clave.
+            clave (str): Valor del encabezado `Idempotency-Key`.
+            huella (str): Huella de la solicitud.
+            ttl (int): Segundos que se guarda la respuesta.
+            espera (float): Segundos máximos de espera por otra solicitud con la misma clave.
+
+        Returns:
+            Optional[Row]: None si la clave quedó reservada; si no, la fila guardada
+            (`huella`, `respuesta`).
+
+        Raises:
+            SQLAlchemyError: Si la espera supera `espera` (SQLSTATE 55P03) o falla la consulta.
+        """
+        params = {"ruta": ruta, "clave": clave}
+        try:
+            await self.connection.execute(
+                LIMITAR_ESPERA_QUERY, {"lock_timeout": f"{int(espera * 1000)}ms"}
+            )
+            reservada = (await self.connection.execute(
+                RESERVAR_CLAVE_QUERY, {**params, "huella": huella, "ttl": ttl}
+            )).first()
+            # La espera limitada solo aplica a la reserva, no a la escritura de la solicitud
+            await self.connection.execute(RESTAURAR_ESPERA_QUERY)
+            if reservada is not None:
+                return None
+            return (await self.connection.execute(GET_CLAVE_QUERY, params)).first()
+        except SQLAlchemyError as e:
+            log_error(ERROR_IDEMPOTENCY.format(e))
+            raise
+
+    async def guardar_respuesta(self, ruta: str, clave: str, respuesta: str):
+        """
+        Guarda la respuesta de la clave reservada, sin confirmar la transacción.
+
+        Args:
+            ruta (str): Ruta a la que pertenece la clave.
+            clave (str): Valor del encabezado `Idempotency-Key`.
+            respuesta (str): Respuesta serializada como JSON.
+        """
+        await self.connection.execute(
+            GUARDAR_RESPUESTA_QUERY, {"ruta": ruta, "clave": clave, "respuesta": respuesta}
+        )
@@ -3,21 +3,149 @@ Este módulo define el repositorio de pagos para interactuar con la base de dato
 
 Proporciona métodos para obtener, crear y verificar pagos y arrendatarios,
 así como para realizar consultas específicas relacionadas con los pagos.
+Incluye una versión asíncrona del repositorio que comparte las mismas consultas.
 """
-from typing import List, Optional
-from sqlalchemy import text
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
+from sqlalchemy import Row, Select, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.cache import arrendatario_documento_cache
 from app.core.constants import (
+    ANIO_CONSULTA_PAGOS,
     ERROR_CREATE_PAGO,
     ERROR_EXIST_ARRENDATARIO_BY_NAME,
+    ERROR_EXPORT_PAGO,
     ERROR_GET_ALL_PAGO,
-    ERROR_GET_PAGO
+    ERROR_GET_PAGO,
+    MES_CONSULTA_PAGOS,
+    TABLA_PAGOS
 )
+from app.db.saldo_mensual_repository import (
+    AsyncSaldoMensualRepository,
+    SaldoKey,
+    SaldoMensualRepository
+)
+from app.db.version_tabla_repository import AsyncVersionTablaRepository, VersionTablaRepository
 from app.models.pago_model import PagoModel
 from app.core.logger import log_error
 
+EXIST_ARRENDATARIO_BY_DOCUMENTO_QUERY = text("""
+    SELECT 1 FROM arrendatarios WHERE documento_identificacion_arrendatario = :documento
+""")
+
+DOCUMENTOS_EXISTENTES_QUERY = text("""
+    SELECT documento_identificacion_arrendatario
+    FROM arrendatarios
+    WHERE documento_identificacion_arrendatario = ANY(CAST(:documentos AS varchar[]))
+""")
+
+# Rango de fechas en lugar de EXTRACT: usa el índice (codigo_inmueble, fecha_pago) y
+# permite descartar las particiones mensuales de otros meses
+PAGOS_BY_CODIGO_AND_MONTH_QUERY = text("""
+    SELECT *
+    FROM pagos
+    WHERE codigo_inmueble = :codigoInmueble
+    AND fecha_pago >= :desde AND fecha_pago < :hasta
+""")
+
+
+def rango_mes(anio: int, mes: int) -> Dict[str, date]:
+    """
+    Límites de un mes como parámetros de consulta: desde el primer día, inclusive, hasta
+    el primer día del mes siguiente, exclusivo.
+
+    Args:
+        anio (int): Año.
+        mes (int): Mes (1-12).
+
+    Returns:
+        Dict[str, date]: Parámetros `desde` y `hasta`.
+    """
+    siguiente = date(anio + mes // 12, mes % 12 + 1, 1)
+    return {"desde": date(anio, mes, 1), "hasta": siguiente}
+
+# Registra un pago en un solo viaje a la base de datos: verifica el arrendatario,
+# inserta el pago solo si existe y lo suma al saldo mensual. El acumulado previo se
+# obtiene del RETURNING del upsert, que ve el saldo ya bloqueado por la fila.
+CREATE_PAGO_CON_SALDO_QUERY = text("""
+    WITH arrendatario AS (
+        SELECT 1
+        FROM arrendatarios
+        WHERE documento_identificacion_arrendatario = :documento
+    ), pago AS (
+        INSERT INTO pagos (documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago)
+        SELECT :documento, :codigoInmueble, :valorPagado, :fechaPago
+        WHERE EXISTS (SELECT 1 FROM arrendatario)
+        RETURNING codigo_inmueble, valor_pagado
+    ), saldo AS (
+        INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+        SELECT codigo_inmueble, :anio, :mes, valor_pagado, 1 FROM pago
+        ON CONFLICT (codigo_inmueble, anio, mes) DO UPDATE
+        SET total_pagado = saldos_mensuales.total_pagado + EXCLUDED.total_pagado,
+            cantidad_pagos = saldos_mensuales.cantidad_pagos + EXCLUDED.cantidad_pagos
+        RETURNING total_pagado
+    )
+    SELECT total_pagado - :valorPagado AS pago_acumulado FROM saldo
+""")
+
+
+def create_pago_con_saldo_params(pago: dict) -> dict:
+    """
+    Arma los parámetros de `CREATE_PAGO_CON_SALDO_QUERY` a partir de las columnas del pago.
+
+    Args:
+        pago (dict): Columnas del pago a registrar.
+
+    Returns:
+        dict: Parámetros de la consulta.
+    """
+    return {
+        "documento": pago["documento_identificacion_arrendatario"],
+        "codigoInmueble": pago["codigo_inmueble"],
+        "valorPagado": pago["valor_pagado"],
+        "fechaPago": pago["fecha_pago"],
+        "anio": pago["fecha_pago"].year,
+        "mes": pago["fecha_pago"].month
+    }
+
+
+PAGO_COLUMNS = (
+    PagoModel.id,
+    PagoModel.documento_identificacion_arrendatario,
+    PagoModel.codigo_inmueble,
+    PagoModel.valor_pagado,
+    PagoModel.fecha_pago
+)
+
+
+def pagos_page_query(
+    limit: int, after: Optional[int] = None, documento: Optional[str] = None
+) -> Select:
+    """
+    Construye la consulta de una página de pagos ordenada por ID (keyset).
+
+    Selecciona solo las columnas, sin instanciar modelos ORM. Los pagos de un
+    arrendatario se leen con el índice (documento, id).
+
+    Args:
+        limit (int): Cantidad máxima de pagos a retornar.
+        after (Optional[int]): ID del último pago de la página anterior.
+        documento (Optional[str]): Documento del arrendatario, para listar solo sus pagos.
+
+    Returns:
+        Select: Consulta de los pagos con ID mayor a `after`.
+    """
+    query = select(*PAGO_COLUMNS)
+    if documento is not None:
+        query = query.where(PagoModel.documento_identificacion_arrendatario == documento)
+    if after is not None:
+        query = query.where(PagoModel.id > after)
+    return query.order_by(PagoModel.id).limit(limit)
+
 
 class PagoRepository:
     """
@@ -42,35 +170,39 @@ class PagoRepository:
         Returns:
             bool: True si el arrendatario existe, False en caso contrario.
         """
+        existe = arrendatario_documento_cache.get(documento)
+        if existe is not None:
+            return existe
         try:
-            query = text("""
-                SELECT * FROM arrendatarios WHERE documento_identificacion_arrendatario = :documento
-            """)
-            result = self.db.execute(query, {"documento": documento}).fetchone()
-            return result is not None
+            result = self.db.execute(
+                EXIST_ARRENDATARIO_BY_DOCUMENTO_QUERY, {"documento": documento}
+            ).fetchone()
         except SQLAlchemyError as e:
             log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
             return False
+        existe = result is not None
+        arrendatario_documento_cache.set(documento, existe)
+        return existe
 
-    def get_all_by_codigo_email_and_month_pay(self, codigo_inmueble: str) -> bool:
+    def get_all_by_codigo_email_and_month_pay(
+        self, codigo_inmueble: str, anio: int = ANIO_CONSULTA_PAGOS, mes: int = MES_CONSULTA_PAGOS
+    ) -> bool:
         """
         Obtiene todos los pagos realizados para un inmueble en un mes y año específicos.
 
         Args:
             codigo_inmueble (str): Código del inmueble.
+            anio (int): Año de los pagos.
+            mes (int): Mes de los pagos.
 
         Returns:
             bool: Lista de pagos que coinciden con los criterios.
         """
         try:
-            query = text("""
-                SELECT * 
-                FROM pagos
-                WHERE EXTRACT(MONTH FROM fecha_pago) = 10 
-                AND EXTRACT(YEAR FROM fecha_pago) = 2024 
-                AND codigo_inmueble = :codigoInmueble
-            """)
-            return self.db.execute(query, {"codigoInmueble": codigo_inmueble}).all()
+            return self.db.execute(
+                PAGOS_BY_CODIGO_AND_MONTH_QUERY,
+                {"codigoInmueble": codigo_inmueble, **rango_mes(anio, mes)}
+            ).all()
         except SQLAlchemyError as e:
             log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
             return False
@@ -104,9 +236,56 @@ class PagoRepository:
             log_error(ERROR_GET_ALL_PAGO.format(e))
             return []
 
+    def get_pagos_page(
+        self, limit: int, after: Optional[int] = None, documento: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Obtiene una página de pagos ordenada por ID usando paginación por cursor (keyset).
+
+        Args:
+            limit (int): Cantidad máxima de pagos a retornar.
+            after (Optional[int]): ID del último pago de la página anterior.
+            documento (Optional[str]): Documento del arrendatario, para listar solo sus pagos.
+
+        Returns:
+            List[Row]: Filas de los pagos con ID mayor a `after`, ordenadas de forma
+            ascendente.
+        """
+        try:
+            return self.db.execute(pagos_page_query(limit, after, documento)).all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_PAGO.format(e))
+            return []
+
+    def stream_pagos(self, batch_size: int) -> Iterator[Sequence[Row]]:
+        """
+        Recorre todos los pagos con un cursor del lado del servidor, por lotes.
+
+        Solo se seleccionan las columnas (sin instanciar modelos ORM) y el driver
+        trae `batch_size` filas por viaje, de modo que la memoria usada es
+        constante sin importar el tamaño de la tabla.
+
+        Args:
+            batch_size (int): Cantidad de filas por lote.
+
+        Yields:
+            Sequence[Row]: Lotes de filas ordenadas por ID.
+        """
+        query = (
+            select(*PAGO_COLUMNS)
+            .order_by(PagoModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            yield from self.db.execute(query).partitions()
+        except SQLAlchemyError as e:
+            log_error(ERROR_EXPORT_PAGO.format(e))
+            raise
+
     def create_pago(self, pago: PagoModel) -> PagoModel:
         """
-        Crea un nuevo pago.
+        Crea un nuevo pago y lo suma al saldo mensual del inmueble en la misma transacción;
+        al confirmarla se incrementa la versión de la tabla de pagos.
 
         Args:
             pago (PagoModel): El pago a registrar.
@@ -116,10 +295,256 @@ class PagoRepository:
         """
         try:
             self.db.add(pago)
+            SaldoMensualRepository(self.db).registrar_pago(
+                pago.codigo_inmueble, pago.fecha_pago, pago.valor_pagado
+            )
             self.db.commit()
             self.db.refresh(pago)
+            VersionTablaRepository(self.db).bump(TABLA_PAGOS)
             return pago
         except SQLAlchemyError as e:
             self.db.rollback()
             log_error(ERROR_CREATE_PAGO.format(e))
             raise
+
+    def create_pago_con_saldo(self, pago: dict) -> Optional[Decimal]:
+        """
+        Registra un pago y lo suma al saldo mensual con una sola sentencia.
+
+        Args:
+            pago (dict): Columnas del pago a registrar.
+
+        Returns:
+            Optional[Decimal]: Total pagado en el mes antes de este pago, o None si el
+            arrendatario no existe (en cuyo caso no se registra nada).
+        """
+        documento = pago["documento_identificacion_arrendatario"]
+        if arrendatario_documento_cache.get(documento) is False:
+            return None
+        try:
+            pago_acumulado = self.db.execute(
+                CREATE_PAGO_CON_SALDO_QUERY, create_pago_con_saldo_params(pago)
+            ).scalar()
+            self.db.commit()
+            arrendatario_documento_cache.set(documento, pago_acumulado is not None)
+            if pago_acumulado is not None:
+                VersionTablaRepository(self.db).bump(TABLA_PAGOS)
+            return pago_acumulado
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            log_error(ERROR_CREATE_PAGO.format(e))
+            raise
+
+
+class AsyncPagoRepository:
+    """
+    Versión asíncrona del repositorio de pagos, para usar con `AsyncSession`.
+    """
+    def __init__(self, db: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión asíncrona de la base de datos.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    async def exist_arrendatario_by_documento(self, documento: str) -> bool:
+        """
+        Verifica la existencia de un arrendatario por su documento de identificación.
+
+        Args:
+            documento (str): Documento de identificación del arrendatario.
+
+        Returns:
+            bool: True si el arrendatario existe, False en caso contrario.
+        """
+        existe = arrendatario_documento_cache.get(documento)
+        if existe is not None:
+            return existe
+        try:
+            result = await self.db.execute(
+                EXIST_ARRENDATARIO_BY_DOCUMENTO_QUERY, {"documento": documento}
+            )
+            existe = result.fetchone() is not None
+        except SQLAlchemyError as e:
+            log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
+            return False
+        arrendatario_documento_cache.set(documento, existe)
+        return existe
+
+    async def get_all_by_codigo_email_and_month_pay(
+        self, codigo_inmueble: str, anio: int = ANIO_CONSULTA_PAGOS, mes: int = MES_CONSULTA_PAGOS
+    ) -> bool:
+        """
+        Obtiene todos los pagos realizados para un inmueble en un mes y año específicos.
+
+        Args:
+            codigo_inmueble (str): Código del inmueble.
+            anio (int): Año de los pagos.
+            mes (int): Mes de los pagos.
+
+        Returns:
+            bool: Lista de pagos que coinciden con los criterios.
+        """
+        try:
+            result = await self.db.execute(
+                PAGOS_BY_CODIGO_AND_MONTH_QUERY,
+                {"codigoInmueble": codigo_inmueble, **rango_mes(anio, mes)}
+            )
+            return result.all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
+            return False
+
+    async def get_pago_by_id(self, pago_id: int) -> Optional[PagoModel]:
+        """
+        Obtiene un pago por su ID.
+
+        Args:
+            pago_id (int): ID del pago.
+
+        Returns:
+            Optional[PagoModel]: Pago correspondiente al ID, o None si no se encuentra.
+        """
+        try:
+            return await self.db.get(PagoModel, pago_id)
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_PAGO.format(e))
+            return None
+
+    async def get_pagos_page(
+        self, limit: int, after: Optional[int] = None, documento: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Obtiene una página de pagos ordenada por ID usando paginación por cursor (keyset).
+
+        Args:
+            limit (int): Cantidad máxima de pagos a retornar.
+            after (Optional[int]): ID del último pago de la página anterior.
+            documento (Optional[str]): Documento del arrendatario, para listar solo sus pagos.
+
+        Returns:
+            List[Row]: Filas de los pagos con ID mayor a `after`, ordenadas de forma
+            ascendente.
+        """
+        try:
+            result = await self.db.execute(pagos_page_query(limit, after, documento))
+            return result.all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_ALL_PAGO.format(e))
+            return []
+
+    async def create_pago(self, pago: PagoModel) -> PagoModel:
+        """
+        Crea un nuevo pago y lo suma al saldo mensual del inmueble en la misma transacción;
+        al confirmarla se incrementa la versión de la tabla de pagos.
+
+        Args:
+            pago (PagoModel): El pago a registrar.
+
+        Returns:
+            PagoModel: El pago registrado con sus datos actualizados.
+        """
+        try:
+            self.db.add(pago)
+            await AsyncSaldoMensualRepository(self.db).registrar_pago(
+                pago.codigo_inmueble, pago.fecha_pago, pago.valor_pagado
+            )
+            await self.db.commit()
+            await self.db.refresh(pago)
+            await AsyncVersionTablaRepository(self.db).bump(TABLA_PAGOS)
+            return pago
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            log_error(ERROR_CREATE_PAGO.format(e))
+            raise
+
+    async def create_pago_con_saldo(self, pago: dict) -> Optional[Decimal]:
+        """
+        Registra un pago y lo suma al saldo mensual con una sola sentencia.
+
+        Args:
+            pago (dict): Columnas del pago a registrar.
+
+        Returns:
+            Optional[Decimal]: Total pagado en el mes antes de este pago, o None si el
+            arrendatario no existe (en cuyo caso no se registra nada).
+        """
+        documento = pago["documento_identificacion_arrendatario"]
+        if arrendatario_documento_cache.get(documento) is False:
+            return None
+        try:
+            result = await self.db.execute(
+                CREATE_PAGO_CON_SALDO_QUERY, create_pago_con_saldo_params(pago)
+            )
+            pago_acumulado = result.scalar()
+            await self.db.commit()
+            arrendatario_documento_cache.set(documento, pago_acumulado is not None)
+            if pago_acumulado is not None:
+                await AsyncVersionTablaRepository(self.db).bump(TABLA_PAGOS)
+            return pago_acumulado
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            log_error(ERROR_CREATE_PAGO.format(e))
+            raise
+
+    async def get_documentos_existentes(self, documentos: Iterable[str]) -> Set[str]:
+        """
+        Obtiene en una sola consulta cuáles documentos corresponden a arrendatarios.
+
+        Args:
+            documentos (Iterable[str]): Documentos de identificación a verificar.
+
+        Returns:
+            Set[str]: Documentos que existen en la tabla de arrendatarios.
+        """
+        existentes = set()
+        pendientes = []
+        for documento in documentos:
+            existe = arrendatario_documento_cache.get(documento)
+            if existe is None:
+                pendientes.append(documento)
+            elif existe:
+                existentes.add(documento)
+        if not pendientes:
+            return existentes
+        try:
+            result = await self.db.execute(
+                DOCUMENTOS_EXISTENTES_QUERY, {"documentos": pendientes}
+            )
+            encontrados = set(result.scalars())
+        except SQLAlchemyError as e:
+            log_error(ERROR_EXIST_ARRENDATARIO_BY_NAME.format(e))
+            raise
+        for documento in pendientes:
+            arrendatario_documento_cache.set(documento, documento in encontrados)
+        return existentes | encontrados
+
+    async def create_pagos_batch(self, pagos: List[dict],
+                                 saldos: List[dict]) -> Dict[SaldoKey, Decimal]:
+        """
+        Inserta un lote de pagos y suma sus acumulados mensuales en una sola transacción.
+
+        Los pagos se insertan con un INSERT de varias filas, sin instanciar modelos ORM.
+
+        Args:
+            pagos (List[dict]): Columnas de cada pago a insertar.
+            saldos (List[dict]): Acumulados a sumar, uno por inmueble y mes.
+
+        Returns:
+            Dict[SaldoKey, Decimal]: Total pagado de cada inmueble y mes después de
+            sumar el lote, leído con la fila del acumulado bloqueada.
+        """
+        if not pagos:
+            return {}
+        try:
+            await self.db.execute(insert(PagoModel), pagos)
+            totales = await AsyncSaldoMensualRepository(self.db).registrar_pagos(saldos)
+            await self.db.commit()
+            await AsyncVersionTablaRepository(self.db).bump(TABLA_PAGOS)
+            return totales
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            log_error(ERROR_CREATE_PAGO.format(e))
+            raise
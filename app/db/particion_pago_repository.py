@@ -0,0 +1,179 @@
+"""
+Este módulo define el repositorio de las particiones mensuales de la tabla de pagos.
+
+La tabla `pagos` se particiona por rango mensual de `fecha_pago` en dos pasos de
+Alembic: el primero crea `pagos_particionada`, que recibe cada escritura de `pagos`
+por un trigger, y el segundo intercambia las tablas. Entre ambos, este repositorio copia
+las filas existentes por lotes de IDs, cada lote en su propia transacción, y registra
+el último ID copiado para que el intercambio solo copie lo que falte.
+"""
+from datetime import date
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import ERROR_PARTICIONADO_PAGOS, ERROR_PARTICIONES_PAGOS
+from app.core.logger import log_error
+
+# Crear una partición espera el bloqueo de la tabla padre; no debe frenar el arranque
+LOCK_TIMEOUT_PARTICIONES = "2s"
+
+LIMITAR_ESPERA_QUERY = text("""
+    SELECT set_config('lock_timeout', :lock_timeout, true)
+""")
+
+CREAR_PARTICIONES_QUERY = text("""
+    SELECT crear_particiones_pagos(:desde, :meses)
+""")
+
+COPIA_PENDIENTE_QUERY = text("""
+    SELECT to_regclass('pagos_particionada_avance') IS NOT NULL
+""")
+
+RANGO_FECHAS_PENDIENTES_QUERY = text("""
+    SELECT min(fecha_pago), max(fecha_pago)
+    FROM pagos
+    WHERE id > (SELECT hasta_id FROM pagos_particionada_avance)
+""")
+
+AVANCE_QUERY = text("""
+    SELECT (SELECT hasta_id FROM pagos_particionada_avance), (SELECT COALESCE(max(id), 0) FROM pagos)
+""")
+
+# ID de la fila número `lote` después de `desde`, para que los huecos de la secuencia
+# no produzcan lotes vacíos
+FIN_LOTE_QUERY = text("""
+    SELECT id FROM pagos WHERE id > :desde ORDER BY id OFFSET :lote - 1 LIMIT 1
+""")
+
+COPIAR_LOTE_QUERY = text("""
+    INSERT INTO pagos_particionada (
+        id, documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago
+    )
+    SELECT id, documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago
+    FROM pagos
+    WHERE id > :desde AND id <= :hasta
+    ON CONFLICT DO NOTHING
+""")
+
+REGISTRAR_AVANCE_QUERY = text("""
+    UPDATE pagos_particionada_avance SET hasta_id = :hasta
+""")
+
+
+def meses_entre(desde: date, hasta: date) -> int:
+    """
+    Cantidad de meses calendario desde el mes de `desde` hasta el de `hasta`, inclusive.
+
+    Args:
+        desde (date): Fecha del primer mes.
+        hasta (date): Fecha del último mes.
+
+    Returns:
+        int: Meses del rango, al menos 1.
+    """
+    return max((hasta.year - desde.year) * 12 + hasta.month - desde.month + 1, 1)
+
+
+class ParticionPagoRepository:
+    """
+    Repositorio para crear particiones de pagos y copiar las filas a la tabla particionada.
+    """
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de la base de datos.
+
+        Args:
+            db (Session): Sesión de base de datos proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    def crear_particiones(self, desde: date, meses: int) -> int:
+        """
+        Crea las particiones mensuales que falten desde el mes de `desde`. No hace nada
+        si la tabla de pagos aún no está particionada.
+
+        Args:
+            desde (date): Fecha del primer mes.
+            meses (int): Cantidad de meses a cubrir.
+
+        Returns:
+            int: Cantidad de particiones creadas.
+        """
+        try:
+            self.db.execute(LIMITAR_ESPERA_QUERY, {"lock_timeout": LOCK_TIMEOUT_PARTICIONES})
+            creadas = self.db.execute(
+                CREAR_PARTICIONES_QUERY, {"desde": desde, "meses": meses}
+            ).scalar()
+            self.db.commit()
+            return creadas
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            log_error(ERROR_PARTICIONES_PAGOS.format(e))
+            raise
+
+    def copia_pendiente(self) -> bool:
+        """
+        Indica si existe la tabla particionada del primer paso, aún sin intercambiar.
+
+        Returns:
+            bool: True si hay filas por copiar o un intercambio pendiente.
+        """
+        return bool(self.db.execute(COPIA_PENDIENTE_QUERY).scalar())
+
+    def rango_fechas_pendientes(self) -> Tuple[Optional[date], Optional[date]]:
+        """
+        Obtiene la primera y la última fecha de los pagos que faltan por copiar.
+
+        Returns:
+            Tuple[Optional[date], Optional[date]]: Fechas mínima y máxima, o None si no hay.
+        """
+        return tuple(self.db.execute(RANGO_FECHAS_PENDIENTES_QUERY).one())
+
+    def avance(self) -> Tuple[int, int]:
+        """
+        Obtiene el último ID copiado y el mayor ID de la tabla de pagos.
+
+        Returns:
+            Tuple[int, int]: Último ID copiado y ID máximo actual.
+        """
+        return tuple(self.db.execute(AVANCE_QUERY).one())
+
+    def fin_lote(self, desde: int, lote: int, hasta: int) -> int:
+        """
+        Calcula el último ID del siguiente lote de `lote` filas.
+
+        Args:
+            desde (int): Último ID ya copiado.
+            lote (int): Filas por lote.
+            hasta (int): ID máximo a copiar.
+
+        Returns:
+            int: Último ID del lote, sin superar `hasta`.
+        """
+        fin = self.db.execute(FIN_LOTE_QUERY, {"desde": desde, "lote": lote}).scalar()
+        return hasta if fin is None else min(fin, hasta)
+
+    def copiar_lote(self, desde: int, hasta: int) -> int:
+        """
+        Copia los pagos con ID en (`desde`, `hasta`] y registra el avance, en una sola
+        transacción corta.
+
+        Args:
+            desde (int): Último ID ya copiado.
+            hasta (int): Último ID del lote.
+
+        Returns:
+            int: Cantidad de filas copiadas (las ya replicadas por el trigger no cuentan).
+        """
+        try:
+            copiadas = self.db.execute(COPIAR_LOTE_QUERY, {"desde": desde, "hasta": hasta}).rowcount
+            self.db.execute(REGISTRAR_AVANCE_QUERY, {"hasta": hasta})
+            self.db.commit()
+            return copiadas
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            log_error(ERROR_PARTICIONADO_PAGOS.format(e))
+            raise
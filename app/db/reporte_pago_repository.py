@@ -0,0 +1,182 @@
+"""
+Este módulo define el repositorio de los reportes de recaudo.
+
+Los totales se calculan con `GROUP BY` en la base de datos. Los reportes por inmueble
+y por mes se leen de `saldos_mensuales`, que ya acumula el total de cada inmueble por
+mes, de modo que su costo depende de la cantidad de inmuebles y no de la de pagos. El
+reporte por arrendatario agrupa la tabla de pagos en el rango de fechas, que solo
+recorre las particiones de esos meses. El saldo pendiente se calcula por inmueble y
+mes contra el valor del arriendo, con todos los pagos del inmueble; en el reporte por
+arrendatario es la suma de los saldos de los inmuebles que pagó en el mes, de modo que
+dos arrendatarios de un mismo inmueble ven el mismo saldo. Los meses sin pagos de un
+inmueble no aparecen. Los montos se convierten a `numeric(16, 2)` para que se emitan
+sin notación exponencial.
+Incluye una versión asíncrona del repositorio que comparte las mismas consultas.
+"""
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import ERROR_REPORTE_PAGOS, VALOR_ARRIENDO
+from app.core.logger import log_error
+from app.schemas.reporte_schema import AgrupacionReporte
+
+REPORTE_POR_INMUEBLE_QUERY = text("""
+    SELECT codigo_inmueble,
+           make_date(anio, mes, 1) AS mes,
+           total_pagado::numeric(16, 2) AS total_pagado,
+           cantidad_pagos,
+           GREATEST(:valorArriendo - total_pagado, 0)::numeric(16, 2) AS saldo_pendiente
+    FROM saldos_mensuales
+    WHERE (anio, mes) >= (:anioDesde, :mesDesde) AND (anio, mes) <= (:anioHasta, :mesHasta)
+    ORDER BY codigo_inmueble, anio, mes
+""")
+
+REPORTE_POR_MES_QUERY = text("""
+    SELECT make_date(anio, mes, 1) AS mes,
+           sum(total_pagado)::numeric(16, 2) AS total_pagado,
+           sum(cantidad_pagos) AS cantidad_pagos,
+           count(*) AS inmuebles,
+           sum(GREATEST(:valorArriendo - total_pagado, 0))::numeric(16, 2) AS saldo_pendiente
+    FROM saldos_mensuales
+    WHERE (anio, mes) >= (:anioDesde, :mesDesde) AND (anio, mes) <= (:anioHasta, :mesHasta)
+    GROUP BY anio, mes
+    ORDER BY anio, mes
+""")
+
+REPORTE_POR_ARRENDATARIO_QUERY = text("""
+    WITH por_inmueble AS (
+        SELECT documento_identificacion_arrendatario,
+               codigo_inmueble,
+               EXTRACT(YEAR FROM fecha_pago)::int AS anio,
+               EXTRACT(MONTH FROM fecha_pago)::int AS mes,
+               sum(valor_pagado) AS total_pagado,
+               count(*) AS cantidad_pagos
+        FROM pagos
+        WHERE fecha_pago >= :desde AND fecha_pago < :hasta
+        GROUP BY documento_identificacion_arrendatario, codigo_inmueble, anio, mes
+    )
+    SELECT p.documento_identificacion_arrendatario,
+           make_date(p.anio, p.mes, 1) AS mes,
+           sum(p.total_pagado)::numeric(16, 2) AS total_pagado,
+           sum(p.cantidad_pagos)::bigint AS cantidad_pagos,
+           count(*) AS inmuebles,
+           sum(GREATEST(:valorArriendo - s.total_pagado, 0))::numeric(16, 2) AS saldo_pendiente
+    FROM por_inmueble p
+    JOIN saldos_mensuales s
+      ON s.codigo_inmueble = p.codigo_inmueble AND s.anio = p.anio AND s.mes = p.mes
+    GROUP BY p.documento_identificacion_arrendatario, p.anio, p.mes
+    ORDER BY p.documento_identificacion_arrendatario, p.anio, p.mes
+""")
+
+REPORTE_QUERIES = {
+    AgrupacionReporte.INMUEBLE: REPORTE_POR_INMUEBLE_QUERY,
+    AgrupacionReporte.ARRENDATARIO: REPORTE_POR_ARRENDATARIO_QUERY,
+    AgrupacionReporte.MES: REPORTE_POR_MES_QUERY,
+}
+
+
+def parametros_reporte(desde: date, hasta: date) -> Dict[str, object]:
+    """
+    Parámetros del reporte para los meses completos de `desde` a `hasta`.
+
+    Args:
+        desde (date): Fecha del primer mes.
+        hasta (date): Fecha del último mes.
+
+    Returns:
+        Dict[str, object]: Primer día del primer mes y primer día del mes siguiente al
+        último (exclusivo) para filtrar pagos, año y mes de ambos extremos (inclusivos)
+        para filtrar los saldos mensuales, y valor del arriendo.
+    """
+    siguiente = date(hasta.year + hasta.month // 12, hasta.month % 12 + 1, 1)
+    return {
+        "desde": desde.replace(day=1),
+        "hasta": siguiente,
+        "anioDesde": desde.year,
+        "mesDesde": desde.month,
+        "anioHasta": hasta.year,
+        "mesHasta": hasta.month,
+        "valorArriendo": VALOR_ARRIENDO
+    }
+
+
+class ReportePagoRepository:
+    """
+    Repositorio para calcular los reportes de recaudo en la base de datos.
+    """
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de la base de datos.
+
+        Args:
+            db (Session): Sesión de base de datos proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    def get_reporte(self, agrupacion: AgrupacionReporte, desde: date, hasta: date) -> List[Row]:
+        """
+        Obtiene los totales pagados, la cantidad de pagos y el saldo pendiente por mes.
+
+        Args:
+            agrupacion (AgrupacionReporte): Agrupación del reporte.
+            desde (date): Fecha del primer mes.
+            hasta (date): Fecha del último mes.
+
+        Returns:
+            List[Row]: Filas del reporte ordenadas por la agrupación y el mes.
+
+        Raises:
+            SQLAlchemyError: Si ocurre un error en la consulta.
+        """
+        try:
+            return self.db.execute(
+                REPORTE_QUERIES[agrupacion], parametros_reporte(desde, hasta)
+            ).all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_REPORTE_PAGOS.format(e))
+            raise
+
+
+class AsyncReportePagoRepository:
+    """
+    Versión asíncrona del repositorio de reportes, con las mismas consultas.
+    """
+    def __init__(self, db: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión asíncrona de la base de datos.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    async def get_reporte(
+        self, agrupacion: AgrupacionReporte, desde: date, hasta: date
+    ) -> List[Row]:
+        """
+        Obtiene los totales pagados, la cantidad de pagos y el saldo pendiente por mes.
+
+        Args:
+            agrupacion (AgrupacionReporte): Agrupación del reporte.
+            desde (date): Fecha del primer mes.
+            hasta (date): Fecha del último mes.
+
+        Returns:
+            List[Row]: Filas del reporte ordenadas por la agrupación y el mes.
+
+        Raises:
+            SQLAlchemyError: Si ocurre un error en la consulta.
+        """
+        try:
+            result = await self.db.execute(
+                REPORTE_QUERIES[agrupacion], parametros_reporte(desde, hasta)
+            )
+            return result.all()
+        except SQLAlchemyError as e:
+            log_error(ERROR_REPORTE_PAGOS.format(e))
+            raise
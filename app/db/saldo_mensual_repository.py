@@ -0,0 +1,239 @@
+"""
+Este módulo define el repositorio de saldos mensuales por inmueble.
+
+Proporciona métodos para consultar el total pagado de un inmueble en un mes con una
+sola lectura por clave primaria, registrar un pago en el acumulado dentro de la
+transacción del pago, y reconstruir los acumulados a partir de la tabla de pagos.
+"""
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import ERROR_GET_SALDO_MENSUAL, ERROR_REBUILD_SALDO_MENSUAL
+from app.core.logger import log_error
+
+GET_TOTAL_PAGADO_MES_QUERY = text("""
+    SELECT total_pagado
+    FROM saldos_mensuales
+    WHERE codigo_inmueble = :codigoInmueble AND anio = :anio AND mes = :mes
+""")
+
+UPSERT_SALDO_MENSUAL_QUERY = text("""
+    INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+    VALUES (:codigoInmueble, :anio, :mes, :valorPagado, :cantidadPagos)
+    ON CONFLICT (codigo_inmueble, anio, mes) DO UPDATE
+    SET total_pagado = saldos_mensuales.total_pagado + EXCLUDED.total_pagado,
+        cantidad_pagos = saldos_mensuales.cantidad_pagos + EXCLUDED.cantidad_pagos
+""")
+
+# Suma varios acumulados en una sentencia; las claves se insertan ordenadas para que
+# lotes concurrentes bloqueen las filas en el mismo orden y no haya deadlocks. El
+# RETURNING entrega el total ya sumado con la fila bloqueada hasta el commit.
+UPSERT_SALDOS_MENSUALES_QUERY = text("""
+    INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+    SELECT *
+    FROM unnest(
+        CAST(:codigos AS varchar[]), CAST(:anios AS int[]), CAST(:meses AS int[]),
+        CAST(:totales AS numeric[]), CAST(:cantidades AS int[])
+    )
+    ORDER BY 1, 2, 3
+    ON CONFLICT (codigo_inmueble, anio, mes) DO UPDATE
+    SET total_pagado = saldos_mensuales.total_pagado + EXCLUDED.total_pagado,
+        cantidad_pagos = saldos_mensuales.cantidad_pagos + EXCLUDED.cantidad_pagos
+    RETURNING codigo_inmueble, anio, mes, total_pagado
+""")
+
+LOCK_SALDOS_MENSUALES_QUERY = text("""
+    LOCK TABLE saldos_mensuales IN SHARE ROW EXCLUSIVE MODE
+""")
+
+DELETE_SALDOS_MENSUALES_QUERY = text("""
+    DELETE FROM saldos_mensuales
+    WHERE CAST(:codigoInmueble AS varchar) IS NULL OR codigo_inmueble = :codigoInmueble
+""")
+
+REBUILD_SALDOS_MENSUALES_QUERY = text("""
+    INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+    SELECT codigo_inmueble,
+           EXTRACT(YEAR FROM fecha_pago)::int,
+           EXTRACT(MONTH FROM fecha_pago)::int,
+           SUM(valor_pagado),
+           COUNT(*)
+    FROM pagos
+    WHERE CAST(:codigoInmueble AS varchar) IS NULL OR codigo_inmueble = :codigoInmueble
+    GROUP BY 1, 2, 3
+""")
+
+
+def saldo_params(codigo_inmueble: str, fecha_pago: date, valor_pagado: Decimal,
+                 cantidad_pagos: int = 1) -> dict:
+    """
+    Arma los parámetros para sumar pagos al acumulado de su mes.
+
+    Args:
+        codigo_inmueble (str): Código del inmueble.
+        fecha_pago (date): Fecha del pago, define el año y mes del acumulado.
+        valor_pagado (Decimal): Valor a sumar al acumulado.
+        cantidad_pagos (int): Cantidad de pagos que representa el valor.
+
+    Returns:
+        dict: Parámetros de `UPSERT_SALDO_MENSUAL_QUERY`.
+    """
+    return {
+        "codigoInmueble": codigo_inmueble,
+        "anio": fecha_pago.year,
+        "mes": fecha_pago.month,
+        "valorPagado": valor_pagado,
+        "cantidadPagos": cantidad_pagos
+    }
+
+
+SaldoKey = Tuple[str, int, int]
+
+
+class SaldoMensualRepository:
+    """
+    Repositorio para consultar y mantener los saldos mensuales por inmueble.
+    """
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de la base de datos.
+
+        Args:
+            db (Session): Sesión de base de datos proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    def get_total_pagado_mes(self, codigo_inmueble: str, anio: int, mes: int) -> Decimal:
+        """
+        Obtiene el total pagado de un inmueble en un mes.
+
+        Args:
+            codigo_inmueble (str): Código del inmueble.
+            anio (int): Año del acumulado.
+            mes (int): Mes del acumulado.
+
+        Returns:
+            Decimal: Total pagado en el mes, 0 si no hay pagos registrados.
+        """
+        try:
+            total = self.db.execute(GET_TOTAL_PAGADO_MES_QUERY, {
+                "codigoInmueble": codigo_inmueble, "anio": anio, "mes": mes
+            }).scalar()
+            return total if total is not None else Decimal(0)
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_SALDO_MENSUAL.format(e))
+            raise
+
+    def registrar_pago(self, codigo_inmueble: str, fecha_pago: date, valor_pagado: Decimal):
+        """
+        Suma un pago al acumulado de su mes, sin confirmar la transacción.
+
+        Args:
+            codigo_inmueble (str): Código del inmueble.
+            fecha_pago (date): Fecha del pago.
+            valor_pagado (Decimal): Valor pagado.
+        """
+        self.db.execute(
+            UPSERT_SALDO_MENSUAL_QUERY, saldo_params(codigo_inmueble, fecha_pago, valor_pagado)
+        )
+
+    def rebuild(self, codigo_inmueble: Optional[str] = None) -> int:
+        """
+        Reconstruye los acumulados a partir de la tabla de pagos.
+
+        La tabla de saldos se bloquea contra escrituras mientras se reconstruye, para
+        que ningún pago concurrente quede fuera o se cuente dos veces.
+
+        Args:
+            codigo_inmueble (Optional[str]): Inmueble a reconstruir, o todos si es None.
+
+        Returns:
+            int: Cantidad de acumulados mensuales generados.
+        """
+        params = {"codigoInmueble": codigo_inmueble}
+        try:
+            self.db.execute(LOCK_SALDOS_MENSUALES_QUERY)
+            self.db.execute(DELETE_SALDOS_MENSUALES_QUERY, params)
+            filas = self.db.execute(REBUILD_SALDOS_MENSUALES_QUERY, params).rowcount
+            self.db.commit()
+            return filas
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            log_error(ERROR_REBUILD_SALDO_MENSUAL.format(e))
+            raise
+
+
+class AsyncSaldoMensualRepository:
+    """
+    Versión asíncrona del repositorio de saldos mensuales, para usar con `AsyncSession`.
+    """
+    def __init__(self, db: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión asíncrona de la base de datos.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    async def get_total_pagado_mes(self, codigo_inmueble: str, anio: int, mes: int) -> Decimal:
+        """
+        Obtiene el total pagado de un inmueble en un mes.
+
+        Args:
+            codigo_inmueble (str): Código del inmueble.
+            anio (int): Año del acumulado.
+            mes (int): Mes del acumulado.
+
+        Returns:
+            Decimal: Total pagado en el mes, 0 si no hay pagos registrados.
+        """
+        try:
+            result = await self.db.execute(GET_TOTAL_PAGADO_MES_QUERY, {
+                "codigoInmueble": codigo_inmueble, "anio": anio, "mes": mes
+            })
+            total = result.scalar()
+            return total if total is not None else Decimal(0)
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_SALDO_MENSUAL.format(e))
+            raise
+
+    async def registrar_pago(self, codigo_inmueble: str, fecha_pago: date, valor_pagado: Decimal):
+        """
+        Suma un pago al acumulado de su mes, sin confirmar la transacción.
+
+        Args:
+            codigo_inmueble (str): Código del inmueble.
+            fecha_pago (date): Fecha del pago.
+            valor_pagado (Decimal): Valor pagado.
+        """
+        await self.db.execute(
+            UPSERT_SALDO_MENSUAL_QUERY, saldo_params(codigo_inmueble, fecha_pago, valor_pagado)
+        )
+
+    async def registrar_pagos(self, params: List[dict]) -> Dict[SaldoKey, Decimal]:
+        """
+        Suma varios acumulados en una sola ida y vuelta, sin confirmar la transacción.
+
+        Args:
+            params (List[dict]): Parámetros de `saldo_params`, uno por clave distinta.
+
+        Returns:
+            Dict[SaldoKey, Decimal]: Total pagado de cada clave ya incluidos los
+            acumulados sumados.
+        """
+        if not params:
+            return {}
+        result = await self.db.execute(UPSERT_SALDOS_MENSUALES_QUERY, {
+            "codigos": [p["codigoInmueble"] for p in params],
+            "anios": [p["anio"] for p in params],
+            "meses": [p["mes"] for p in params],
+            "totales": [p["valorPagado"] for p in params],
+            "cantidades": [p["cantidadPagos"] for p in params]
+        })
+        return {(row.codigo_inmueble, row.anio, row.mes): row.total_pagado for row in result}
@@ -0,0 +1,168 @@
+"""
+Este módulo define el repositorio de versiones de tabla.
+
+La versión de cada tabla listada es una secuencia propia (`versiones_<tabla>_seq`).
+Las escrituras la incrementan con `nextval`, que no bloquea filas ni es
+transaccional, por lo que las escrituras concurrentes no se serializan; por lo mismo
+se incrementa después de confirmar la escritura, para que ningún lector asocie la
+versión nueva a los datos anteriores. Los listados leen el último valor de la
+secuencia para responder `304 Not Modified` sin consultar las filas.
+
+Cuando la sesión escribe dentro de una transacción externa (como el savepoint de las
+claves de idempotencia), su `commit` no confirma nada todavía: si la sesión trae en
+`info[VERSIONES_PENDIENTES]` un conjunto, las tablas se anotan ahí y quien abrió la
+transacción las incrementa después de confirmarla.
+"""
+from typing import Set, Union
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import ERROR_BUMP_VERSION_TABLA, ERROR_GET_VERSION_TABLA
+from app.core.logger import log_error
+
+GET_VERSION_TABLA_QUERY = text("""
+    SELECT pg_sequence_last_value(CAST(:secuencia AS regclass))
+""")
+
+BUMP_VERSION_TABLA_QUERY = text("""
+    SELECT nextval(CAST(:secuencia AS regclass))
+""")
+
+# Clave de `Session.info` con las tablas cuya versión se incrementa al confirmar afuera
+VERSIONES_PENDIENTES = "versiones_pendientes"
+
+
+def secuencia_version(tabla: str) -> str:
+    """
+    Obtiene el nombre de la secuencia que lleva la versión de una tabla.
+
+    Args:
+        tabla (str): Nombre de la tabla.
+
+    Returns:
+        str: Nombre de la secuencia.
+    """
+    return f"versiones_{tabla}_seq"
+
+
+def diferir_version(db: Union[Session, AsyncSession], tabla: str) -> bool:
+    """
+    Anota la tabla como pendiente si la sesión escribe dentro de una transacción externa.
+
+    Args:
+        db (Union[Session, AsyncSession]): Sesión que hizo la escritura.
+        tabla (str): Nombre de la tabla modificada.
+
+    Returns:
+        bool: True si el incremento queda a cargo de quien abrió la transacción.
+    """
+    pendientes: Set[str] = db.info.get(VERSIONES_PENDIENTES)
+    if pendientes is None:
+        return False
+    pendientes.add(tabla)
+    return True
+
+
+class VersionTablaRepository:
+    """
+    Repositorio para consultar e incrementar la versión de las tablas.
+    """
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de la base de datos.
+
+        Args:
+            db (Session): Sesión de base de datos proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    def get_version(self, tabla: str) -> int:
+        """
+        Obtiene la versión actual de una tabla.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+
+        Returns:
+            int: Versión de la tabla, 0 si su secuencia aún no se ha usado.
+        """
+        try:
+            return self.db.execute(
+                GET_VERSION_TABLA_QUERY, {"secuencia": secuencia_version(tabla)}
+            ).scalar() or 0
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_VERSION_TABLA.format(e))
+            raise
+
+    def bump(self, tabla: str):
+        """
+        Incrementa la versión de una tabla; se llama después de confirmar la escritura.
+
+        `nextval` surte efecto sin confirmar la transacción. Un error solo se registra,
+        ya que la escritura que lo motivó ya está confirmada. Si la sesión escribe
+        dentro de una transacción externa, solo se anota la tabla (ver `diferir_version`).
+
+        Args:
+            tabla (str): Nombre de la tabla modificada.
+        """
+        if diferir_version(self.db, tabla):
+            return
+        try:
+            self.db.execute(BUMP_VERSION_TABLA_QUERY, {"secuencia": secuencia_version(tabla)})
+        except SQLAlchemyError as e:
+            log_error(ERROR_BUMP_VERSION_TABLA.format(e))
+
+
+class AsyncVersionTablaRepository:
+    """
+    Versión asíncrona del repositorio de versiones de tabla, para usar con `AsyncSession`.
+    """
+    def __init__(self, db: AsyncSession):
+        """
+        Inicializa el repositorio con una sesión asíncrona de la base de datos.
+
+        Args:
+            db (AsyncSession): Sesión asíncrona proporcionada por SQLAlchemy.
+        """
+        self.db = db
+
+    async def get_version(self, tabla: str) -> int:
+        """
+        Obtiene la versión actual de una tabla.
+
+        Args:
+            tabla (str): Nombre de la tabla.
+
+        Returns:
+            int: Versión de la tabla, 0 si su secuencia aún no se ha usado.
+        """
+        try:
+            result = await self.db.execute(
+                GET_VERSION_TABLA_QUERY, {"secuencia": secuencia_version(tabla)}
+            )
+            return result.scalar() or 0
+        except SQLAlchemyError as e:
+            log_error(ERROR_GET_VERSION_TABLA.format(e))
+            raise
+
+    async def bump(self, tabla: str):
+        """
+        Incrementa la versión de una tabla; se llama después de confirmar la escritura.
+
+        `nextval` surte efecto sin confirmar la transacción. Un error solo se registra,
+        ya que la escritura que lo motivó ya está confirmada. Si la sesión escribe
+        dentro de una transacción externa, solo se anota la tabla (ver `diferir_version`).
+
+        Args:
+            tabla (str): Nombre de la tabla modificada.
+        """
+        if diferir_version(self.db, tabla):
+            return
+        try:
+            await self.db.execute(
+                BUMP_VERSION_TABLA_QUERY, {"secuencia": secuencia_version(tabla)}
+            )
+        except SQLAlchemyError as e:
+            log_error(ERROR_BUMP_VERSION_TABLA.format(e))
@@ -2,12 +2,73 @@
 Este módulo contiene la definición de la aplicación FastAPI y la configuración
 inicial, incluyendo el registro de rutas y el manejo personalizado de excepciones.
 """
-import uvicorn
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from datetime import date
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from app.api.routes import arrendatario_routes, pago_routes
+from app.api.routes import arrendatario_routes, monitor_routes, pago_routes, reporte_routes
 from app.core.config import config
+from app.core.constants import ERROR_PARTICIONES_PAGOS, ERROR_POOL_WARM_UP, INFO_POOL_WARMED_UP
+from app.core.database import (
+    SessionLocal, dispose_engines, get_async_engine, get_database_url, get_engine
+)
+from app.core.logger import log_error, log_info
+from app.core.metrics import MetricsMiddleware
+from app.core.notificaciones import CambiosTablaListener
+from app.core.pool import warm_up_async_pool, warm_up_pool
+from app.core.query_stats import QueryStatsMiddleware, instrumentar_consultas
+from app.core.responses import ORJSONResponse
+from app.db.particion_pago_repository import ParticionPagoRepository
+
+
+def crear_particiones_pagos() -> int:
+    """
+    Crea las particiones mensuales de pagos del mes actual y de los siguientes.
+
+    Returns:
+        int: Cantidad de particiones creadas.
+    """
+    db = SessionLocal()
+    try:
+        return ParticionPagoRepository(db).crear_particiones(
+            date.today(), config.PAGOS_PARTICIONES_FUTURAS + 1
+        )
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Abre las conexiones mínimas de los pools, crea las particiones de pagos de los
+    próximos meses e inicia el receptor de cambios al iniciar, y los cierra al terminar.
+    """
+    # Los motores se crean aquí y no al importar, para que el arranque de cada worker
+    # (y de los comandos que importan los módulos) no cargue los drivers antes de tiempo
+    engine = get_engine()
+    async_engine = get_async_engine()
+    try:
+        await run_in_threadpool(warm_up_pool, engine, config.MIN_CONNECTIONS_COUNT)
+        await warm_up_async_pool(async_engine, config.MIN_CONNECTIONS_COUNT)
+        log_info(INFO_POOL_WARMED_UP.format(config.MIN_CONNECTIONS_COUNT))
+    except Exception as e:  # pylint: disable=broad-except
+        # La aplicación puede iniciar igual; las conexiones se abrirán bajo demanda
+        log_error(ERROR_POOL_WARM_UP.format(e))
+    try:
+        await run_in_threadpool(crear_particiones_pagos)
+    except Exception as e:  # pylint: disable=broad-except
+        # La aplicación puede iniciar igual; los pagos sin partición van a la de por defecto
+        log_error(ERROR_PARTICIONES_PAGOS.format(e))
+    listener = None
+    if config.RESPONSE_CACHE_ENABLED:
+        listener = CambiosTablaListener(get_database_url())
+        listener.start()
+    yield
+    if listener is not None:
+        await run_in_threadpool(listener.stop)
+    await dispose_engines()
 
 
 def create_app() -> FastAPI:
@@ -16,7 +77,9 @@ def create_app() -> FastAPI:
     """
     app = FastAPI(
         title=config.APP_NAME,
-        debug=config.DEBUG
+        debug=config.DEBUG,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
     # Registrar rutas con prefijos si es necesario
@@ -24,15 +87,24 @@ def create_app() -> FastAPI:
     app.include_router(pago_routes.router, prefix=f"{api_prefix}/pagos")
     app.include_router(arrendatario_routes.router,
                        prefix=f"{api_prefix}/arrendatarios")
+    app.include_router(reporte_routes.router, prefix=f"{api_prefix}/reportes")
+    app.include_router(monitor_routes.router, prefix=f"{api_prefix}/monitor")
+
+    instrumentar_consultas()
+    app.add_middleware(QueryStatsMiddleware)
+    if config.METRICS_ENABLED:
+        app.include_router(monitor_routes.metrics_router)
+        app.add_middleware(MetricsMiddleware)
 
     # Manejador de excepciones personalizado
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(exc: RequestValidationError):
+    async def validation_exception_handler(_: Request, exc: RequestValidationError):
         # Personaliza la estructura de la respuesta
         errors = []
         for error in exc.errors():
             field = error.get("loc")[-1]
-            message = error.get("msg").split(",")[1].strip()
+            # Los errores de los validadores llegan como "Value error, <mensaje>"
+            message = error.get("msg").split(",", 1)[-1].strip()
             # 'input' podría no estar presente en todos los casos
             input_value = error.get("input", None)
 
@@ -53,8 +125,12 @@ def create_app() -> FastAPI:
 
 
 if __name__ == "__main__":
+    import uvicorn
+
+    # Modo desarrollo; en producción se usa `python -m app.server`
     uvicorn.run(
         "app.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8084,
         log_level="debug",
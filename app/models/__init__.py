@@ -0,0 +1,10 @@
+"""
+Modelos SQLAlchemy de la aplicación.
+
+Se importan juntos para que las relaciones entre modelos siempre puedan resolverse,
+sin importar cuál de los módulos se importe primero.
+"""
+from app.models.arrendatario_model import ArrendatarioModel
+from app.models.pago_model import PagoModel
+from app.models.saldo_mensual_model import SaldoMensualModel
+from app.models.clave_idempotencia_model import ClaveIdempotenciaModel
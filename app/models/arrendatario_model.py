@@ -4,15 +4,13 @@ Este módulo define el modelo de arrendatario utilizado por SQLAlchemy.
 Proporciona validaciones para los campos de arrendatarios, como teléfono, nombre, email
 y documento de identificación, para garantizar la consistencia de los datos.
 """
-import re
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship, validates
-from app.core.constants import (
-    DOCUMENT_FORMAT_ERROR, DOCUMENT_REGEX, EMAIL_FORMAT_ERROR, EMAIL_REGEX,
-    NAME_FORMAT_ERROR, NAME_LENGTH_ERROR, NAME_MIN_LENGTH, PHONE_FORMAT_ERROR,
-    PHONE_LENGTH_ERROR, PHONE_MAX_LENGTH, PHONE_REGEX
-)
 from app.core.database import Base
+from app.core.validaciones import (
+    construccion_confiable, es_confiable, validar_documento, validar_email,
+    validar_nombre, validar_telefono
+)
 
 
 class ArrendatarioModel(Base):
@@ -26,8 +24,24 @@ class ArrendatarioModel(Base):
     email = Column(String(50), nullable=False, unique=True)
     telefono = Column(String(15), nullable=False)
 
-    # Relación con pagos
-    pagos = relationship("PagoModel", back_populates="arrendatario")
+    # Relación con pagos. Es perezosa: al recorrerla sobre varios arrendatarios se
+    # ejecuta una consulta por cada uno; los listados la cargan con `selectinload`.
+    pagos = relationship("PagoModel", back_populates="arrendatario", order_by="PagoModel.id")
+
+    @classmethod
+    def from_validated(cls, datos: dict) -> "ArrendatarioModel":
+        """
+        Crea un arrendatario con datos ya validados por `ArrendatarioSchema`, sin repetir
+        las validaciones.
+
+        Args:
+            datos (dict): Campos del arrendatario validados.
+
+        Returns:
+            ArrendatarioModel: El modelo con los datos del arrendatario.
+        """
+        with construccion_confiable():
+            return cls(**datos)
 
     @validates("telefono")
     def validate_phone(self, _, phone):
@@ -43,11 +57,7 @@ class ArrendatarioModel(Base):
         Raises:
             ValueError: Si el número de teléfono no cumple con las validaciones.
         """
-        if len(phone) > PHONE_MAX_LENGTH:
-            raise ValueError(PHONE_LENGTH_ERROR)
-        if not re.match(PHONE_REGEX, phone):
-            raise ValueError(PHONE_FORMAT_ERROR)
-        return phone
+        return phone if es_confiable() else validar_telefono(phone)
 
     @validates("nombre_completo")
     def validate_name(self, _, name):
@@ -63,13 +73,7 @@ class ArrendatarioModel(Base):
         Raises:
             ValueError: Si el nombre no cumple con las validaciones.
         """
-        if not name or len(name) < NAME_MIN_LENGTH:
-            raise ValueError(
-                NAME_LENGTH_ERROR.format(key="nombre completo", min_length=NAME_MIN_LENGTH)
-            )
-        if not re.match(r"^[A-Za-z\s]+$", name):
-            raise ValueError(NAME_FORMAT_ERROR.format(key="nombre completo"))
-        return name
+        return name if es_confiable() else validar_nombre(name)
 
     @validates("email")
     def validate_email(self, _, email):
@@ -85,9 +89,7 @@ class ArrendatarioModel(Base):
         Raises:
             ValueError: Si el email no cumple con las validaciones.
         """
-        if not re.match(EMAIL_REGEX, email):
-            raise ValueError(EMAIL_FORMAT_ERROR)
-        return email
+        return email if es_confiable() else validar_email(email)
 
     @validates("documento_identificacion_arrendatario")
     def validate_document(self, _, document):
@@ -103,6 +105,4 @@ class ArrendatarioModel(Base):
         Raises:
             ValueError: Si el documento no cumple con las validaciones.
         """
-        if not re.match(DOCUMENT_REGEX, document):
-            raise ValueError(DOCUMENT_FORMAT_ERROR)
-        return document
+        return document if es_confiable() else validar_documento(document)
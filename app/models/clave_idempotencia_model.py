@@ -0,0 +1,27 @@
+"""
+Este módulo define el modelo de las claves de idempotencia utilizado por SQLAlchemy.
+
+Cada fila guarda, por ruta y clave (`Idempotency-Key`), la huella de la solicitud y la
+respuesta que se entregó, hasta que expira. La fila se inserta y la respuesta se guarda
+en la misma transacción que la escritura de la solicitud.
+"""
+from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+
+class ClaveIdempotenciaModel(Base):
+    """
+    Modelo para representar la respuesta guardada de una clave de idempotencia.
+    """
+    __tablename__ = "claves_idempotencia"
+
+    ruta = Column(String(20), primary_key=True)
+    clave = Column(String(255), primary_key=True)
+    huella = Column(String(64), nullable=False)
+    respuesta = Column(JSONB, nullable=True)
+    expira_en = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_claves_idempotencia_expira_en", "expira_en"),
+    )
@@ -4,20 +4,28 @@ Este módulo define el modelo de pago utilizado por SQLAlchemy.
 Proporciona validaciones para los campos de pagos, como el valor pagado y el código del inmueble,
 para garantizar la consistencia de los datos.
 """
-import re
-from sqlalchemy import Column, String, Numeric, Date, ForeignKey, Integer
+from sqlalchemy import Column, String, Numeric, Date, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship, validates
-from app.core.constants import (
-    CODE_FORMAT_ERROR, ERROR_PAGO_PRICE_NEGATIVE
-)
+from app.core.constants import ERROR_PAGO_PRICE_NEGATIVE
 from app.core.database import Base
+from app.core.validaciones import construccion_confiable, es_confiable, validar_codigo_inmueble
 
 
 class PagoModel(Base):
     """
     Modelo para representar un pago en la base de datos.
+
+    La tabla está particionada por mes de `fecha_pago` y su clave primaria en la base
+    de datos es (id, fecha_pago); el ID sigue siendo único por la secuencia, por lo que
+    el mapeo conserva `id` como clave primaria.
     """
     __tablename__ = "pagos"
+    __table_args__ = (
+        # Saldo y reportes por inmueble en un rango de fechas
+        Index("ix_pagos_codigo_inmueble_fecha_pago", "codigo_inmueble", "fecha_pago"),
+        # FK hacia arrendatarios y pagos de un arrendatario paginados por ID
+        Index("ix_pagos_documento_arrendatario_id", "documento_identificacion_arrendatario", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     documento_identificacion_arrendatario = Column(
@@ -30,6 +38,21 @@ class PagoModel(Base):
     # Relación con arrendatario
     arrendatario = relationship("ArrendatarioModel", back_populates="pagos")
 
+    @classmethod
+    def from_validated(cls, datos: dict) -> "PagoModel":
+        """
+        Crea un pago con datos ya validados por `PagoInputSchema`, sin repetir las
+        validaciones.
+
+        Args:
+            datos (dict): Campos del pago validados.
+
+        Returns:
+            PagoModel: El modelo con los datos del pago.
+        """
+        with construccion_confiable():
+            return cls(**datos)
+
     @validates("valor_pagado")
     def validate_price(self, _, value):
         """
@@ -44,7 +67,7 @@ class PagoModel(Base):
         Raises:
             ValueError: Si el valor pagado es negativo.
         """
-        if value < 0:
+        if not es_confiable() and value < 0:
             raise ValueError(ERROR_PAGO_PRICE_NEGATIVE)
         return value
 
@@ -62,6 +85,4 @@ class PagoModel(Base):
         Raises:
             ValueError: Si el código del inmueble no es alfanumérico.
         """
-        if not re.match(r"^[a-zA-Z0-9]+$", value):
-            raise ValueError(CODE_FORMAT_ERROR)
-        return value
+        return value if es_confiable() else validar_codigo_inmueble(value)
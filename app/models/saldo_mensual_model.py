@@ -0,0 +1,21 @@
+"""
+Este módulo define el modelo del saldo mensual por inmueble utilizado por SQLAlchemy.
+
+Cada fila acumula el total pagado y la cantidad de pagos de un inmueble en un mes,
+y se actualiza en la misma transacción en la que se registra cada pago.
+"""
+from sqlalchemy import Column, Integer, Numeric, String
+from app.core.database import Base
+
+
+class SaldoMensualModel(Base):
+    """
+    Modelo para representar el acumulado mensual de pagos de un inmueble.
+    """
+    __tablename__ = "saldos_mensuales"
+
+    codigo_inmueble = Column(String, primary_key=True)
+    anio = Column(Integer, primary_key=True)
+    mes = Column(Integer, primary_key=True)
+    total_pagado = Column(Numeric, nullable=False, default=0)
+    cantidad_pagos = Column(Integer, nullable=False, default=0)
@@ -4,11 +4,12 @@ Este módulo define el esquema de arrendatario utilizando Pydantic.
 Proporciona validaciones para los campos de arrendatarios, como el documento de identificación,
 nombre completo, email y teléfono, para garantizar la consistencia de los datos.
 """
-import re
 from pydantic import BaseModel, Field, EmailStr, field_validator
 from app.core.constants import (
-    DOCUMENT_REGEX, NAME_MIN_LENGTH, PHONE_REGEX,
-    PHONE_MAX_LENGTH, EXAMPLE_DATA_ARRENDATARIO
+    NAME_MIN_LENGTH, PHONE_MAX_LENGTH, EXAMPLE_DATA_ARRENDATARIO
+)
+from app.core.validaciones import (
+    validar_documento, validar_email, validar_nombre, validar_telefono
 )
 
 
@@ -17,7 +18,8 @@ class ArrendatarioSchema(BaseModel):
     Esquema Pydantic para representar un arrendatario.
 
     Incluye validaciones para los campos de documento de identificación, nombre completo,
-    email y teléfono.
+    email y teléfono. Son las mismas reglas del modelo, que no las repite al construirse
+    desde este esquema (`ArrendatarioModel.from_validated`).
     """
     documento_identificacion_arrendatario: str = Field(
         ...,
@@ -61,12 +63,41 @@ class ArrendatarioSchema(BaseModel):
         Raises:
             ValueError: Si el documento no cumple con las validaciones.
         """
-        if not re.fullmatch(DOCUMENT_REGEX, v):
-            raise ValueError(
-                "El documento de identificación debe contener solo números y tener "
-                "entre 1 y 20 caracteres."
-            )
-        return v
+        return validar_documento(v)
+
+    @field_validator('nombre_completo')
+    @classmethod
+    def validate_nombre_completo(cls, v):
+        """
+        Valida que el nombre completo tenga solo letras y espacios.
+
+        Args:
+            v (str): El nombre a validar.
+
+        Returns:
+            str: El nombre validado.
+
+        Raises:
+            ValueError: Si el nombre no cumple con las validaciones.
+        """
+        return validar_nombre(v)
+
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        """
+        Valida el email con el formato que acepta la base de datos, además de `EmailStr`.
+
+        Args:
+            v (str): El email a validar.
+
+        Returns:
+            str: El email validado.
+
+        Raises:
+            ValueError: Si el email no cumple con las validaciones.
+        """
+        return validar_email(v)
 
     @field_validator('telefono')
     @classmethod
@@ -83,11 +114,7 @@ class ArrendatarioSchema(BaseModel):
         Raises:
             ValueError: Si el número de teléfono no cumple con las validaciones.
         """
-        if not re.fullmatch(PHONE_REGEX, v):
-            raise ValueError(
-                "El teléfono debe contener solo números y tener un formato válido."
-            )
-        return v
+        return validar_telefono(v)
 
     @classmethod
     def from_model(cls, arrendatario_model: "ArrendatarioModel") -> "ArrendatarioSchema":
@@ -109,7 +136,7 @@ class ArrendatarioSchema(BaseModel):
             telefono=arrendatario_model.telefono
         )
 
-    class Config(BaseModel.Config):  # pylint: disable=too-few-public-methods
+    class Config:  # pylint: disable=too-few-public-methods
         """
         Configuración para habilitar la conversión desde el modelo SQLAlchemy y añadir un ejemplo.
         """
@@ -0,0 +1,26 @@
+"""
+Este módulo define los formatos disponibles para la exportación de datos.
+
+Cada formato indica el tipo de contenido y la extensión del archivo generado.
+"""
+from enum import Enum
+
+
+class FormatoExport(str, Enum):
+    """
+    Formatos soportados por los endpoints de exportación.
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """
+        Retorna el tipo de contenido HTTP del formato.
+
+        Returns:
+            str: El media type correspondiente al formato.
+        """
+        if self is FormatoExport.CSV:
+            return "text/csv"
+        return "application/x-ndjson"
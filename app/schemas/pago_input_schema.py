@@ -4,11 +4,11 @@ Este módulo define el esquema de pago utilizando Pydantic.
 Proporciona validaciones para los campos de pago, como el documento de identificación,
 código del inmueble, valor pagado y fecha de pago, para garantizar la consistencia de los datos.
 """
-import re
 from decimal import Decimal
 from datetime import date, datetime
 from pydantic import BaseModel, Field, field_validator
-from app.core.constants import DOCUMENT_REGEX
+from app.core.constants import PRICE_DECIMAL_PLACES, PRICE_MAX_DIGITS
+from app.core.validaciones import validar_codigo_inmueble, validar_documento
 
 
 class PagoInputSchema(BaseModel):
@@ -16,7 +16,8 @@ class PagoInputSchema(BaseModel):
     Esquema Pydantic para representar un pago.
 
     Incluye validaciones para los campos de documento de identificación del arrendatario,
-    código del inmueble, valor pagado y fecha de pago.
+    código del inmueble, valor pagado y fecha de pago. Es la única validación del pago:
+    lo que se construye a partir de este esquema no vuelve a validar.
     """
     documento_identificacion_arrendatario: str = Field(
         ...,
@@ -26,7 +27,9 @@ class PagoInputSchema(BaseModel):
         ...,
         description="Código del inmueble, debe ser alfanumérico."
     )
-    valor_pagado: Decimal = Field(...)
+    valor_pagado: Decimal = Field(
+        ..., max_digits=PRICE_MAX_DIGITS, decimal_places=PRICE_DECIMAL_PLACES
+    )
     fecha_pago: date = Field(
         ...,
         description="Fecha del pago en formato dd/mm/yyyy."
@@ -47,12 +50,7 @@ class PagoInputSchema(BaseModel):
         Raises:
             ValueError: Si el documento no cumple con las validaciones.
         """
-        if not re.fullmatch(DOCUMENT_REGEX, v):
-            raise ValueError(
-                "El documento de identificación debe contener"
-                + " solo números y tener entre 1 y 20 caracteres."
-            )
-        return v
+        return validar_documento(v)
 
     @field_validator('valor_pagado', mode='before')
     @classmethod
@@ -90,9 +88,7 @@ class PagoInputSchema(BaseModel):
         Raises:
             ValueError: Si el código no cumple con las validaciones.
         """
-        if not re.fullmatch(r'^[a-zA-Z0-9]+$', v):
-            raise ValueError("El código del inmueble debe ser alfanumérico.")
-        return v
+        return validar_codigo_inmueble(v)
 
     @field_validator("fecha_pago", mode="before")
     @classmethod
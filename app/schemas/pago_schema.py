@@ -5,11 +5,11 @@ Proporciona validaciones para los campos de pago, como el documento de identific
 código del inmueble, valor pagado y fecha de pago, para garantizar la consistencia de los datos.
 """
 from decimal import Decimal
-import re
 from datetime import date
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
-from app.core.constants import DOCUMENT_REGEX, EXAMPLE_DATA_PAGO
+from app.core.constants import EXAMPLE_DATA_PAGO
+from app.core.validaciones import validar_codigo_inmueble, validar_documento
 
 
 class PagoSchema(BaseModel):
@@ -49,12 +49,7 @@ class PagoSchema(BaseModel):
         Raises:
             ValueError: Si el documento no cumple con las validaciones.
         """
-        if not re.fullmatch(DOCUMENT_REGEX, v):
-            raise ValueError(
-                "El documento de identificación debe contener solo " +
-                "números y tener entre 1 y 20 caracteres."
-            )
-        return v
+        return validar_documento(v)
 
     @field_validator('codigo_inmueble')
     @classmethod
@@ -71,9 +66,7 @@ class PagoSchema(BaseModel):
         Raises:
             ValueError: Si el código no cumple con las validaciones.
         """
-        if not re.fullmatch(r'^[a-zA-Z0-9]+$', v):
-            raise ValueError("El código del inmueble debe ser alfanumérico.")
-        return v
+        return validar_codigo_inmueble(v)
 
     @classmethod
     def from_model(cls, pago_model: "PagoModel") -> "PagoSchema":
@@ -101,13 +94,16 @@ class PagoSchema(BaseModel):
         """
         Crea una instancia de PagoSchema a partir de una instancia de PagoInputSchema.
 
+        El esquema de entrada ya validó todos los campos, por lo que no se validan de nuevo.
+
         Args:
             input_schema (PagoInputSchema): El esquema de entrada del pago.
 
         Returns:
             PagoSchema: El esquema con los datos del pago.
         """
-        return cls(
+        return cls.model_construct(
+            id=None,
             documento_identificacion_arrendatario=(
                 input_schema.documento_identificacion_arrendatario
             ),
@@ -0,0 +1,13 @@
+"""
+Este módulo define las agrupaciones disponibles para los reportes de recaudo.
+"""
+from enum import Enum
+
+
+class AgrupacionReporte(str, Enum):
+    """
+    Agrupaciones soportadas por el reporte de pagos; todas se desglosan por mes.
+    """
+    INMUEBLE = "inmueble"
+    ARRENDATARIO = "arrendatario"
+    MES = "mes"
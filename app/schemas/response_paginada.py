@@ -0,0 +1,19 @@
+"""
+Este módulo define el esquema de la respuesta paginada utilizando Pydantic.
+
+Extiende la respuesta general con el cursor necesario para solicitar la siguiente
+página de resultados en los listados paginados por cursor (keyset).
+"""
+from typing import Optional
+from pydantic import Field
+from app.core.constants import NEXT_CURSOR_DESCRIPTION
+from app.schemas.response_general import ResponseGeneral
+
+
+class ResponsePaginada(ResponseGeneral):
+    """
+    Esquema Pydantic para representar una página de resultados.
+
+    Incluye los campos de la respuesta general y el cursor de la siguiente página.
+    """
+    next_cursor: Optional[str] = Field(None, description=NEXT_CURSOR_DESCRIPTION)
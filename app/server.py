@@ -0,0 +1,75 @@
+"""
+Este módulo define el lanzador de producción de la aplicación.
+
+Arranca uvicorn con la configuración de `Config` (variables `SERVER_*`): cantidad de
+workers (por defecto uno por núcleo), uvloop y httptools, keep-alive, backlog, log
+de accesos y tiempo de apagado ordenado. Reemplaza las líneas de comando escritas a
+mano para cada entorno.
+
+Con varios workers, uvicorn supervisa los procesos y reinicia los que terminan
+(por ejemplo al alcanzar `SERVER_LIMIT_MAX_REQUESTS`). Señales del proceso principal:
+    SIGHUP   reinicia los workers uno por uno, sin cerrar el socket (reinicio ordenado).
+    SIGTTIN  agrega un worker; SIGTTOU quita uno.
+    SIGTERM  apaga los workers esperando hasta `SERVER_GRACEFUL_SHUTDOWN_TIMEOUT`
+             segundos a que terminen las solicitudes en curso.
+
+Uso:
+    python -m app.server
+"""
+import os
+
+import uvicorn
+
+from app.core.config import config
+from app.core.constants import INFO_SERVER_START
+from app.core.http_protocol import protocolo_http
+from app.core.logger import log_info
+
+
+def server_workers() -> int:
+    """
+    Calcula la cantidad de workers del servidor.
+
+    Returns:
+        int: `SERVER_WORKERS` si está definido, o la cantidad de núcleos disponibles.
+    """
+    if config.SERVER_WORKERS:
+        return config.SERVER_WORKERS
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def main():
+    """
+    Registra la configuración efectiva y arranca uvicorn con la fábrica de la aplicación.
+    """
+    workers = server_workers()
+    # Cada worker tiene un pool síncrono, uno asíncrono y la conexión de LISTEN
+    conexiones = workers * (2 * config.MAX_CONNECTIONS_COUNT + 1)
+    log_info(INFO_SERVER_START.format(
+        config.SERVER_HOST, config.SERVER_PORT, workers,
+        config.SERVER_LOOP, config.SERVER_HTTP, conexiones
+    ))
+    uvicorn.run(
+        "app.main:create_app",
+        factory=True,
+        host=config.SERVER_HOST,
+        port=config.SERVER_PORT,
+        workers=workers,
+        loop=config.SERVER_LOOP,
+        http=protocolo_http(config.SERVER_HTTP),
+        timeout_keep_alive=config.SERVER_KEEPALIVE_TIMEOUT,
+        backlog=config.SERVER_BACKLOG,
+        access_log=config.SERVER_ACCESS_LOG,
+        # Sin configuración propia los logs de uvicorn pasan por la cola JSON de app.core.logger
+        log_config=None,
+        log_level=config.SERVER_LOG_LEVEL,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        limit_max_requests=config.SERVER_LIMIT_MAX_REQUESTS,
+        limit_concurrency=config.SERVER_LIMIT_CONCURRENCY,
+        proxy_headers=True,
+        forwarded_allow_ips=config.SERVER_FORWARDED_ALLOW_IPS
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,157 @@
+from typing import List, Optional
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.constants import MESSAGE_PRODUCTS_LISTED, STATUS_SUCCESS
-from app.db.arrendatario_repository import ArrendatarioRepository
-from app.schemas.arrendatario_schema import ArrendatarioSchema
+from app.core.constants import (
+    ERROR_ARRENDATARIO_NOT_FOUND,
+    MESSAGE_ARRENDATARIO_FOUND,
+    MESSAGE_ARRENDATARIOS_LISTED,
+    STATUS_NOT_FOUND,
+    STATUS_SUCCESS,
+    TABLA_ARRENDATARIOS
+)
+from app.db.arrendatario_repository import (
+    ArrendatarioRepository,
+    AsyncArrendatarioRepository
+)
+from app.db.version_tabla_repository import AsyncVersionTablaRepository, VersionTablaRepository
+from app.models.arrendatario_model import ArrendatarioModel
 from app.schemas.response_general import ResponseGeneral
+from app.schemas.response_paginada import ResponsePaginada
+
+
+def build_arrendatarios_page(dataAll: List[Row], limit: int) -> ResponsePaginada:
+    """
+    Arma la respuesta de una página de arrendatarios a partir de `limit + 1` filas.
+    """
+    # La fila adicional solo indica que existe una página siguiente
+    has_more = len(dataAll) > limit
+    dataAll = dataAll[:limit]
+
+    # Filas leídas de la base de datos: no se vuelven a validar con el esquema
+    return ResponsePaginada.model_construct(
+        mensaje=MESSAGE_ARRENDATARIOS_LISTED,
+        status=STATUS_SUCCESS,
+        data=[row._asdict() for row in dataAll],
+        next_cursor=dataAll[-1].documento_identificacion_arrendatario if has_more else None
+    )
+
+
+def arrendatario_con_pagos(arrendatario: ArrendatarioModel) -> dict:
+    """
+    Convierte un arrendatario con sus pagos ya cargados en el diccionario de la respuesta.
+    """
+    return {
+        "documento_identificacion_arrendatario": arrendatario.documento_identificacion_arrendatario,
+        "nombre_completo": arrendatario.nombre_completo,
+        "email": arrendatario.email,
+        "telefono": arrendatario.telefono,
+        "pagos": [
+            {
+                "id": pago.id,
+                "codigo_inmueble": pago.codigo_inmueble,
+                "valor_pagado": pago.valor_pagado,
+                "fecha_pago": pago.fecha_pago
+            }
+            for pago in arrendatario.pagos
+        ]
+    }
+
+
+def build_arrendatarios_con_pagos_page(
+    arrendatarios: List[ArrendatarioModel], limit: int
+) -> ResponsePaginada:
+    """
+    Arma la respuesta de una página de arrendatarios con sus pagos a partir de `limit + 1`
+    arrendatarios.
+    """
+    has_more = len(arrendatarios) > limit
+    arrendatarios = arrendatarios[:limit]
+
+    return ResponsePaginada.model_construct(
+        mensaje=MESSAGE_ARRENDATARIOS_LISTED,
+        status=STATUS_SUCCESS,
+        data=[arrendatario_con_pagos(arrendatario) for arrendatario in arrendatarios],
+        next_cursor=arrendatarios[-1].documento_identificacion_arrendatario if has_more else None
+    )
+
+
+def build_arrendatario(arrendatario: Optional[ArrendatarioModel]) -> ResponseGeneral:
+    """
+    Arma la respuesta del detalle de un arrendatario, o la de no encontrado.
+    """
+    if arrendatario is None:
+        return ResponseGeneral(mensaje=ERROR_ARRENDATARIO_NOT_FOUND, status=STATUS_NOT_FOUND)
+    return ResponseGeneral.model_construct(
+        mensaje=MESSAGE_ARRENDATARIO_FOUND,
+        status=STATUS_SUCCESS,
+        data=arrendatario_con_pagos(arrendatario)
+    )
 
 
 class ConsultaArrendatarioService:
     def __init__(self, db: Session):
         self.repository = ArrendatarioRepository(db)
+        self.version_repository = VersionTablaRepository(db)
+
+    def get_arrendatarios_page(
+        self, limit: int, after: Optional[str] = None, incluir_pagos: bool = False
+    ) -> ResponsePaginada:
+        """
+        Obtiene una página de arrendatarios, opcionalmente con sus pagos, y el cursor de
+        la página siguiente.
+        """
+        if incluir_pagos:
+            return build_arrendatarios_con_pagos_page(
+                self.repository.get_arrendatarios_con_pagos_page(limit + 1, after), limit
+            )
+        return build_arrendatarios_page(
+            self.repository.get_arrendatarios_page(limit + 1, after), limit
+        )
+
+    def get_arrendatario(self, documento: str) -> ResponseGeneral:
+        """
+        Obtiene un arrendatario con sus pagos.
+        """
+        return build_arrendatario(self.repository.get_arrendatario_con_pagos(documento))
+
+    def get_version(self) -> int:
+        """
+        Obtiene la versión actual de la tabla de arrendatarios, usada como ETag del listado.
+        """
+        return self.version_repository.get_version(TABLA_ARRENDATARIOS)
+
 
-    def get_all_arrendatarios(self) -> ResponseGeneral:
-        response = ResponseGeneral()
-        response.mensaje = MESSAGE_PRODUCTS_LISTED
-        response.status = STATUS_SUCCESS
+class AsyncConsultaArrendatarioService:
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncArrendatarioRepository(db)
+        self.version_repository = AsyncVersionTablaRepository(db)
 
-        # Obtener todos los productos del repositorio
-        dataAll = self.repository.get_all_arrendatario()
+    async def get_arrendatarios_page(
+        self, limit: int, after: Optional[str] = None, incluir_pagos: bool = False
+    ) -> ResponsePaginada:
+        """
+        Obtiene una página de arrendatarios, opcionalmente con sus pagos, y el cursor de
+        la página siguiente.
+        """
+        if incluir_pagos:
+            return build_arrendatarios_con_pagos_page(
+                await self.repository.get_arrendatarios_con_pagos_page(limit + 1, after), limit
+            )
+        return build_arrendatarios_page(
+            await self.repository.get_arrendatarios_page(limit + 1, after), limit
+        )
 
-        # Convertir los productos a ProductSchema
-        data = [ArrendatarioSchema.from_model(item) for item in dataAll]
+    async def get_arrendatario(self, documento: str) -> ResponseGeneral:
+        """
+        Obtiene un arrendatario con sus pagos.
+        """
+        return build_arrendatario(await self.repository.get_arrendatario_con_pagos(documento))
 
-        response.data = data
-        return response
+    async def get_version(self) -> int:
+        """
+        Obtiene la versión actual de la tabla de arrendatarios, usada como ETag del listado.
+        """
+        return await self.version_repository.get_version(TABLA_ARRENDATARIOS)
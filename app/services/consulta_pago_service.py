@@ -1,25 +1,95 @@
+from typing import List, Optional, Union
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.constants import MESSAGE_PRODUCTS_LISTED, STATUS_SUCCESS
-from app.db.pago_repository import PagoRepository
-from app.schemas.pago_schema import PagoSchema
+from app.core.constants import (
+    ERROR_ARRENDATARIO_NOT_FOUND,
+    MESSAGE_PAGOS_LISTED,
+    STATUS_NOT_FOUND,
+    STATUS_SUCCESS,
+    TABLA_PAGOS
+)
+from app.db.pago_repository import AsyncPagoRepository, PagoRepository
+from app.db.version_tabla_repository import AsyncVersionTablaRepository, VersionTablaRepository
 from app.schemas.response_general import ResponseGeneral
+from app.schemas.response_paginada import ResponsePaginada
+
+
+def build_pagos_page(dataAll: List[Row], limit: int) -> ResponsePaginada:
+    """
+    Arma la respuesta de una página de pagos a partir de `limit + 1` filas.
+    """
+    # La fila adicional solo indica que existe una página siguiente
+    has_more = len(dataAll) > limit
+    dataAll = dataAll[:limit]
+
+    # Las filas vienen de la base de datos y ya cumplen las validaciones del esquema,
+    # por lo que la respuesta se arma sin volver a validarlas
+    return ResponsePaginada.model_construct(
+        mensaje=MESSAGE_PAGOS_LISTED,
+        status=STATUS_SUCCESS,
+        data=[row._asdict() for row in dataAll],
+        next_cursor=str(dataAll[-1].id) if has_more else None
+    )
 
 
 class ConsultaPagoService:
     def __init__(self, db: Session):
         self.repository = PagoRepository(db)
+        self.version_repository = VersionTablaRepository(db)
+
+    def get_pagos_page(self, limit: int, after: Optional[int] = None) -> ResponsePaginada:
+        """
+        Obtiene una página de pagos y el cursor de la página siguiente.
+        """
+        return build_pagos_page(self.repository.get_pagos_page(limit + 1, after), limit)
+
+    def get_pagos_arrendatario_page(
+        self, documento: str, limit: int, after: Optional[int] = None
+    ) -> Union[ResponsePaginada, ResponseGeneral]:
+        """
+        Obtiene una página de los pagos de un arrendatario, o la respuesta de no encontrado.
+        """
+        pagos = self.repository.get_pagos_page(limit + 1, after, documento)
+        # Solo una página vacía obliga a verificar que el arrendatario exista
+        if not pagos and not self.repository.exist_arrendatario_by_documento(documento):
+            return ResponseGeneral(mensaje=ERROR_ARRENDATARIO_NOT_FOUND, status=STATUS_NOT_FOUND)
+        return build_pagos_page(pagos, limit)
+
+    def get_version(self) -> int:
+        """
+        Obtiene la versión actual de la tabla de pagos, usada como ETag del listado.
+        """
+        return self.version_repository.get_version(TABLA_PAGOS)
+
 
-    def get_all_pagos(self) -> ResponseGeneral:
-        response = ResponseGeneral()
-        response.mensaje = MESSAGE_PRODUCTS_LISTED
-        response.status = STATUS_SUCCESS
+class AsyncConsultaPagoService:
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncPagoRepository(db)
+        self.version_repository = AsyncVersionTablaRepository(db)
 
-        # Obtener todos los productos del repositorio
-        dataAll = self.repository.get_all_pagos()
+    async def get_pagos_page(self, limit: int, after: Optional[int] = None) -> ResponsePaginada:
+        """
+        Obtiene una página de pagos y el cursor de la página siguiente.
+        """
+        return build_pagos_page(await self.repository.get_pagos_page(limit + 1, after), limit)
 
-        # Convertir los productos a ProductSchema
-        data = [PagoSchema.from_model(item) for item in dataAll]
+    async def get_pagos_arrendatario_page(
+        self, documento: str, limit: int, after: Optional[int] = None
+    ) -> Union[ResponsePaginada, ResponseGeneral]:
+        """
+        Obtiene una página de los pagos de un arrendatario, o la respuesta de no encontrado.
+        """
+        pagos = await self.repository.get_pagos_page(limit + 1, after, documento)
+        # Solo una página vacía obliga a verificar que el arrendatario exista
+        if not pagos and not await self.repository.exist_arrendatario_by_documento(documento):
+            return ResponseGeneral(mensaje=ERROR_ARRENDATARIO_NOT_FOUND, status=STATUS_NOT_FOUND)
+        return build_pagos_page(pagos, limit)
 
-        response.data = data
-        return response
+    async def get_version(self) -> int:
+        """
+        Obtiene la versión actual de la tabla de pagos, usada como ETag del listado.
+        """
+        return await self.version_repository.get_version(TABLA_PAGOS)
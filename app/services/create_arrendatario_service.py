@@ -1,14 +1,53 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.constants import MESSAGE_ARRENDATARIO_CREATED_ERROR, MESSAGE_ARRENDATARIO_CREATED_SUCCESS,  STATUS_INTERNAL_SERVER_ERROR, STATUS_SUCCESS
 from app.core.logger import log_error, log_info
-from app.db.arrendatario_repository import ArrendatarioRepository
+from app.db.arrendatario_repository import ArrendatarioRepository, AsyncArrendatarioRepository
 from app.models.arrendatario_model import ArrendatarioModel
 from app.schemas.arrendatario_schema import ArrendatarioSchema
 from app.schemas.response_general import ResponseGeneral
 
 
-class CreateArrendatarioService:
+class BaseCreateArrendatarioService:
+    """
+    Respuestas compartidas por las versiones síncrona y asíncrona del servicio.
+    """
+
+    def email_existente(self) -> ResponseGeneral:
+        response = ResponseGeneral()
+        response.mensaje = 'El correo ya existe'
+        response.status = STATUS_INTERNAL_SERVER_ERROR
+        return response
+
+    def resultado(self, new_arrendatario: Optional[ArrendatarioModel]) -> ResponseGeneral:
+        response = ResponseGeneral()
+        if new_arrendatario:
+            response.mensaje = MESSAGE_ARRENDATARIO_CREATED_SUCCESS
+            response.status = STATUS_SUCCESS
+            return response
+        else:
+            response.mensaje = MESSAGE_ARRENDATARIO_CREATED_ERROR
+            response.status = STATUS_INTERNAL_SERVER_ERROR
+            return response
+
+    def error_response(self, e: Exception) -> ResponseGeneral:
+        log_error(e)
+        response = ResponseGeneral()
+        response.mensaje = self.create_error_message(e.args)
+        response.status = STATUS_INTERNAL_SERVER_ERROR
+        return response
+
+    def create_error_message(self, args):
+        mensajes = []
+        for numero, elemento in enumerate(args, start=1):
+            mensajes.append(f"{numero}. {elemento} ")
+        return ', '.join(mensajes)
+
+
+class CreateArrendatarioService(BaseCreateArrendatarioService):
     def __init__(self, db: Session):
         self.repository = ArrendatarioRepository(db)
 
@@ -16,32 +55,33 @@ class CreateArrendatarioService:
         """
         Llama al repositorio para crear un nuevo arrendatario.
         """
-        response = ResponseGeneral()
         try:
             if self.repository.exist_arrendatario_by_email(arrendatario.email):
-                response.mensaje = 'El correo ya existe'
-                response.status = STATUS_INTERNAL_SERVER_ERROR
-                return response
-
-            # Convertir ProductSchema a ProductModel
-            pago_model = ArrendatarioModel(**arrendatario.dict())
-            new_pago = self.repository.create_pago(pago_model)
-            if new_pago:
-                response.mensaje = MESSAGE_ARRENDATARIO_CREATED_SUCCESS
-                response.status = STATUS_SUCCESS
-                return response
-            else:
-                response.mensaje = MESSAGE_ARRENDATARIO_CREATED_ERROR
-                response.status = STATUS_INTERNAL_SERVER_ERROR
-                return response
+                return self.email_existente()
+
+            # El esquema ya validó los campos: el modelo no los valida de nuevo
+            arrendatario_model = ArrendatarioModel.from_validated(arrendatario.model_dump())
+            return self.resultado(self.repository.create_pago(arrendatario_model))
         except Exception as e:
-            log_error(e)
-            response.mensaje = self.create_error_message(e.args)
-            response.status = STATUS_INTERNAL_SERVER_ERROR
-            return response
+            return self.error_response(e)
 
-    def create_error_message(self, args):
-        mensajes = []
-        for numero, elemento in enumerate(args, start=1):
-            mensajes.append(f"{numero}. {elemento} ")
-        return ', '.join(mensajes)
+
+class AsyncCreateArrendatarioService(BaseCreateArrendatarioService):
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncArrendatarioRepository(db)
+
+    async def create_arrendatario(self, arrendatario: ArrendatarioSchema) -> ResponseGeneral:
+        """
+        Llama al repositorio asíncrono para crear un nuevo arrendatario.
+        """
+        try:
+            if await self.repository.exist_arrendatario_by_email(arrendatario.email):
+                return self.email_existente()
+
+            # El esquema ya validó los campos: el modelo no los valida de nuevo
+            arrendatario_model = ArrendatarioModel.from_validated(arrendatario.model_dump())
+            return self.resultado(
+                await self.repository.create_arrendatario(arrendatario_model)
+            )
+        except Exception as e:
+            return self.error_response(e)
@@ -0,0 +1,83 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import MESSAGE_PAGO_BATCH_RESULT, STATUS_SUCCESS
+from app.db.pago_repository import AsyncPagoRepository
+from app.db.saldo_mensual_repository import SaldoKey, saldo_params
+from app.schemas.pago_input_schema import PagoInputSchema
+from app.schemas.response_general import ResponseGeneral
+from app.services.create_pago_service import BaseCreatePagoService
+
+
+def saldo_key(pago: PagoInputSchema) -> SaldoKey:
+    """
+    Obtiene la clave del acumulado mensual al que suma un pago.
+
+    Args:
+        pago (PagoInputSchema): Pago del lote.
+
+    Returns:
+        SaldoKey: Tupla (codigo_inmueble, anio, mes) del pago.
+    """
+    return (pago.codigo_inmueble, pago.fecha_pago.year, pago.fecha_pago.month)
+
+
+class AsyncCreatePagoBatchService(BaseCreatePagoService):
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncPagoRepository(db)
+
+    async def create_pagos(self, pagos: List[PagoInputSchema]) -> ResponseGeneral:
+        """
+        Registra un lote de pagos con una cantidad fija de consultas.
+
+        La existencia de los arrendatarios se lee con una consulta y todo el lote se
+        inserta en una transacción. El acumulado previo de cada mes se obtiene del
+        RETURNING del upsert de saldos, que ve la fila ya bloqueada, restándole lo que
+        suma el lote; a partir de él los saldos se recalculan en el orden del lote, de
+        modo que cada pago recibe el mismo mensaje que tendría si se hubiera registrado
+        individualmente, aun con lotes concurrentes sobre los mismos meses.
+        """
+        rechazo = self.rechazar_por_decreto()
+        if rechazo:
+            return rechazo
+        try:
+            existentes = await self.repository.get_documentos_existentes(
+                {pago.documento_identificacion_arrendatario for pago in pagos})
+            aceptados = [pago for pago in pagos
+                         if pago.documento_identificacion_arrendatario in existentes]
+
+            acumulados_lote = defaultdict(lambda: [Decimal(0), 0])
+            for pago in aceptados:
+                acumulados_lote[saldo_key(pago)][0] += pago.valor_pagado
+                acumulados_lote[saldo_key(pago)][1] += 1
+
+            totales = await self.repository.create_pagos_batch(
+                [pago.model_dump() for pago in aceptados], [
+                    saldo_params(codigo, date(anio, mes, 1), total, cantidad)
+                    for (codigo, anio, mes), (total, cantidad) in acumulados_lote.items()
+                ])
+            saldos = {key: totales[key] - total for key, (total, _) in acumulados_lote.items()}
+
+            resultados = []
+            for indice, pago in enumerate(pagos):
+                if pago.documento_identificacion_arrendatario not in existentes:
+                    item = self.arrendatario_no_existe()
+                else:
+                    key = saldo_key(pago)
+                    item = self.calcular_respuesta(saldos[key], pago.valor_pagado)
+                    saldos[key] += pago.valor_pagado
+                resultados.append(
+                    {"indice": indice, "status": item.status, "mensaje": item.mensaje})
+
+            response = ResponseGeneral()
+            response.mensaje = MESSAGE_PAGO_BATCH_RESULT.format(
+                len(aceptados), len(pagos) - len(aceptados))
+            response.status = STATUS_SUCCESS
+            response.data = resultados
+            return response
+        except Exception as e:
+            return self.error_response(e)
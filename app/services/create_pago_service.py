@@ -1,71 +1,129 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from datetime import datetime
-from app.core.constants import MESSAGE_PAGO_CREATED_ERROR, MESSAGE_PAGO_CREATED_SUCCESS,  STATUS_INTERNAL_SERVER_ERROR, STATUS_SUCCESS
-from app.core.logger import log_error, log_info
-from app.db.pago_repository import PagoRepository
-from app.models.pago_model import PagoModel
+from app.core.constants import (
+    INFO_PAGO_SOBRANTE,
+    STATUS_INTERNAL_SERVER_ERROR,
+    VALOR_ARRIENDO
+)
+from app.core.logger import log_error, log_info_muestreado
+from app.db.pago_repository import AsyncPagoRepository, PagoRepository
 from app.schemas.pago_input_schema import PagoInputSchema
 from app.schemas.pago_schema import PagoSchema
 from app.schemas.response_general import ResponseGeneral
 
 
-class CreatePagoService:
-    def __init__(self, db: Session):
-        self.repository = PagoRepository(db)
+class BaseCreatePagoService:
+    """
+    Reglas de negocio compartidas por las versiones síncrona y asíncrona del servicio.
+    """
 
-    def create_pago(self, pago: PagoInputSchema) -> ResponseGeneral:
+    def rechazar_por_decreto(self) -> Optional[ResponseGeneral]:
         """
-        Llama al repositorio para crear un nuevo pago.
+        Retorna la respuesta de rechazo si hoy no se pueden recibir pagos.
         """
-        response = ResponseGeneral()
         fecha_actual = datetime.now()
         dia_actual = fecha_actual.day
         if dia_actual % 2 != 0:
+            response = ResponseGeneral()
             response.mensaje = "Lo siento, pero no se puede recibir el pago por decreto de administración"
             response.status = 400
             return response
-        try:
-            if not self.repository.exist_arrendatario_by_documento(pago.documento_identificacion_arrendatario):
-                response.mensaje = "El arrendador del pago no existe"
-                response.status = 400
-                return response
-            # Convertimos el schema de entrada a PagoSchema
-            pago_schem = PagoSchema.from_input_schema(pago)
-            pago_arriendo = 1000000
-            pago_acumulado = sum(p.valor_pagado for p in self.repository.get_all_by_codigo_email_and_month_pay(
-                pago_schem.codigo_inmueble))
-
-            # Calcular el pago restante y sobrante
-            pago_restante = pago_arriendo - \
-                (pago_acumulado + pago_schem.valor_pagado)
-            # Si pago_restante es negativo, este será el pago sobrante
-            pago_sobrante = max(0, -pago_restante)
-            # Si pago_restante es negativo, lo ajustamos a 0
-            pago_restante = max(0, pago_restante)
-
-            # Generar el mensaje de respuesta basado en el cálculo
-            if 0 < pago_restante < pago_arriendo:
-                response.mensaje = f"Gracias por tu abono, sin embargo, recuerda que te hace falta pagar ${pago_restante}"
-            elif pago_restante == 0:
-                response.mensaje = "Gracias por pagar todo tu arriendo"
-
-            log_info(str(pago_sobrante))
-            response.status = 200
-
-            # Guardar el nuevo pago en la base de datos
-            # Convertimos el schema a un modelo de base de datos
-            pago_model = PagoModel(**pago_schem.dict())
-            self.repository.create_pago(pago_model)
-            return response
-        except Exception as e:
-            log_error(e)
-            response.mensaje = self.create_error_message(e.args)
-            response.status = STATUS_INTERNAL_SERVER_ERROR
-            return response
+        return None
+
+    def arrendatario_no_existe(self) -> ResponseGeneral:
+        response = ResponseGeneral()
+        response.mensaje = "El arrendador del pago no existe"
+        response.status = 400
+        return response
+
+    def calcular_respuesta(self, pago_acumulado: Decimal, valor_pagado: Decimal) -> ResponseGeneral:
+        """
+        Calcula el saldo del mes y arma el mensaje de respuesta del pago.
+        """
+        response = ResponseGeneral()
+        pago_arriendo = VALOR_ARRIENDO
+
+        # Calcular el pago restante y sobrante
+        pago_restante = pago_arriendo - \
+            (pago_acumulado + valor_pagado)
+        # Si pago_restante es negativo, este será el pago sobrante
+        pago_sobrante = max(0, -pago_restante)
+        # Si pago_restante es negativo, lo ajustamos a 0
+        pago_restante = max(0, pago_restante)
+
+        # Generar el mensaje de respuesta basado en el cálculo
+        if 0 < pago_restante < pago_arriendo:
+            response.mensaje = f"Gracias por tu abono, sin embargo, recuerda que te hace falta pagar ${pago_restante}"
+        elif pago_restante == 0:
+            response.mensaje = "Gracias por pagar todo tu arriendo"
+
+        # Se registra en cada pago: con muestreo para no pesar bajo carga
+        log_info_muestreado(INFO_PAGO_SOBRANTE.format(pago_sobrante))
+        response.status = 200
+        return response
+
+    def error_response(self, e: Exception) -> ResponseGeneral:
+        log_error(e)
+        response = ResponseGeneral()
+        response.mensaje = self.create_error_message(e.args)
+        response.status = STATUS_INTERNAL_SERVER_ERROR
+        return response
 
     def create_error_message(self, args):
         mensajes = []
         for numero, elemento in enumerate(args, start=1):
             mensajes.append(f"{numero}. {elemento} ")
         return ', '.join(mensajes)
+
+
+class CreatePagoService(BaseCreatePagoService):
+    def __init__(self, db: Session):
+        self.repository = PagoRepository(db)
+
+    def create_pago(self, pago: PagoInputSchema) -> ResponseGeneral:
+        """
+        Llama al repositorio para crear un nuevo pago.
+        """
+        rechazo = self.rechazar_por_decreto()
+        if rechazo:
+            return rechazo
+        try:
+            # Convertimos el schema de entrada a PagoSchema
+            pago_schem = PagoSchema.from_input_schema(pago)
+            # Existencia del arrendatario, acumulado del mes e inserción en una sola sentencia
+            pago_acumulado = self.repository.create_pago_con_saldo(
+                pago_schem.model_dump(exclude={"id"}))
+            if pago_acumulado is None:
+                return self.arrendatario_no_existe()
+            return self.calcular_respuesta(pago_acumulado, pago_schem.valor_pagado)
+        except Exception as e:
+            return self.error_response(e)
+
+
+class AsyncCreatePagoService(BaseCreatePagoService):
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncPagoRepository(db)
+
+    async def create_pago(self, pago: PagoInputSchema) -> ResponseGeneral:
+        """
+        Llama al repositorio asíncrono para crear un nuevo pago.
+        """
+        rechazo = self.rechazar_por_decreto()
+        if rechazo:
+            return rechazo
+        try:
+            # Convertimos el schema de entrada a PagoSchema
+            pago_schem = PagoSchema.from_input_schema(pago)
+            # Existencia del arrendatario, acumulado del mes e inserción en una sola sentencia
+            pago_acumulado = await self.repository.create_pago_con_saldo(
+                pago_schem.model_dump(exclude={"id"}))
+            if pago_acumulado is None:
+                return self.arrendatario_no_existe()
+            return self.calcular_respuesta(pago_acumulado, pago_schem.valor_pagado)
+        except Exception as e:
+            return self.error_response(e)
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.core.constants import EXPORT_BATCH_SIZE, EXPORT_PAGO_COLUMNS
+from app.db.pago_repository import PagoRepository
+from app.schemas.export_schema import FormatoExport
+
+
+class ExportPagoService:
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        self.repository = PagoRepository(db)
+        self.batch_size = batch_size
+
+    def export_pagos(self, formato: FormatoExport) -> Iterator[bytes]:
+        """
+        Genera la exportación completa de pagos como fragmentos de bytes.
+
+        Cada lote leído del cursor se convierte en un único fragmento, por lo que
+        nunca se mantiene en memoria más de un lote a la vez.
+        """
+        if formato is FormatoExport.CSV:
+            return self._export_csv()
+        return self._export_ndjson()
+
+    def _export_ndjson(self) -> Iterator[bytes]:
+        for lote in self.repository.stream_pagos(self.batch_size):
+            lineas = [
+                json.dumps({
+                    "id": row.id,
+                    "documento_identificacion_arrendatario": (
+                        row.documento_identificacion_arrendatario
+                    ),
+                    "codigo_inmueble": row.codigo_inmueble,
+                    "valor_pagado": str(row.valor_pagado),
+                    "fecha_pago": row.fecha_pago.isoformat()
+                }, ensure_ascii=False)
+                for row in lote
+            ]
+            lineas.append("")
+            yield "\n".join(lineas).encode("utf-8")
+
+    def _export_csv(self) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # El encabezado se envía antes de consultar para que el primer byte salga de inmediato
+        writer.writerow(EXPORT_PAGO_COLUMNS)
+        yield self._flush(buffer)
+        for lote in self.repository.stream_pagos(self.batch_size):
+            writer.writerows(lote)
+            yield self._flush(buffer)
+
+    @staticmethod
+    def _flush(buffer: io.StringIO) -> bytes:
+        chunk = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
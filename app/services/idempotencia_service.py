@@ -0,0 +1,160 @@
+"""
+Este módulo define el servicio de idempotencia de los registros (`Idempotency-Key`).
+
+La reserva de la clave, la escritura de la solicitud y la respuesta guardada se
+confirman en una sola transacción: el servicio de registro recibe una sesión ligada a
+esa transacción (sus `commit` y `rollback` actúan sobre un savepoint), de modo que un
+pago nunca queda registrado sin su respuesta guardada ni al revés. Las solicitudes
+repetidas con la misma clave esperan a que termine la primera y responden lo guardado.
+Las versiones de las tablas escritas se incrementan después de confirmar la
+transacción, para que ningún listado asocie el ETag nuevo a las filas anteriores.
+"""
+import hashlib
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import Row
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import config
+from app.core.constants import (
+    ERROR_IDEMPOTENCY_IN_PROGRESS,
+    ERROR_IDEMPOTENCY_KEY_REUSED,
+    ERROR_INTERNAL_SERVER,
+    HEADER_IDEMPOTENT_REPLAYED,
+    STATUS_CONFLICT,
+    STATUS_INTERNAL_SERVER_ERROR,
+    STATUS_UNPROCESSABLE_ENTITY
+)
+from app.core.database import get_async_engine
+from app.db.clave_idempotencia_repository import (
+    SQLSTATE_LOCK_NOT_AVAILABLE, AsyncClaveIdempotenciaRepository
+)
+from app.db.version_tabla_repository import VERSIONES_PENDIENTES, AsyncVersionTablaRepository
+from app.schemas.response_general import ResponseGeneral
+
+Operacion = Callable[[AsyncSession], Awaitable[ResponseGeneral]]
+
+
+def huella_solicitud(solicitud: BaseModel) -> str:
+    """
+    Calcula la huella de una solicitud validada, para detectar una clave reutilizada
+    con otros datos.
+
+    Args:
+        solicitud (BaseModel): Esquema de entrada de la solicitud.
+
+    Returns:
+        str: SHA-256 en hexadecimal del JSON de la solicitud.
+    """
+    return hashlib.sha256(solicitud.model_dump_json().encode()).hexdigest()
+
+
+class AsyncIdempotenciaService:
+    """
+    Ejecuta un registro a lo sumo una vez por clave de idempotencia.
+    """
+    def __init__(self, ruta: str, clave: Optional[str], db: AsyncSession):
+        """
+        Args:
+            ruta (str): Ruta a la que pertenece la clave (nombre de la tabla que se escribe).
+            clave (Optional[str]): Valor del encabezado `Idempotency-Key`, si se envió.
+            db (AsyncSession): Sesión de la solicitud, usada cuando no hay clave.
+        """
+        self.ruta = ruta
+        self.clave = clave
+        self.db = db
+
+    async def ejecutar(
+        self, solicitud: BaseModel, operacion: Operacion
+    ) -> Tuple[ResponseGeneral, Dict[str, str]]:
+        """
+        Ejecuta la operación, o retorna la respuesta guardada si la clave ya se usó.
+
+        Args:
+            solicitud (BaseModel): Esquema de entrada de la solicitud.
+            operacion (Operacion): Registro a ejecutar con la sesión que recibe.
+
+        Returns:
+            Tuple[ResponseGeneral, Dict[str, str]]: La respuesta y los encabezados que se
+            agregan a la respuesta HTTP (`Idempotent-Replayed` si se repitió).
+        """
+        if self.clave is None:
+            return await operacion(self.db), {}
+
+        huella = huella_solicitud(solicitud)
+        pendientes: Set[str] = set()
+        try:
+            async with get_async_engine().connect() as connection:
+                repository = AsyncClaveIdempotenciaRepository(connection)
+                async with connection.begin() as transaccion:
+                    guardada = await repository.reservar(
+                        self.ruta, self.clave, huella,
+                        ttl=config.IDEMPOTENCY_TTL, espera=config.IDEMPOTENCY_WAIT_TIMEOUT
+                    )
+                    if guardada is not None:
+                        return self.repetida(guardada, huella)
+
+                    async with AsyncSession(
+                        bind=connection, join_transaction_mode="create_savepoint",
+                        autoflush=False, expire_on_commit=False,
+                        info={VERSIONES_PENDIENTES: pendientes}
+                    ) as db:
+                        respuesta = await operacion(db)
+                    # Los errores internos no se guardan: se liberan la clave y lo escrito
+                    if respuesta.status >= STATUS_INTERNAL_SERVER_ERROR:
+                        await transaccion.rollback()
+                        return respuesta, {}
+                    await repository.guardar_respuesta(
+                        self.ruta, self.clave, respuesta.model_dump_json()
+                    )
+                # El commit de la sesión solo liberó su savepoint; la escritura se
+                # confirmó recién al salir del bloque anterior
+                async with AsyncSession(bind=connection) as db:
+                    versiones = AsyncVersionTablaRepository(db)
+                    for tabla in sorted(pendientes):
+                        await versiones.bump(tabla)
+            return respuesta, {}
+        except SQLAlchemyError as e:
+            if getattr(getattr(e, "orig", None), "sqlstate", None) == SQLSTATE_LOCK_NOT_AVAILABLE:
+                return self.respuesta(ERROR_IDEMPOTENCY_IN_PROGRESS, STATUS_CONFLICT), {}
+            return self.respuesta(ERROR_INTERNAL_SERVER, STATUS_INTERNAL_SERVER_ERROR), {}
+
+    def repetida(self, guardada: Row, huella: str) -> Tuple[ResponseGeneral, Dict[str, str]]:
+        """
+        Arma la respuesta para una clave que ya tiene una respuesta guardada.
+
+        Args:
+            guardada (Row): Fila guardada de la clave (`huella`, `respuesta`).
+            huella (str): Huella de la solicitud actual.
+
+        Returns:
+            Tuple[ResponseGeneral, Dict[str, str]]: La respuesta guardada y el encabezado
+            de repetición, o un error 422 sin encabezados si la clave se usó con otra
+            solicitud.
+        """
+        if guardada.huella != huella:
+            return (
+                self.respuesta(ERROR_IDEMPOTENCY_KEY_REUSED, STATUS_UNPROCESSABLE_ENTITY), {}
+            )
+        return (
+            ResponseGeneral.model_validate(guardada.respuesta),
+            {HEADER_IDEMPOTENT_REPLAYED: "true"}
+        )
+
+    def respuesta(self, mensaje: str, status: int) -> ResponseGeneral:
+        """
+        Arma una respuesta sin datos.
+
+        Args:
+            mensaje (str): Mensaje de la respuesta.
+            status (int): Código de estado de la respuesta.
+
+        Returns:
+            ResponseGeneral: La respuesta armada.
+        """
+        response = ResponseGeneral()
+        response.mensaje = mensaje
+        response.status = status
+        return response
@@ -0,0 +1,43 @@
+from typing import BinaryIO
+
+from psycopg2 import DataError
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    ERROR_IMPORT_ARRENDATARIOS,
+    MESSAGE_IMPORT_ARRENDATARIOS,
+    STATUS_BAD_REQUEST,
+    STATUS_INTERNAL_SERVER_ERROR,
+    STATUS_SUCCESS
+)
+from app.db.arrendatario_repository import ArrendatarioRepository
+from app.schemas.response_general import ResponseGeneral
+
+
+class ImportArrendatarioService:
+    def __init__(self, db: Session):
+        self.repository = ArrendatarioRepository(db)
+
+    def import_csv(self, archivo: BinaryIO) -> ResponseGeneral:
+        """
+        Importa arrendatarios desde un CSV y arma el reporte de la importación.
+        """
+        response = ResponseGeneral()
+        try:
+            reporte = self.repository.import_csv(archivo)
+        except DataError as e:
+            # El CSV no tiene la forma esperada (columnas faltantes, comillas sin cerrar...)
+            response.mensaje = ERROR_IMPORT_ARRENDATARIOS.format(str(e).strip())
+            response.status = STATUS_BAD_REQUEST
+            return response
+        except Exception as e:
+            response.mensaje = ERROR_IMPORT_ARRENDATARIOS.format(e)
+            response.status = STATUS_INTERNAL_SERVER_ERROR
+            return response
+
+        response.mensaje = MESSAGE_IMPORT_ARRENDATARIOS.format(
+            reporte["insertados"], reporte["actualizados"], reporte["total_rechazados"]
+        )
+        response.status = STATUS_SUCCESS
+        response.data = reporte
+        return response
@@ -0,0 +1,70 @@
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    ERROR_REPORTE_RANGO,
+    MAX_REPORTE_MESES,
+    MESSAGE_REPORTE_PAGOS,
+    STATUS_BAD_REQUEST,
+    STATUS_SUCCESS
+)
+from app.db.reporte_pago_repository import AsyncReportePagoRepository, ReportePagoRepository
+from app.schemas.reporte_schema import AgrupacionReporte
+from app.schemas.response_general import ResponseGeneral
+
+
+def rechazar_rango(desde: date, hasta: date) -> Optional[ResponseGeneral]:
+    """
+    Retorna la respuesta de rechazo si el rango de meses no es válido.
+    """
+    meses = (hasta.year - desde.year) * 12 + hasta.month - desde.month + 1
+    if 1 <= meses <= MAX_REPORTE_MESES:
+        return None
+    return ResponseGeneral(mensaje=ERROR_REPORTE_RANGO, status=STATUS_BAD_REQUEST)
+
+
+def build_reporte(filas: List[Row]) -> ResponseGeneral:
+    """
+    Arma la respuesta del reporte con las filas calculadas en la base de datos.
+    """
+    return ResponseGeneral.model_construct(
+        mensaje=MESSAGE_REPORTE_PAGOS,
+        status=STATUS_SUCCESS,
+        data=[row._asdict() for row in filas]
+    )
+
+
+class ReportePagoService:
+    def __init__(self, db: Session):
+        self.repository = ReportePagoRepository(db)
+
+    def get_reporte(
+        self, agrupacion: AgrupacionReporte, desde: date, hasta: date
+    ) -> ResponseGeneral:
+        """
+        Obtiene el reporte de recaudo de los meses de `desde` a `hasta`.
+        """
+        rechazo = rechazar_rango(desde, hasta)
+        if rechazo:
+            return rechazo
+        return build_reporte(self.repository.get_reporte(agrupacion, desde, hasta))
+
+
+class AsyncReportePagoService:
+    def __init__(self, db: AsyncSession):
+        self.repository = AsyncReportePagoRepository(db)
+
+    async def get_reporte(
+        self, agrupacion: AgrupacionReporte, desde: date, hasta: date
+    ) -> ResponseGeneral:
+        """
+        Obtiene el reporte de recaudo de los meses de `desde` a `hasta`.
+        """
+        rechazo = rechazar_rango(desde, hasta)
+        if rechazo:
+            return rechazo
+        return build_reporte(await self.repository.get_reporte(agrupacion, desde, hasta))
@@ -0,0 +1,108 @@
+"""
+Benchmark de throughput del stack síncrono (`get_db`) frente al asíncrono (`get_async_db`).
+
+Monta una aplicación mínima con el mismo listado de pagos servido por un endpoint
+`def` (sesión psycopg2 en el threadpool) y por uno `async def` (AsyncSession sobre
+asyncpg), y los ejecuta en proceso con httpx a 50, 200 y 1000 clientes concurrentes.
+
+Uso:
+    python -m benchmarks.bench_async_db --requests-per-client 5 --limit 50
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_db, get_db
+from app.services.consulta_pago_service import AsyncConsultaPagoService, ConsultaPagoService
+
+CONCURRENCY_LEVELS = (50, 200, 1000)
+
+
+def build_app(limit: int) -> FastAPI:
+    """
+    Crea la aplicación de benchmark con un endpoint síncrono y uno asíncrono.
+
+    Args:
+        limit (int): Tamaño de la página de pagos consultada por cada solicitud.
+
+    Returns:
+        FastAPI: La aplicación de benchmark.
+    """
+    app = FastAPI()
+
+    @app.get("/sync")
+    def list_sync(db: Session = Depends(get_db)):
+        return ConsultaPagoService(db).get_pagos_page(limit)
+
+    @app.get("/async")
+    async def list_async(db: AsyncSession = Depends(get_async_db)):
+        return await AsyncConsultaPagoService(db).get_pagos_page(limit)
+
+    return app
+
+
+async def run_level(app: FastAPI, path: str, clients: int, requests_per_client: int) -> Dict:
+    """
+    Ejecuta `clients` clientes concurrentes contra `path` y mide latencias.
+
+    Args:
+        app (FastAPI): Aplicación a medir.
+        path (str): Ruta del endpoint.
+        clients (int): Cantidad de clientes concurrentes.
+        requests_per_client (int): Solicitudes secuenciales por cliente.
+
+    Returns:
+        Dict: Throughput, percentiles de latencia y cantidad de errores.
+    """
+    latencies: List[float] = []
+    errors = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal errors
+            for _ in range(requests_per_client):
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "endpoint": path,
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2)
+    }
+
+
+async def main(requests_per_client: int, limit: int) -> List[Dict]:
+    app = build_app(limit)
+    results = []
+    for clients in CONCURRENCY_LEVELS:
+        for path in ("/sync", "/async"):
+            results.append(await run_level(app, path, clients, requests_per_client))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests-per-client", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.requests_per_client, args.limit)), indent=2))
@@ -0,0 +1,135 @@
+"""
+Benchmark de latencia del registro de un pago: ruta de varias consultas frente a una sola sentencia.
+
+La ruta anterior hace un viaje por cada paso (existencia del arrendatario, acumulado
+del mes, INSERT, upsert del saldo, COMMIT y `refresh`); la ruta optimizada hace todo
+con `CREATE_PAGO_CON_SALDO_QUERY` más el COMMIT. Ambas se ejecutan con `AsyncSession`
+sobre el mismo arrendatario, con clientes concurrentes, y se reportan p50/p99.
+
+Los pagos se registran en un código de inmueble propio del benchmark, que se elimina
+al terminar junto con su saldo mensual.
+
+Uso:
+    python -m benchmarks.bench_create_pago --clients 20 --requests-per-client 50
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal, get_async_engine
+from app.db.pago_repository import AsyncPagoRepository
+from app.db.saldo_mensual_repository import AsyncSaldoMensualRepository
+from app.models.pago_model import PagoModel
+
+CODIGO_INMUEBLE = "BENCHCTE"
+FECHA_PAGO = date(2024, 10, 2)
+VALOR_PAGADO = Decimal("1000")
+
+
+async def create_pago_varias_consultas(documento: str):
+    async with AsyncSessionLocal() as db:
+        repository = AsyncPagoRepository(db)
+        if not await repository.exist_arrendatario_by_documento(documento):
+            raise RuntimeError(f"El arrendatario {documento} no existe")
+        await AsyncSaldoMensualRepository(db).get_total_pagado_mes(
+            CODIGO_INMUEBLE, FECHA_PAGO.year, FECHA_PAGO.month)
+        await repository.create_pago(PagoModel(
+            documento_identificacion_arrendatario=documento,
+            codigo_inmueble=CODIGO_INMUEBLE,
+            valor_pagado=VALOR_PAGADO,
+            fecha_pago=FECHA_PAGO
+        ))
+
+
+async def create_pago_una_sentencia(documento: str):
+    async with AsyncSessionLocal() as db:
+        pago_acumulado = await AsyncPagoRepository(db).create_pago_con_saldo({
+            "documento_identificacion_arrendatario": documento,
+            "codigo_inmueble": CODIGO_INMUEBLE,
+            "valor_pagado": VALOR_PAGADO,
+            "fecha_pago": FECHA_PAGO
+        })
+        if pago_acumulado is None:
+            raise RuntimeError(f"El arrendatario {documento} no existe")
+
+
+async def run(name: str, create: Callable, documento: str, clients: int,
+              requests_per_client: int) -> Dict:
+    """
+    Ejecuta `clients` clientes concurrentes que registran pagos y mide latencias.
+
+    Args:
+        name (str): Nombre de la ruta medida.
+        create (Callable): Corrutina que registra un pago.
+        documento (str): Documento del arrendatario que realiza los pagos.
+        clients (int): Cantidad de clientes concurrentes.
+        requests_per_client (int): Pagos secuenciales por cliente.
+
+    Returns:
+        Dict: Throughput y percentiles de latencia.
+    """
+    latencies: List[float] = []
+
+    async def worker():
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            await create(documento)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "ruta": name,
+        "clients": clients,
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2)
+    }
+
+
+async def limpiar():
+    async with get_async_engine().begin() as connection:
+        params = {"codigo": CODIGO_INMUEBLE}
+        await connection.execute(text("DELETE FROM pagos WHERE codigo_inmueble = :codigo"), params)
+        await connection.execute(
+            text("DELETE FROM saldos_mensuales WHERE codigo_inmueble = :codigo"), params)
+
+
+async def main(clients: int, requests_per_client: int) -> List[Dict]:
+    async with AsyncSessionLocal() as db:
+        documento = (await db.execute(text(
+            "SELECT documento_identificacion_arrendatario FROM arrendatarios LIMIT 1"
+        ))).scalar()
+    if documento is None:
+        raise SystemExit("Se necesita al menos un arrendatario registrado")
+
+    results = []
+    try:
+        for name, create in (("varias_consultas", create_pago_varias_consultas),
+                             ("una_sentencia", create_pago_una_sentencia)):
+            # Calentamiento para que ambas rutas midan con conexiones y planes listos
+            await run(name, create, documento, clients, 2)
+            results.append(await run(name, create, documento, clients, requests_per_client))
+    finally:
+        await limpiar()
+        await get_async_engine().dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--requests-per-client", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.clients, args.requests_per_client)), indent=2))
@@ -0,0 +1,289 @@
+"""
+Prueba de carga HTTP reproducible con percentiles de latencia por operación.
+
+Ejecuta clientes concurrentes contra un servidor en marcha (`python -m app.server` o
+`python -m app.main`, con la base de datos de docker-compose o una local) que eligen
+cada solicitud según una mezcla de operaciones con pesos:
+    crear_pago            POST /pagos sobre arrendatarios creados al preparar la prueba
+    crear_arrendatario    POST /arrendatarios con documentos nuevos
+    listar_pagos          GET /pagos?limit=N
+    listar_arrendatarios  GET /arrendatarios?limit=N
+
+Cada cliente usa un generador aleatorio con semilla propia, de modo que dos corridas
+con los mismos parámetros envían la misma secuencia de solicitudes. Las latencias del
+calentamiento se descartan. El resultado (throughput, p50/p95/p99 y códigos de estado,
+en total y por operación) se imprime como JSON y, con `--output`, se guarda para
+compararlo con otra corrida mediante `--compare`.
+
+Los datos creados (arrendatarios con documentos del rango de la semilla y pagos con
+código de inmueble LOADTEST*) se eliminan al terminar, salvo con `--no-cleanup`.
+Los pagos se rechazan por regla de negocio en los días impares (400 en `status`), y
+los errores que los servicios devuelven con HTTP 200 se cuentan en `errores_negocio`.
+
+Uso:
+    python -m benchmarks.bench_load --url http://127.0.0.1:8084/api --concurrency 50 --duration 30
+    python -m benchmarks.bench_load --output antes.json
+    python -m benchmarks.bench_load --output despues.json --compare antes.json
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import text
+
+from app.core.database import get_engine
+
+MEZCLA_POR_DEFECTO = "crear_pago=40,crear_arrendatario=10,listar_pagos=25,listar_arrendatarios=25"
+CODIGO_INMUEBLE = "LOADTEST"
+INMUEBLES = 20
+# Cada semilla usa su propio rango de documentos para no chocar con otras corridas
+DOCUMENTO_BASE = 880000000000
+DOCUMENTOS_POR_SEMILLA = 1000000
+FECHA_INICIAL = date(2024, 1, 1)
+
+
+class Generador:
+    """
+    Arma las solicitudes de cada operación a partir de un generador aleatorio.
+    """
+    def __init__(self, client: httpx.AsyncClient, seed: int, documentos: List[str], limit: int):
+        self.client = client
+        self.documentos = documentos
+        self.limit = limit
+        siguiente = DOCUMENTO_BASE + seed * DOCUMENTOS_POR_SEMILLA + len(documentos)
+        self._nuevos = itertools.count(siguiente)
+        self.creados: List[str] = []
+
+    def crear_pago(self, rnd: random.Random) -> httpx.Request:
+        fecha = FECHA_INICIAL + timedelta(days=rnd.randrange(365))
+        return self.client.build_request("POST", "/pagos", json={
+            "documento_identificacion_arrendatario": rnd.choice(self.documentos),
+            "codigo_inmueble": f"{CODIGO_INMUEBLE}{rnd.randrange(INMUEBLES)}",
+            "valor_pagado": rnd.randint(1000, 500000),
+            "fecha_pago": fecha.strftime("%d/%m/%Y")
+        })
+
+    def crear_arrendatario(self, _: random.Random) -> httpx.Request:
+        documento = str(next(self._nuevos))
+        self.creados.append(documento)
+        return self.client.build_request("POST", "/arrendatarios", json=arrendatario(documento))
+
+    def listar_pagos(self, _: random.Random) -> httpx.Request:
+        return self.client.build_request("GET", "/pagos", params={"limit": self.limit})
+
+    def listar_arrendatarios(self, _: random.Random) -> httpx.Request:
+        return self.client.build_request("GET", "/arrendatarios", params={"limit": self.limit})
+
+
+def arrendatario(documento: str) -> Dict:
+    return {
+        "documento_identificacion_arrendatario": documento,
+        "nombre_completo": "Arrendatario Carga",
+        "email": f"lt{documento}@example.com",
+        "telefono": "3000000000"
+    }
+
+
+def parse_mezcla(mezcla: str) -> Dict[str, int]:
+    """
+    Convierte "operacion=peso,..." en un diccionario de pesos.
+
+    Args:
+        mezcla (str): Mezcla de operaciones con sus pesos.
+
+    Returns:
+        Dict[str, int]: Peso de cada operación.
+
+    Raises:
+        SystemExit: Si alguna operación no existe.
+    """
+    pesos = {}
+    for parte in mezcla.split(","):
+        nombre, peso = parte.split("=")
+        if not hasattr(Generador, nombre.strip()):
+            raise SystemExit(f"Operación desconocida: {nombre}")
+        pesos[nombre.strip()] = int(peso)
+    return pesos
+
+
+def percentil(ordenadas: List[float], p: float) -> float:
+    """
+    Percentil por rango más cercano de una lista ordenada, en milisegundos.
+    """
+    if not ordenadas:
+        return 0.0
+    indice = max(0, min(len(ordenadas) - 1, round(p / 100 * len(ordenadas) + 0.5) - 1))
+    return round(ordenadas[indice] * 1000, 2)
+
+
+def resumir(latencias: List[float], estados: Counter, errores_negocio: int, elapsed: float) -> Dict:
+    latencias = sorted(latencias)
+    return {
+        "requests": len(latencias),
+        "throughput_rps": round(len(latencias) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": percentil(latencias, 50),
+        "p95_ms": percentil(latencias, 95),
+        "p99_ms": percentil(latencias, 99),
+        "max_ms": round(latencias[-1] * 1000, 2) if latencias else 0.0,
+        "status": dict(sorted(estados.items())),
+        "errores_negocio": errores_negocio
+    }
+
+
+async def preparar(client: httpx.AsyncClient, seed: int, cantidad: int) -> List[str]:
+    """
+    Crea los arrendatarios sobre los que se registran los pagos (no se mide).
+    """
+    base = DOCUMENTO_BASE + seed * DOCUMENTOS_POR_SEMILLA
+    documentos = [str(base + i) for i in range(cantidad)]
+    for documento in documentos:
+        response = await client.post("/arrendatarios", json=arrendatario(documento))
+        response.raise_for_status()
+    return documentos
+
+
+async def ejecutar(args) -> Dict:
+    pesos = parse_mezcla(args.mix)
+    operaciones, weights = list(pesos), list(pesos.values())
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    latencias: Dict[str, List[float]] = defaultdict(list)
+    estados: Dict[str, Counter] = defaultdict(Counter)
+    negocio: Counter = Counter()
+
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        documentos = await preparar(client, args.seed, args.arrendatarios)
+        generador = Generador(client, args.seed, documentos, args.limit)
+        try:
+            inicio = time.perf_counter()
+            fin_calentamiento = inicio + args.warmup
+            fin = fin_calentamiento + args.duration
+
+            async def cliente(numero: int):
+                rnd = random.Random(args.seed * 1000 + numero)
+                while time.perf_counter() < fin:
+                    operacion = rnd.choices(operaciones, weights)[0]
+                    request = getattr(generador, operacion)(rnd)
+                    t0 = time.perf_counter()
+                    try:
+                        response = await client.send(request)
+                        estado = str(response.status_code)
+                        # Los servicios responden errores de negocio dentro del cuerpo
+                        cuerpo_con_error = (
+                            request.method == "POST" and response.status_code < 400
+                            and response.json().get("status", 200) >= 400
+                        )
+                    except httpx.HTTPError as e:
+                        estado, cuerpo_con_error = type(e).__name__, False
+                    t1 = time.perf_counter()
+                    if t0 >= fin_calentamiento:
+                        latencias[operacion].append(t1 - t0)
+                        estados[operacion][estado] += 1
+                        negocio[operacion] += int(cuerpo_con_error)
+
+            await asyncio.gather(*(cliente(numero) for numero in range(args.concurrency)))
+            elapsed = time.perf_counter() - fin_calentamiento
+        finally:
+            if args.cleanup:
+                limpiar(generador.documentos + generador.creados)
+
+    return {
+        "inicio": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_actual(),
+        "config": {
+            "url": args.url, "concurrency": args.concurrency, "duration_s": args.duration,
+            "warmup_s": args.warmup, "mix": pesos, "limit": args.limit, "seed": args.seed,
+            "arrendatarios": args.arrendatarios
+        },
+        "total": resumir(
+            list(itertools.chain.from_iterable(latencias.values())),
+            sum(estados.values(), Counter()), sum(negocio.values()), elapsed
+        ),
+        "operaciones": {
+            operacion: resumir(latencias[operacion], estados[operacion], negocio[operacion], elapsed)
+            for operacion in operaciones
+        }
+    }
+
+
+def limpiar(documentos: List[str]):
+    """
+    Elimina los pagos, saldos y arrendatarios creados por la prueba.
+    """
+    with get_engine().begin() as connection:
+        patron = {"patron": f"{CODIGO_INMUEBLE}%"}
+        connection.execute(text("DELETE FROM pagos WHERE codigo_inmueble LIKE :patron"), patron)
+        connection.execute(text("DELETE FROM saldos_mensuales WHERE codigo_inmueble LIKE :patron"), patron)
+        connection.execute(
+            text("DELETE FROM arrendatarios WHERE documento_identificacion_arrendatario = ANY(:documentos)"),
+            {"documentos": documentos}
+        )
+
+
+def commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual: Dict, anterior: Dict) -> Dict:
+    """
+    Variación porcentual del throughput y de los percentiles respecto de otra corrida.
+
+    Args:
+        actual (Dict): Resultado de esta corrida.
+        anterior (Dict): Resultado guardado de la corrida de referencia.
+
+    Returns:
+        Dict: Variación por operación (negativa en latencia o positiva en throughput es mejora).
+    """
+    def variacion(nuevo: float, viejo: float) -> Optional[float]:
+        return round((nuevo - viejo) / viejo * 100, 1) if viejo else None
+
+    secciones = {"total": (actual["total"], anterior["total"])}
+    for operacion, resumen in actual["operaciones"].items():
+        if operacion in anterior["operaciones"]:
+            secciones[operacion] = (resumen, anterior["operaciones"][operacion])
+    return {
+        nombre: {
+            metrica: variacion(nuevo[metrica], viejo[metrica])
+            for metrica in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+        for nombre, (nuevo, viejo) in secciones.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8084/api")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="segundos medidos")
+    parser.add_argument("--warmup", type=float, default=5.0, help="segundos descartados")
+    parser.add_argument("--mix", default=MEZCLA_POR_DEFECTO)
+    parser.add_argument("--limit", type=int, default=50, help="tamaño de página de los listados")
+    parser.add_argument("--arrendatarios", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="archivo donde guardar el resultado")
+    parser.add_argument("--compare", help="resultado de otra corrida para comparar")
+    parser.add_argument("--no-cleanup", dest="cleanup", action="store_false")
+    args = parser.parse_args()
+
+    resultado = asyncio.run(ejecutar(args))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as archivo:
+            resultado["comparacion"] = comparar(resultado, json.load(archivo))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2)
+    print(json.dumps(resultado, indent=2))
@@ -0,0 +1,90 @@
+"""
+Benchmark de serialización de la página de pagos: ruta validada frente a ruta directa.
+
+La ruta validada reproduce lo que hacía el listado: modelos ORM convertidos con
+`PagoSchema.from_model`, la respuesta validada de nuevo por `response_model`
+(como lo hace FastAPI) y serializada con `json`. La ruta directa arma diccionarios
+desde las filas y los serializa con `ORJSONResponse`. Ambas parten de los mismos
+datos ya leídos, de modo que solo se mide el costo en CPU de armar los bytes.
+
+Uso:
+    python -m benchmarks.bench_serializacion --rows 1000 --repeticiones 20
+"""
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.core.responses import ORJSONResponse
+from app.db.pago_repository import pagos_page_query
+from app.models.pago_model import PagoModel
+from app.schemas.pago_schema import PagoSchema
+from app.schemas.response_paginada import ResponsePaginada
+from app.services.consulta_pago_service import build_pagos_page
+
+
+def serializar_validado(modelos: List[PagoModel]) -> bytes:
+    response = ResponsePaginada()
+    response.mensaje = "Pagos consultados correctamente"
+    response.status = 200
+    response.data = [PagoSchema.from_model(item) for item in modelos]
+    # Lo que hace FastAPI con `response_model`: volver a validar y serializar
+    adapter = TypeAdapter(ResponsePaginada)
+    validado = adapter.validate_python(response.model_dump())
+    return JSONResponse(jsonable_encoder(adapter.dump_python(validado, mode="json"))).body
+
+
+def serializar_directo(filas) -> bytes:
+    return ORJSONResponse(dict(build_pagos_page(filas, len(filas)))).body
+
+
+def medir(nombre: str, serializar: Callable[[], bytes], filas: int, repeticiones: int) -> Dict:
+    """
+    Ejecuta una ruta de serialización varias veces y calcula las filas por segundo.
+
+    Args:
+        nombre (str): Nombre de la ruta medida.
+        serializar (Callable[[], bytes]): Función que serializa la página completa.
+        filas (int): Filas de la página.
+        repeticiones (int): Veces que se serializa la página.
+
+    Returns:
+        Dict: Filas por segundo, tiempo por página y tamaño de la respuesta.
+    """
+    body = serializar()
+    start = time.perf_counter()
+    for _ in range(repeticiones):
+        serializar()
+    elapsed = time.perf_counter() - start
+    return {
+        "ruta": nombre,
+        "filas": filas,
+        "repeticiones": repeticiones,
+        "rows_per_s": round(filas * repeticiones / elapsed),
+        "ms_por_pagina": round(elapsed * 1000 / repeticiones, 3),
+        "bytes": len(body)
+    }
+
+
+def main(rows: int, repeticiones: int) -> List[Dict]:
+    with SessionLocal() as db:
+        modelos = list(db.execute(select(PagoModel).order_by(PagoModel.id).limit(rows)).scalars())
+        filas = db.execute(pagos_page_query(rows)).all()
+    return [
+        medir("validado_json", lambda: serializar_validado(modelos), len(modelos), repeticiones),
+        medir("directo_orjson", lambda: serializar_directo(filas), len(filas), repeticiones)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(main(args.rows, args.repeticiones), indent=2))
@@ -0,0 +1,96 @@
+"""
+Benchmark del costo de validación por objeto: tres pasadas frente a una sola.
+
+La ruta de tres pasadas reproduce lo que hacía la escritura: el esquema de entrada
+valida la solicitud, el esquema intermedio se vuelve a validar desde sus datos
+(`PagoSchema.model_validate`) y el modelo ORM se construye con sus `@validates`
+activos. La ruta de una pasada valida solo el esquema de entrada y construye lo demás
+por la ruta confiable (`PagoSchema.from_input_schema`, `from_validated`). No usa la
+base de datos: solo se mide el costo en CPU de validar y construir los objetos.
+
+Uso:
+    python -m benchmarks.bench_validacion --objetos 20000
+"""
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from app.models.arrendatario_model import ArrendatarioModel
+from app.models.pago_model import PagoModel
+from app.schemas.arrendatario_schema import ArrendatarioSchema
+from app.schemas.pago_input_schema import PagoInputSchema
+from app.schemas.pago_schema import PagoSchema
+
+PAGO = {
+    "documento_identificacion_arrendatario": "1234567890",
+    "codigo_inmueble": "APTO101",
+    "valor_pagado": 850000,
+    "fecha_pago": "02/01/2024"
+}
+ARRENDATARIO = {
+    "documento_identificacion_arrendatario": "1234567890",
+    "nombre_completo": "Arrendatario Prueba",
+    "email": "arrendatario@example.com",
+    "telefono": "3000000000"
+}
+
+
+def pago_tres_pasadas() -> PagoModel:
+    entrada = PagoInputSchema.model_validate(PAGO)
+    pago = PagoSchema.model_validate({"id": None, **entrada.model_dump()})
+    return PagoModel(**pago.model_dump(exclude={"id"}))
+
+
+def pago_una_pasada() -> PagoModel:
+    pago = PagoSchema.from_input_schema(PagoInputSchema.model_validate(PAGO))
+    return PagoModel.from_validated(pago.model_dump(exclude={"id"}))
+
+
+def arrendatario_dos_pasadas() -> ArrendatarioModel:
+    return ArrendatarioModel(**ArrendatarioSchema.model_validate(ARRENDATARIO).model_dump())
+
+
+def arrendatario_una_pasada() -> ArrendatarioModel:
+    return ArrendatarioModel.from_validated(ArrendatarioSchema.model_validate(ARRENDATARIO).model_dump())
+
+
+def medir(nombre: str, construir: Callable[[], object], objetos: int) -> Dict:
+    """
+    Construye el mismo objeto varias veces y calcula el costo por objeto.
+
+    Args:
+        nombre (str): Nombre de la ruta medida.
+        construir (Callable[[], object]): Función que valida y construye un objeto.
+        objetos (int): Objetos construidos.
+
+    Returns:
+        Dict: Microsegundos por objeto y objetos por segundo.
+    """
+    construir()
+    start = time.perf_counter()
+    for _ in range(objetos):
+        construir()
+    elapsed = time.perf_counter() - start
+    return {
+        "ruta": nombre,
+        "objetos": objetos,
+        "us_por_objeto": round(elapsed * 1e6 / objetos, 2),
+        "objetos_por_s": round(objetos / elapsed)
+    }
+
+
+def main(objetos: int) -> List[Dict]:
+    return [
+        medir("pago_tres_pasadas", pago_tres_pasadas, objetos),
+        medir("pago_una_pasada", pago_una_pasada, objetos),
+        medir("arrendatario_dos_pasadas", arrendatario_dos_pasadas, objetos),
+        medir("arrendatario_una_pasada", arrendatario_una_pasada, objetos)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--objetos", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(main(args.objetos), indent=2))
@@ -0,0 +1,40 @@
+"""
+Pruebas de las cachés en memoria del proceso.
+"""
+from app.core.cache import ExistenciaCache
+
+
+def test_existencia_cache_descarta_la_entrada_usada_hace_mas_tiempo():
+    cache = ExistenciaCache("prueba", maxsize=2, ttl=60, ttl_negativo=60)
+    cache.set("a", True)
+    cache.set("b", True)
+    assert cache.get("a") is True
+
+    cache.set("c", True)
+
+    assert cache.get("a") is True
+    assert cache.get("b") is None
+    assert cache.get("c") is True
+
+
+def test_existencia_cache_conserva_negativos_leidos_recientemente():
+    cache = ExistenciaCache("prueba", maxsize=2, ttl=60, ttl_negativo=60)
+    cache.set("a", False)
+    cache.set("b", False)
+    assert cache.get("a") is False
+
+    cache.set("c", False)
+
+    assert cache.get("a") is False
+    assert cache.get("b") is None
+
+
+def test_cambio_en_arrendatarios_solo_invalida_negativos():
+    cache = ExistenciaCache("prueba", maxsize=2, ttl=60, ttl_negativo=60)
+    cache.set("a", True)
+    cache.set("b", False)
+
+    cache.invalidate_negativos()
+
+    assert cache.get("a") is True
+    assert cache.get("b") is None
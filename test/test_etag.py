@@ -0,0 +1,57 @@
+"""
+Pruebas del ETag de los listados, derivado de la secuencia de versión de la tabla.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.api.routes.pago_routes import list_all_pagos
+from app.core import database
+from app.core.cache import response_cache
+from app.core.constants import TABLA_PAGOS
+from app.db.version_tabla_repository import AsyncVersionTablaRepository
+
+
+async def _listar(db, if_none_match=None):
+    """
+    Lista la primera página de pagos sin pasar por la caché de respuestas.
+    """
+    response_cache.invalidate(TABLA_PAGOS)
+    return await list_all_pagos(limit=1, after=None, if_none_match=if_none_match, db=db)
+
+
+async def _listar_antes_y_despues_de_escribir():
+    """
+    Retorna las respuestas del listado antes y después de incrementar la versión.
+    """
+    try:
+        async with database.AsyncSessionLocal() as db:
+            versiones = AsyncVersionTablaRepository(db)
+            # Fuera del endpoint, que convierte cualquier error en un 500
+            await versiones.get_version(TABLA_PAGOS)
+            inicial = await _listar(db)
+            etag = inicial.headers["ETag"]
+            sin_cambios = await _listar(db, etag)
+            await versiones.bump(TABLA_PAGOS)
+            await db.commit()
+            con_cambios = await _listar(db, etag)
+            return inicial, sin_cambios, con_cambios
+    finally:
+        response_cache.invalidate(TABLA_PAGOS)
+        await database.dispose_engines()
+        # El motor queda ligado al event loop de la prueba
+        database._async_engine = None  # pylint: disable=protected-access
+
+
+def test_listado_responde_304_hasta_que_la_tabla_cambia():
+    try:
+        inicial, sin_cambios, con_cambios = asyncio.run(_listar_antes_y_despues_de_escribir())
+    except (OperationalError, ProgrammingError, OSError, ValueError) as e:
+        pytest.skip(f"Base de datos o secuencia de versión no disponible: {e}")
+
+    assert inicial.status_code == 200
+    assert sin_cambios.status_code == 304
+    assert sin_cambios.headers["ETag"] == inicial.headers["ETag"]
+    assert con_cambios.status_code == 200
+    assert con_cambios.headers["ETag"] != inicial.headers["ETag"]
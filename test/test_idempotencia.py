@@ -0,0 +1,126 @@
+"""
+Pruebas de las claves de idempotencia.
+
+La operación registrada solo cuenta sus ejecuciones y espera dentro de la transacción,
+de modo que dos solicitudes concurrentes con la misma clave se solapan.
+"""
+import asyncio
+import uuid
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.core import database
+from app.core.constants import HEADER_IDEMPOTENT_REPLAYED, TABLA_PAGOS
+from app.db.version_tabla_repository import AsyncVersionTablaRepository
+from app.schemas.response_general import ResponseGeneral
+from app.services.idempotencia_service import AsyncIdempotenciaService
+
+RUTA = "pruebas"
+
+
+class Solicitud(BaseModel):
+    valor: int
+
+
+class Operacion:
+    """
+    Registro falso que cuenta sus ejecuciones.
+    """
+    def __init__(self, status: int = 200):
+        self.ejecuciones = 0
+        self.status = status
+
+    async def __call__(self, db) -> ResponseGeneral:
+        self.ejecuciones += 1
+        await db.execute(text("SELECT pg_sleep(0.2)"))
+        await db.commit()
+        return ResponseGeneral(mensaje=f"ejecución {self.ejecuciones}", status=self.status)
+
+
+async def _version_pagos() -> int:
+    async with database.AsyncSessionLocal() as db:
+        return await AsyncVersionTablaRepository(db).get_version(TABLA_PAGOS)
+
+
+class OperacionVersionada(Operacion):
+    """
+    Registro falso que escribe en pagos y lee la versión antes de que se confirme.
+    """
+    def __init__(self):
+        super().__init__()
+        self.version_sin_confirmar = None
+
+    async def __call__(self, db) -> ResponseGeneral:
+        await AsyncVersionTablaRepository(db).bump(TABLA_PAGOS)
+        respuesta = await super().__call__(db)
+        self.version_sin_confirmar = await _version_pagos()
+        return respuesta
+
+
+async def _ejecutar(clave: str, *llamadas):
+    try:
+        return await asyncio.gather(*(
+            AsyncIdempotenciaService(RUTA, clave, None).ejecutar(solicitud, operacion)
+            for solicitud, operacion in llamadas
+        ))
+    finally:
+        async with database.get_async_engine().begin() as connection:
+            await connection.execute(text("DELETE FROM claves_idempotencia WHERE ruta = :ruta"), {"ruta": RUTA})
+        await database.dispose_engines()
+        database._async_engine = None  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def clave():
+    try:
+        asyncio.run(_ejecutar("sin-llamadas"))
+    except (OperationalError, ProgrammingError, OSError, ValueError) as e:
+        pytest.skip(f"Base de datos o tabla claves_idempotencia no disponible: {e}")
+    return str(uuid.uuid4())
+
+
+def test_duplicados_concurrentes_ejecutan_una_vez(clave):
+    operacion = Operacion()
+    resultados = asyncio.run(_ejecutar(clave, (Solicitud(valor=1), operacion), (Solicitud(valor=1), operacion)))
+
+    assert operacion.ejecuciones == 1
+    assert resultados[0][0] == resultados[1][0]
+    assert sorted(headers.get(HEADER_IDEMPOTENT_REPLAYED, "") for _, headers in resultados) == ["", "true"]
+
+
+def test_clave_reutilizada_con_otros_datos(clave):
+    operacion = Operacion()
+    (primera, _), (segunda, _) = asyncio.run(
+        _ejecutar(clave, (Solicitud(valor=1), operacion), (Solicitud(valor=2), operacion))
+    )
+
+    assert operacion.ejecuciones == 1
+    assert {primera.status, segunda.status} == {200, 422}
+
+
+def test_errores_internos_no_se_guardan(clave):
+    operacion = Operacion(status=500)
+    asyncio.run(_ejecutar(clave, (Solicitud(valor=1), operacion), (Solicitud(valor=1), operacion)))
+
+    assert operacion.ejecuciones == 2
+
+
+async def _versiones_alrededor(clave: str, operacion: Operacion):
+    antes = await _version_pagos()
+    await _ejecutar(clave, (Solicitud(valor=1), operacion))
+    try:
+        return antes, await _version_pagos()
+    finally:
+        await database.dispose_engines()
+        database._async_engine = None  # pylint: disable=protected-access
+
+
+def test_version_se_incrementa_al_confirmar_la_transaccion(clave):
+    operacion = OperacionVersionada()
+    antes, despues = asyncio.run(_versiones_alrededor(clave, operacion))
+
+    assert operacion.version_sin_confirmar == antes
+    assert despues == antes + 1
@@ -0,0 +1,74 @@
+"""
+Pruebas del tiempo de importación de la aplicación y de los comandos.
+
+Cada módulo se importa en un proceso nuevo con `python -X importtime` y sin
+`SQLALCHEMY_DATABASE_URL`: importar no debe requerir la base de datos, crear motores
+ni cargar los drivers. El presupuesto en milisegundos se puede ajustar con las
+variables `IMPORT_BUDGET_APP_MS` e `IMPORT_BUDGET_CLI_MS` en máquinas más lentas.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+IMPORT_BUDGET_APP_MS = float(os.environ.get("IMPORT_BUDGET_APP_MS", 2000))
+IMPORT_BUDGET_CLI_MS = float(os.environ.get("IMPORT_BUDGET_CLI_MS", 1000))
+
+VERIFICAR_SIN_MOTORES = """
+import sys
+import app.core.database as database
+assert database._engine is None and database._async_engine is None, "motor creado al importar"
+# El receptor de cambios importa psycopg2 (liviano); asyncpg solo lo carga el motor
+cargados = sorted({"asyncpg", "uvicorn"} & set(sys.modules))
+assert not cargados, f"módulos cargados al importar: {cargados}"
+"""
+
+
+def _entorno_sin_dsn() -> dict:
+    env = {k: v for k, v in os.environ.items() if k != "SQLALCHEMY_DATABASE_URL"}
+    env["PYTHONPATH"] = str(RAIZ)
+    return env
+
+
+def tiempo_importacion_ms(modulo: str) -> float:
+    """
+    Importa un módulo en un proceso nuevo y retorna su tiempo acumulado de importación.
+
+    Args:
+        modulo (str): Nombre del módulo a importar.
+
+    Returns:
+        float: Milisegundos que tomó importar el módulo con sus dependencias.
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, env=_entorno_sin_dsn(), capture_output=True, text=True, check=True
+    )
+    # Formato de cada línea: "import time: self [us] | cumulative | imported package"
+    for linea in reversed(resultado.stderr.splitlines()):
+        partes = [parte.strip() for parte in linea.split("|")]
+        if len(partes) == 3 and partes[2] == modulo:
+            return int(partes[1]) / 1000
+    raise AssertionError(f"{modulo} no aparece en la salida de -X importtime")
+
+
+@pytest.mark.parametrize("modulo, presupuesto_ms", [
+    ("app.main", IMPORT_BUDGET_APP_MS),
+    ("app.cli.rebuild_saldos_mensuales", IMPORT_BUDGET_CLI_MS),
+    ("app.cli.import_arrendatarios", IMPORT_BUDGET_CLI_MS),
+])
+def test_import_time_budget(modulo, presupuesto_ms):
+    # Se toma el mejor de tres para no fallar por ruido de la máquina
+    mejor = min(tiempo_importacion_ms(modulo) for _ in range(3))
+    assert mejor <= presupuesto_ms, f"{modulo}: {mejor:.0f} ms > {presupuesto_ms:.0f} ms"
+
+
+def test_import_does_not_create_engines():
+    subprocess.run(
+        [sys.executable, "-c", "import app.main\n" + VERIFICAR_SIN_MOTORES],
+        cwd=RAIZ, env=_entorno_sin_dsn(), capture_output=True, text=True, check=True
+    )
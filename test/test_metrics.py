@@ -0,0 +1,32 @@
+"""
+Pruebas del formato de las métricas de Prometheus.
+"""
+from app.core.metrics import Histogram, etiquetar_consulta, render_muestras
+
+
+def test_histogram_render_acumula_buckets():
+    histograma = Histogram("prueba_seconds", "Ayuda.", ("route",), (0.1, 1.0))
+    histograma.observe(0.05, ("/a",))
+    histograma.observe(0.5, ("/a",))
+    histograma.observe(3.0, ("/a",))
+
+    lineas = histograma.render()
+
+    assert lineas[:2] == ["# HELP prueba_seconds Ayuda.", "# TYPE prueba_seconds histogram"]
+    assert 'prueba_seconds_bucket{route="/a",le="0.1"} 1' in lineas
+    assert 'prueba_seconds_bucket{route="/a",le="1.0"} 2' in lineas
+    assert 'prueba_seconds_bucket{route="/a",le="+Inf"} 3' in lineas
+    assert 'prueba_seconds_sum{route="/a"} 3.55' in lineas
+    assert 'prueba_seconds_count{route="/a"} 3' in lineas
+
+
+def test_render_muestras_escapa_etiquetas():
+    lineas = render_muestras("g", "Ayuda.", "gauge", [({"cache": 'a"b'}, 2), ({}, 1)])
+    assert lineas[2:] == ['g{cache="a\\"b"} 2', "g 1"]
+
+
+def test_etiquetar_consulta():
+    assert etiquetar_consulta("SELECT 1 FROM arrendatarios WHERE x = 1") == ("SELECT", "arrendatarios")
+    assert etiquetar_consulta("INSERT INTO pagos (a) VALUES (1)") == ("INSERT", "pagos")
+    assert etiquetar_consulta("\n    UPDATE saldos_mensuales SET total_pagado = 1") == ("UPDATE", "saldos_mensuales")
+    assert etiquetar_consulta("SELECT 1") == ("SELECT", "")
@@ -0,0 +1,162 @@
+"""
+Pruebas de regresión de planes de consulta de los repositorios.
+
+Siembra datos dentro de una transacción que se revierte al final, ejecuta cada
+consulta de los repositorios capturando el SQL real que emiten, y corre
+`EXPLAIN (FORMAT JSON)` sobre cada sentencia. La prueba falla si algún plan
+recorre secuencialmente una tabla con más filas que el umbral permitido.
+"""
+import json
+import os
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.cache import EXISTENCIA_CACHES
+from app.db.arrendatario_repository import ArrendatarioRepository
+from app.db.pago_repository import PagoRepository
+from app.db.saldo_mensual_repository import SaldoMensualRepository
+from app.db.version_tabla_repository import VersionTablaRepository
+
+# Definida en el entorno o por conftest.py
+DATABASE_URL = os.environ["SQLALCHEMY_DATABASE_URL"]
+
+SEQ_SCAN_ROW_THRESHOLD = 1000
+SEED_ARRENDATARIOS = 5000
+SEED_PAGOS = 100000
+SEED_INMUEBLES = 500
+DOCUMENTO_BASE = 7000000000
+
+REPOSITORY_QUERIES = {
+    "pago.exist_arrendatario_by_documento": lambda db: PagoRepository(db)
+        .exist_arrendatario_by_documento(str(DOCUMENTO_BASE + 1)),
+    "pago.get_all_by_codigo_email_and_month_pay": lambda db: PagoRepository(db)
+        .get_all_by_codigo_email_and_month_pay("EXPLAIN1"),
+    "pago.create_pago_con_saldo": lambda db: PagoRepository(db).create_pago_con_saldo({
+        "documento_identificacion_arrendatario": str(DOCUMENTO_BASE + 1),
+        "codigo_inmueble": "EXPLAIN1",
+        "valor_pagado": Decimal("1000"),
+        "fecha_pago": date(2024, 10, 2)
+    }),
+    "pago.get_pago_by_id": lambda db: PagoRepository(db).get_pago_by_id(1),
+    "pago.get_pagos_page": lambda db: PagoRepository(db).get_pagos_page(101),
+    "pago.get_pagos_page_after": lambda db: PagoRepository(db).get_pagos_page(101, 5000),
+    "pago.get_pagos_page_arrendatario": lambda db: PagoRepository(db)
+        .get_pagos_page(101, None, str(DOCUMENTO_BASE + 1)),
+    "arrendatario.get_arrendatario_con_pagos": lambda db: ArrendatarioRepository(db)
+        .get_arrendatario_con_pagos(str(DOCUMENTO_BASE + 1)),
+    "arrendatario.get_arrendatarios_page": lambda db: ArrendatarioRepository(db)
+        .get_arrendatarios_page(101, str(DOCUMENTO_BASE + 10)),
+    "arrendatario.exist_arrendatario_by_email": lambda db: ArrendatarioRepository(db)
+        .exist_arrendatario_by_email("explain10@example.com"),
+    "saldo.get_total_pagado_mes": lambda db: SaldoMensualRepository(db)
+        .get_total_pagado_mes("EXPLAIN1", 2024, 10),
+    "saldo.registrar_pago": lambda db: SaldoMensualRepository(db)
+        .registrar_pago("EXPLAIN1", date(2024, 10, 2), Decimal("1000")),
+    "version.get_version": lambda db: VersionTablaRepository(db).get_version("pagos"),
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_connection():
+    """
+    Abre una conexión con datos sembrados y estadísticas actualizadas.
+
+    Todo se hace dentro de una transacción que se revierte al terminar el módulo.
+    """
+    engine = create_engine(DATABASE_URL)
+    try:
+        connection = engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"Base de datos no disponible: {e}")
+    transaction = connection.begin()
+    connection.execute(text("""
+        INSERT INTO arrendatarios
+        SELECT (:base + g)::text, 'Arrendatario Prueba', 'explain' || g || '@example.com', '3000000000'
+        FROM generate_series(1, :arrendatarios) g
+    """), {"base": DOCUMENTO_BASE, "arrendatarios": SEED_ARRENDATARIOS})
+    connection.execute(text("""
+        INSERT INTO pagos (documento_identificacion_arrendatario, codigo_inmueble, valor_pagado, fecha_pago)
+        SELECT (:base + 1 + g % :arrendatarios)::text, 'EXPLAIN' || (g % :inmuebles),
+               1000, date '2023-01-01' + (g % 700)
+        FROM generate_series(1, :pagos) g
+    """), {
+        "base": DOCUMENTO_BASE, "arrendatarios": SEED_ARRENDATARIOS,
+        "inmuebles": SEED_INMUEBLES, "pagos": SEED_PAGOS
+    })
+    connection.execute(text("""
+        INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+        SELECT codigo_inmueble, EXTRACT(YEAR FROM fecha_pago)::int,
+               EXTRACT(MONTH FROM fecha_pago)::int, SUM(valor_pagado), COUNT(*)
+        FROM pagos WHERE codigo_inmueble LIKE 'EXPLAIN%'
+        GROUP BY 1, 2, 3
+        ON CONFLICT DO NOTHING
+    """))
+    connection.execute(text("ANALYZE arrendatarios, pagos, saldos_mensuales"))
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def capture_statements(connection, query):
+    """
+    Ejecuta una consulta de repositorio y captura las sentencias SQL que emite.
+    """
+    statements = []
+    # Sin caché, para que cada consulta del repositorio llegue a la base de datos
+    for cache in EXISTENCIA_CACHES:
+        cache.invalidate()
+
+    def before_cursor_execute(_conn, _cursor, statement, parameters, _context, executemany):
+        if not executemany and not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE")):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        query(db)
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+        db.close()
+    return statements
+
+
+def large_seq_scans(connection, node):
+    """
+    Retorna los recorridos secuenciales del plan sobre tablas mayores al umbral.
+    """
+    encontrados = []
+    if node.get("Node Type") == "Seq Scan":
+        filas = connection.execute(
+            text("SELECT reltuples FROM pg_class WHERE relname = :tabla"),
+            {"tabla": node["Relation Name"]}
+        ).scalar()
+        if filas is not None and filas > SEQ_SCAN_ROW_THRESHOLD:
+            encontrados.append((node["Relation Name"], int(filas)))
+    for hijo in node.get("Plans", []):
+        encontrados.extend(large_seq_scans(connection, hijo))
+    return encontrados
+
+
+@pytest.mark.parametrize("query_name", sorted(REPOSITORY_QUERIES))
+def test_repository_query_avoids_large_seq_scan(seeded_connection, query_name):
+    statements = capture_statements(seeded_connection, REPOSITORY_QUERIES[query_name])
+    assert statements, f"{query_name} no emitió ninguna sentencia"
+
+    for statement, parameters in statements:
+        plan = seeded_connection.exec_driver_sql(
+            "EXPLAIN (FORMAT JSON) " + statement, parameters
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        seq_scans = large_seq_scans(seeded_connection, plan[0]["Plan"])
+        assert not seq_scans, (
+            f"{query_name} recorre secuencialmente {seq_scans}:\n{statement}"
+        )
@@ -0,0 +1,117 @@
+"""
+Pruebas de los reportes de recaudo.
+
+Las pruebas con base de datos siembran un mes sin otros pagos dentro de una
+transacción que se revierte al final.
+"""
+import os
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.constants import MAX_REPORTE_MESES, STATUS_BAD_REQUEST, VALOR_ARRIENDO
+from app.db.reporte_pago_repository import ReportePagoRepository, parametros_reporte
+from app.schemas.reporte_schema import AgrupacionReporte
+from app.services.reporte_pago_service import rechazar_rango
+
+MES_SEMBRADO = date(1990, 3, 1)
+# (documento, inmueble, valor): REPORTE1 queda con saldo pendiente, REPORTE2 pagado
+PAGOS_SEMBRADOS = [
+    ("9100000001", "REPORTE1", Decimal("400000")),
+    ("9100000002", "REPORTE1", Decimal("300000")),
+    ("9100000001", "REPORTE2", Decimal("1200000")),
+]
+SALDO_REPORTE1 = VALOR_ARRIENDO - Decimal("700000")
+
+
+def test_parametros_reporte_toma_meses_completos():
+    parametros = parametros_reporte(date(2024, 11, 15), date(2024, 12, 3))
+
+    assert parametros["desde"] == date(2024, 11, 1)
+    assert parametros["hasta"] == date(2025, 1, 1)
+    assert (parametros["anioDesde"], parametros["mesDesde"]) == (2024, 11)
+    assert (parametros["anioHasta"], parametros["mesHasta"]) == (2024, 12)
+
+
+def test_rechazar_rango():
+    assert rechazar_rango(date(2024, 10, 31), date(2024, 10, 1)) is None
+    fuera_de_rango = date(2024 + MAX_REPORTE_MESES // 12, 1, 1)
+    assert rechazar_rango(date(2024, 1, 1), fuera_de_rango).status == STATUS_BAD_REQUEST
+    assert rechazar_rango(date(2024, 5, 1), date(2024, 4, 30)).status == STATUS_BAD_REQUEST
+
+
+@pytest.fixture(scope="module")
+def reporte_db():
+    """
+    Abre una sesión con un mes de pagos y saldos sembrados, revertidos al terminar.
+    """
+    engine = create_engine(os.environ["SQLALCHEMY_DATABASE_URL"])
+    try:
+        connection = engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"Base de datos no disponible: {e}")
+    transaction = connection.begin()
+    for documento in sorted({documento for documento, _, _ in PAGOS_SEMBRADOS}):
+        connection.execute(text("""
+            INSERT INTO arrendatarios
+            VALUES (:documento, 'Arrendatario Reporte', 'reporte' || :documento || '@example.com',
+                    '3000000000')
+        """), {"documento": documento})
+    for documento, inmueble, valor in PAGOS_SEMBRADOS:
+        connection.execute(text("""
+            INSERT INTO pagos (documento_identificacion_arrendatario, codigo_inmueble,
+                               valor_pagado, fecha_pago)
+            VALUES (:documento, :inmueble, :valor, :fecha)
+        """), {"documento": documento, "inmueble": inmueble, "valor": valor, "fecha": MES_SEMBRADO})
+    connection.execute(text("""
+        INSERT INTO saldos_mensuales (codigo_inmueble, anio, mes, total_pagado, cantidad_pagos)
+        SELECT codigo_inmueble, :anio, :mes, SUM(valor_pagado), COUNT(*)
+        FROM pagos WHERE codigo_inmueble LIKE 'REPORTE%' AND fecha_pago = :fecha
+        GROUP BY codigo_inmueble
+    """), {"anio": MES_SEMBRADO.year, "mes": MES_SEMBRADO.month, "fecha": MES_SEMBRADO})
+    db = Session(bind=connection)
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def _reporte(db, agrupacion):
+    return [
+        row._asdict()
+        for row in ReportePagoRepository(db).get_reporte(agrupacion, MES_SEMBRADO, MES_SEMBRADO)
+    ]
+
+
+def test_reporte_por_inmueble(reporte_db):
+    assert _reporte(reporte_db, AgrupacionReporte.INMUEBLE) == [
+        {"codigo_inmueble": "REPORTE1", "mes": MES_SEMBRADO, "total_pagado": Decimal("700000.00"),
+         "cantidad_pagos": 2, "saldo_pendiente": SALDO_REPORTE1},
+        {"codigo_inmueble": "REPORTE2", "mes": MES_SEMBRADO, "total_pagado": Decimal("1200000.00"),
+         "cantidad_pagos": 1, "saldo_pendiente": Decimal("0")},
+    ]
+
+
+def test_reporte_por_arrendatario_suma_los_saldos_de_sus_inmuebles(reporte_db):
+    assert _reporte(reporte_db, AgrupacionReporte.ARRENDATARIO) == [
+        {"documento_identificacion_arrendatario": "9100000001", "mes": MES_SEMBRADO,
+         "total_pagado": Decimal("1600000.00"), "cantidad_pagos": 2, "inmuebles": 2,
+         "saldo_pendiente": SALDO_REPORTE1},
+        {"documento_identificacion_arrendatario": "9100000002", "mes": MES_SEMBRADO,
+         "total_pagado": Decimal("300000.00"), "cantidad_pagos": 1, "inmuebles": 1,
+         "saldo_pendiente": SALDO_REPORTE1},
+    ]
+
+
+def test_reporte_por_mes(reporte_db):
+    assert _reporte(reporte_db, AgrupacionReporte.MES) == [
+        {"mes": MES_SEMBRADO, "total_pagado": Decimal("1900000.00"), "cantidad_pagos": 3,
+         "inmuebles": 2, "saldo_pendiente": SALDO_REPORTE1},
+    ]